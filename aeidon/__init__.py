@@ -90,6 +90,7 @@ from aeidon import temp
 from aeidon.delegate import *
 from aeidon.singleton import *
 from aeidon.mutables import *
+from aeidon.indexset import *
 from aeidon.observable import *
 from aeidon.errors import *
 from aeidon.enum import *
@@ -106,15 +107,20 @@ from aeidon.parser import *
 from aeidon.liner import *
 from aeidon import containers
 from aeidon.subtitle import *
+from aeidon.store import *
 from aeidon.file import *
 from aeidon import files
+from aeidon.cache import *
 from aeidon.markup import *
 from aeidon import markups
 from aeidon.markupconv import *
+from aeidon import stream
 from aeidon.pattern import *
 from aeidon.patternman import *
 from aeidon.clipboard import *
 from aeidon.revertable import *
+from aeidon.batch import *
+from aeidon import session
 from aeidon import agents
 from aeidon.project import *
 from aeidon.unittest import *
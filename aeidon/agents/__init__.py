@@ -26,6 +26,7 @@ from .preview   import PreviewAgent
 from .register  import RegisterAgent
 from .save      import SaveAgent
 from .search    import SearchAgent
+from .session   import SessionAgent
 from .set       import SetAgent
 from .text      import TextAgent
 from .util      import UtilityAgent
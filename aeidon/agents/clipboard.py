@@ -50,13 +50,17 @@ class ClipboardAgent(aeidon.Delegate):
         texts = self.clipboard.get_texts()
         length = len(self.subtitles)
         new_count = len(texts) - (length - index)
-        if new_count > 0:
-            indices = list(range(length, length + new_count))
-            self.insert_subtitles(indices, register=register)
-        indices = [index+i for i in range(len(texts)) if texts[i] is not None]
-        new_texts = [x for x in texts if x is not None]
-        self.replace_texts(indices, doc, new_texts, register=register)
-        if new_count > 0:
-            self.group_actions(register, 2, "")
+        # Emit signals once to avoid updating
+        # inserted subtitles as changed after.
+        with self.batch():
+            if new_count > 0:
+                indices = list(range(length, length + new_count))
+                self.insert_subtitles(indices, register=register)
+            indices = [index+i for i in range(len(texts))
+                       if texts[i] is not None]
+            new_texts = [x for x in texts if x is not None]
+            self.replace_texts(indices, doc, new_texts, register=register)
+            if new_count > 0:
+                self.group_actions(register, 2, "")
         self.set_action_description(register, _("Pasting texts"))
         return tuple(indices)
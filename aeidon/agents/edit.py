@@ -18,13 +18,21 @@
 """Basic editing of entire subtitles."""
 
 import aeidon
+import array
 
 from aeidon.i18n import _
 
 
 class EditAgent(aeidon.Delegate):
 
-    """Basic editing of entire subtitles."""
+    """
+    Basic editing of entire subtitles.
+
+    Actions replacing positions or texts keep only the data needed to revert
+    them, i.e. indices as ranges or packed arrays, original positions as
+    packed arrays of internal units and original texts of only the subtitles
+    whose texts were changed.
+    """
 
     @aeidon.deco.export
     @aeidon.deco.revertable
@@ -34,6 +42,18 @@ class EditAgent(aeidon.Delegate):
         self.replace_texts(indices, doc, new_texts, register=register)
         self.set_action_description(register, _("Clearing texts"))
 
+    def _get_positions_reversion(self, indices):
+        """Return arguments for :meth:`set_positions` to revert `indices`."""
+        subtitles = [self.subtitles[i] for i in indices]
+        modes = set(x._mode for x in subtitles)
+        # Keep the mode of units to allow reverting correctly even
+        # if the mode of subtitles is changed, e.g. when saving.
+        mode = modes.pop() if len(modes) == 1 else None
+        return (aeidon.util.pack_indices(indices),
+                array.array("q", [x._start for x in subtitles]),
+                array.array("q", [x._end for x in subtitles]),
+                mode)
+
     @aeidon.deco.revertable
     @aeidon.deco.notify_frozen
     def _insert_blank_subtitles(self, indices, register=-1):
@@ -122,15 +142,24 @@ class EditAgent(aeidon.Delegate):
     @aeidon.deco.notify_frozen
     def replace_positions(self, indices, subtitles, register=-1):
         """Replace positions at `indices` with those from `subtitles`."""
-        orig_subtitles = [self.subtitles[i].copy() for i in indices]
+        revert_args = None
+        if register is not None:
+            # Original positions are needed only if reverting is possible.
+            revert_args = self._get_positions_reversion(indices)
         for i, index in enumerate(indices):
-            self.subtitles[index].start = subtitles[i].start
-            self.subtitles[index].end = subtitles[i].end
+            subtitle = self.subtitles[index]
+            if subtitle.mode == subtitles[i].mode:
+                # Avoid needless conversions if units match.
+                subtitle._start = subtitles[i]._start
+                subtitle._end = subtitles[i]._end
+                continue
+            subtitle.start = subtitles[i].start
+            subtitle.end = subtitles[i].end
         action = aeidon.RevertableAction(register=register)
         action.docs = tuple(aeidon.documents)
         action.description = _("Replacing positions")
-        action.revert_function = self.replace_positions
-        action.revert_args = (indices, orig_subtitles)
+        action.revert_function = self.set_positions
+        action.revert_args = revert_args
         self.register_action(action)
         self.emit("positions-changed", indices)
 
@@ -139,17 +168,62 @@ class EditAgent(aeidon.Delegate):
     @aeidon.deco.notify_frozen
     def replace_texts(self, indices, doc, texts, register=-1):
         """Replace texts in `doc`'s `indices` with `texts`."""
-        orig_texts = [self.subtitles[i].get_text(doc) for i in indices]
+        orig_indices = []
+        orig_texts = []
         for i, index in enumerate(indices):
-            self.subtitles[index].set_text(doc, texts[i])
+            subtitle = self.subtitles[index]
+            text = subtitle.get_text(doc)
+            if text == texts[i]: continue
+            orig_indices.append(index)
+            orig_texts.append(text)
+            subtitle.set_text(doc, texts[i])
         action = aeidon.RevertableAction(register=register)
         action.docs = (doc,)
         action.description = _("Replacing texts")
         action.revert_function = self.replace_texts
-        action.revert_args = (indices, doc, orig_texts)
+        action.revert_args = (aeidon.util.pack_indices(orig_indices),
+                              doc,
+                              orig_texts)
+
         self.register_action(action)
         self.emit(self.get_text_signal(doc), indices)
 
+    @aeidon.deco.export
+    @aeidon.deco.revertable
+    @aeidon.deco.notify_frozen
+    def set_positions(self, indices, starts, ends, mode=None, register=-1):
+        """
+        Set positions at `indices` to `starts` and `ends`.
+
+        `starts` and `ends` should be sequences of positions in internal units
+        of `mode`, i.e. integer milliseconds for :attr:`aeidon.modes.TIME` and
+        integer frames for :attr:`aeidon.modes.FRAME`. `mode` can be ``None``
+        if positions are in internal units of each subtitle's mode.
+        """
+        revert_args = None
+        if register is not None:
+            # Original positions are needed only if reverting is possible.
+            revert_args = self._get_positions_reversion(indices)
+        for index, start, end in zip(indices, starts, ends):
+            subtitle = self.subtitles[index]
+            if mode is None or subtitle.mode == mode:
+                subtitle._start = start
+                subtitle._end = end
+                continue
+            # Convert units via a subtitle in mode.
+            source = aeidon.Subtitle(mode, subtitle.framerate)
+            source._start = start
+            source._end = end
+            subtitle.start = source.start
+            subtitle.end = source.end
+        action = aeidon.RevertableAction(register=register)
+        action.docs = tuple(aeidon.documents)
+        action.description = _("Replacing positions")
+        action.revert_function = self.set_positions
+        action.revert_args = revert_args
+        self.register_action(action)
+        self.emit("positions-changed", indices)
+
     @aeidon.deco.export
     @aeidon.deco.revertable
     def split_subtitle(self, index, register=-1):
@@ -19,6 +19,7 @@
 
 import aeidon
 import bisect
+import io
 
 
 class OpenAgent(aeidon.Delegate):
@@ -63,14 +64,30 @@ class OpenAgent(aeidon.Delegate):
             subtitles.pop(0)
             i += 1
 
+    def _load_file(self, path, encoding, lazy=None):
+        """Return file and subtitles read from `path`, cached if possible."""
+        if self.cache is not None:
+            cached = self.cache.get(path, encoding)
+            if cached is not None: return cached
+        file = aeidon.files.load(path, encoding)
+        if (lazy is not None and
+            isinstance(file, aeidon.files.SubStationAlpha)):
+            file.lazy = lazy
+        subtitles = self._read_file(file)
+        if self.cache is not None:
+            self.cache.put(path, encoding, file, subtitles)
+        return file, subtitles
+
     @aeidon.deco.export
     def open(self, doc, path, encoding=None, align_method=None):
         """
         Read and parse subtitle data for `doc` from `path`.
 
         `encoding` can be ``None`` to use the system default encoding.
+        `encoding` can also be a sequence of encodings to try in order.
         Return the amount of subtitles that needed to be moved in order
-        to arrange them in ascending chronological order.
+        to arrange them in ascending chronological order. If :attr:`cache`
+        is set, the file is opened from the cache if possible.
 
         Raise :exc:`IOError` if reading fails.
         Raise :exc:`UnicodeError` if decoding fails.
@@ -85,11 +102,49 @@ class OpenAgent(aeidon.Delegate):
 
     @aeidon.deco.export
     @aeidon.deco.notify_frozen
-    def open_main(self, path, encoding=None):
+    def open_main(self, path, encoding=None, lazy=None):
         """
         Read and parse subtitle data for main file from `path`.
 
         `encoding` can be ``None`` to use the system default encoding.
+        `encoding` can also be a sequence of encodings to try in order.
+        `lazy` can be ``True`` or ``False`` to decode format-specific fields
+        of Sub Station Alpha files on first access or when reading, or
+        ``None`` to use :attr:`aeidon.files.SubStationAlpha.lazy`. Return the
+        amount of subtitles that needed to be moved in order to arrange them
+        in ascending chronological order. If :attr:`cache` is set, the file
+        is opened from the cache if possible.
+
+        Raise :exc:`IOError` if reading fails.
+        Raise :exc:`UnicodeError` if decoding fails.
+        Raise :exc:`aeidon.FormatError` if unable to detect format.
+        Raise :exc:`aeidon.ParseError` if parsing fails.
+        """
+        encoding = encoding or aeidon.util.get_default_encoding()
+        file, subtitles = self._load_file(path, encoding, lazy)
+        return self._open_main_file(file, subtitles)
+
+    @aeidon.deco.export
+    def open_main_from_bytes(self, data, encoding=None):
+        """
+        Read and parse subtitle data for main file from bytes `data`.
+
+        See :meth:`open_main_from_stream` for details.
+        """
+        return self.open_main_from_stream(io.BytesIO(data), encoding)
+
+    @aeidon.deco.export
+    @aeidon.deco.notify_frozen
+    def open_main_from_stream(self, f, encoding=None):
+        """
+        Read and parse subtitle data for main file from file object `f`.
+
+        `f` can be a binary file object, which is decoded using `encoding`,
+        or a text file object, in which case `encoding` is used only when
+        saving. `encoding` can be ``None`` to use the system default encoding.
+        BOM, format and newlines are detected the same way as when opening
+        a file on disk. :attr:`main_file` will have no path, use
+        :meth:`save_to_stream` or give a file to :meth:`save_main` to save.
         Return the amount of subtitles that needed to be moved in order
         to arrange them in ascending chronological order.
 
@@ -99,12 +154,12 @@ class OpenAgent(aeidon.Delegate):
         Raise :exc:`aeidon.ParseError` if parsing fails.
         """
         encoding = encoding or aeidon.util.get_default_encoding()
-        bom_encoding = aeidon.encodings.detect_bom(path)
-        if not bom_encoding in (encoding, None):
-            return self.open_main(path, bom_encoding)
-        format = aeidon.util.detect_format(path, encoding)
-        self.main_file = aeidon.files.new(format, path, encoding)
-        subtitles = self._read_file(self.main_file)
+        file = aeidon.files.load_from_stream(f, encoding)
+        return self._open_main_file(file, self._read_file(file))
+
+    def _open_main_file(self, file, subtitles):
+        """Set `file` and `subtitles` as main and return sort count."""
+        self.main_file = file
         self.subtitles, sort_count = self._sort_subtitles(subtitles)
         self.set_framerate(self.framerate, register=None)
         self.main_changed = 0
@@ -121,6 +176,7 @@ class OpenAgent(aeidon.Delegate):
         Read and parse subtitle data for translation file from `path`.
 
         `encoding` can be ``None`` to use the system default encoding.
+        `encoding` can also be a sequence of encodings to try in order.
         `align_method` specifies how translation texts are attached to existing
         subtitles. :attr:`aeidon.align_methods.NUMBER` is the simple way, which
         adds the translation texts in order, one-by-one to the exising
@@ -132,6 +188,43 @@ class OpenAgent(aeidon.Delegate):
         and that one main subtitle may correspond to two translation subtitles,
         or vice versa, as per length restrictions etc.
 
+        Return the amount of subtitles that needed to be moved in order
+        to arrange them in ascending chronological order. If :attr:`cache`
+        is set, the file is opened from the cache if possible.
+
+        Raise :exc:`IOError` if reading fails.
+        Raise :exc:`UnicodeError` if decoding fails.
+        Raise :exc:`aeidon.FormatError` if unable to detect format.
+        Raise :exc:`aeidon.ParseError` if parsing fails.
+        """
+        encoding = encoding or aeidon.util.get_default_encoding()
+        align_method = align_method or aeidon.align_methods.POSITION
+        file, subtitles = self._load_file(path, encoding)
+        return self._open_translation_file(file, subtitles, align_method)
+
+    @aeidon.deco.export
+    def open_translation_from_bytes(self, data, encoding=None,
+                                    align_method=None):
+        """
+        Read and parse subtitle data for translation file from bytes `data`.
+
+        See :meth:`open_translation_from_stream` for details.
+        """
+        return self.open_translation_from_stream(io.BytesIO(data),
+                                                 encoding,
+                                                 align_method)
+
+    @aeidon.deco.export
+    @aeidon.deco.notify_frozen
+    def open_translation_from_stream(self, f, encoding=None,
+                                     align_method=None):
+        """
+        Read and parse subtitle data for translation file from file object `f`.
+
+        `f` can be a binary file object, which is decoded using `encoding`,
+        or a text file object, in which case `encoding` is used only when
+        saving. `encoding` can be ``None`` to use the system default encoding.
+        See :meth:`open_translation` for `align_method`.
         Return the amount of subtitles that needed to be moved in order
         to arrange them in ascending chronological order.
 
@@ -142,12 +235,13 @@ class OpenAgent(aeidon.Delegate):
         """
         encoding = encoding or aeidon.util.get_default_encoding()
         align_method = align_method or aeidon.align_methods.POSITION
-        bom_encoding = aeidon.encodings.detect_bom(path)
-        if not bom_encoding in (encoding, None):
-            return self.open_translation(path, bom_encoding, align_method)
-        format = aeidon.util.detect_format(path, encoding)
-        self.tran_file = aeidon.files.new(format, path, encoding)
-        subtitles = self._read_file(self.tran_file)
+        file = aeidon.files.load_from_stream(f, encoding)
+        subtitles = self._read_file(file)
+        return self._open_translation_file(file, subtitles, align_method)
+
+    def _open_translation_file(self, file, subtitles, align_method):
+        """Set `file` and `subtitles` as translation and return sort count."""
+        self.tran_file = file
         subtitles, sort_count = self._sort_subtitles(subtitles)
         for subtitle in subtitles:
             subtitle.framerate = self.framerate
@@ -174,7 +268,8 @@ class OpenAgent(aeidon.Delegate):
             # problem in the file to be read and a bug in our own parsing
             # code. Raise both as parse errors.
             raise aeidon.ParseError("Failed to parse file {}"
-                                    .format(repr(file.path)))
+                                    .format(repr(file.path)),
+                                    format=file.format)
 
     def _sort_subtitles(self, subtitles):
         """Return sorted `subtitles` and sort count."""
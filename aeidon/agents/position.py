@@ -24,7 +24,54 @@ from aeidon.i18n import _
 
 class PositionAgent(aeidon.Delegate):
 
-    """Manipulating times and frames."""
+    """
+    Manipulating times and frames.
+
+    Bulk operations work on positions extracted from subtitles as sequences
+    of internal units (milliseconds for times, frames for frames) and apply
+    changes to all of them at once. If :mod:`numpy` is available, the
+    arithmetic is done with arrays, otherwise with plain Python lists.
+    """
+
+    def _adjust_ends(self, starts, ends, limits, lengths, speed, lengthen,
+                     shorten, minimum, maximum, gap):
+        """Return `ends` in seconds adjusted as per :meth:`adjust_durations`."""
+        if aeidon.util.numpy_available():
+            import numpy as np
+            starts = np.array(starts, dtype=np.float64)
+            ends = np.array(ends, dtype=np.float64)
+            limits = np.array(limits, dtype=np.float64)
+            if speed is not None:
+                optimal = np.array(lengths, dtype=np.float64) / speed
+                durations = ends - starts
+                change = np.zeros(len(ends), dtype=bool)
+                if lengthen: change |= (durations < optimal)
+                if shorten:  change |= (durations > optimal)
+                ends = np.where(change, starts + optimal, ends)
+            if minimum:
+                ends = np.where(ends - starts < minimum, starts + minimum, ends)
+            if maximum:
+                ends = np.where(ends - starts > maximum, starts + maximum, ends)
+            if gap is not None:
+                ends = np.where(limits - ends < gap,
+                                np.maximum(starts, limits - gap),
+                                ends)
+            return ends.tolist()
+        new_ends = []
+        for i, (start, end, limit) in enumerate(zip(starts, ends, limits)):
+            if speed is not None:
+                optimal_duration = lengths[i] / speed
+                dol = lengthen and end - start < optimal_duration
+                dos = shorten  and end - start > optimal_duration
+                end = start + optimal_duration if dol or dos else end
+            domin = minimum and end - start < minimum
+            domax = maximum and end - start > maximum
+            end = start + minimum if domin else end
+            end = start + maximum if domax else end
+            dogap = gap is not None and limit - end < gap
+            end = max(start, limit - gap) if dogap else end
+            new_ends.append(end)
+        return new_ends
 
     @aeidon.deco.export
     @aeidon.deco.revertable
@@ -43,34 +90,32 @@ class PositionAgent(aeidon.Delegate):
         Using a gap of at least zero is always a good idea if overlapping
         is not desired. Return changed indices.
         """
+        indices = indices or self.get_all_indices()
+        starts = [self.subtitles[i].start_seconds for i in indices]
+        ends = [self.subtitles[i].end_seconds for i in indices]
+        limits = [self.subtitles[i+1].start_seconds
+                  if i < len(self.subtitles) - 1
+                  else 360000 for i in indices]
+        lengths = ([self.get_text_length(i, aeidon.documents.MAIN)
+                    for i in indices] if speed is not None else None)
+        ends = self._adjust_ends(starts, ends, limits, lengths, speed,
+                                 lengthen, shorten, minimum, maximum, gap)
+        ends = [self._to_internal(x) for x in ends]
         new_indices = []
-        new_subtitles = []
-        for index in indices or self.get_all_indices():
-            start = self.subtitles[index].start_seconds
-            end = self.subtitles[index].end_seconds
-            if speed is not None:
-                length = self.get_text_length(index, aeidon.documents.MAIN)
-                optimal_duration = length / speed
-                dol = lengthen and end - start < optimal_duration
-                dos = shorten  and end - start > optimal_duration
-                end = start + optimal_duration if dol or dos else end
-            domin = minimum and end - start < minimum
-            domax = maximum and end - start > maximum
-            end = start + minimum if domin else end
-            end = start + maximum if domax else end
-            end_max = (self.subtitles[index+1].start_seconds
-                       if index < len(self.subtitles) - 1
-                       else 360000)
-
-            dogap = gap is not None and end_max - end < gap
-            end = max(start, end_max - gap) if dogap else end
-            if end != self.subtitles[index].end_seconds:
-                new_indices.append(index)
-                subtitle = self.subtitles[index].copy()
-                subtitle.end_seconds = end
-                new_subtitles.append(subtitle)
+        new_starts = []
+        new_ends = []
+        orig_starts, orig_ends = self._get_positions(indices)
+        for i, index in enumerate(indices):
+            if ends[i] == orig_ends[i]: continue
+            new_indices.append(index)
+            new_starts.append(orig_starts[i])
+            new_ends.append(ends[i])
         if not new_indices: return []
-        self.replace_positions(new_indices, new_subtitles, register=register)
+        self.set_positions(new_indices,
+                           new_starts,
+                           new_ends,
+                           register=register)
+
         self.set_action_description(register, _("Adjusting durations"))
         return new_indices
 
@@ -84,15 +129,16 @@ class PositionAgent(aeidon.Delegate):
         `indices` can be ``None`` to process all subtitles. `framerate_in` and
         `framerate_out` should be constants from :attr:`aeidon.framerates`.
         """
-        new_subtitles = []
         indices = indices or self.get_all_indices()
         self.set_framerate(framerate_in, register=None)
-        for index in indices:
-            subtitle = self.subtitles[index].copy()
-            subtitle.convert_framerate(framerate_out)
-            new_subtitles.append(subtitle)
+        coefficient = framerate_out.value / framerate_in.value
+        if self.get_mode() == aeidon.modes.TIME:
+            coefficient = 1 / coefficient
+        starts, ends = self._get_positions(indices)
+        starts = self._scale(starts, coefficient)
+        ends = self._scale(ends, coefficient)
         self.set_framerate(framerate_out)
-        self.replace_positions(indices, new_subtitles, register=register)
+        self.set_positions(indices, starts, ends, register=register)
         self.group_actions(register, 2, _("Converting framerate"))
 
     def _get_frame_transform(self, p1, p2):
@@ -107,6 +153,15 @@ class PositionAgent(aeidon.Delegate):
         constant = int(round(-coefficient * x1 + y1, 0))
         return coefficient, constant
 
+    def _get_positions(self, indices):
+        """Return lists of start and end positions in internal units."""
+        if isinstance(self.subtitles, aeidon.SubtitleStore):
+            # Read columns directly without instantiating subtitle views.
+            return self.subtitles.get_positions(indices)
+        subtitles = [self.subtitles[i] for i in indices]
+        return ([x._start for x in subtitles],
+                [x._end for x in subtitles])
+
     def _get_seconds_transform(self, p1, p2):
         """Return a formula for linear correction of positions."""
         # Think of this as a linear transformation where input positions
@@ -132,6 +187,18 @@ class PositionAgent(aeidon.Delegate):
         if aeidon.is_seconds(p1[1]): return self._get_seconds_transform(p1, p2)
         raise ValueError("Bad position argument: {}".format(repr(p1)))
 
+    def _scale(self, values, coefficient, constant=0):
+        """Return `values` multiplied by `coefficient` plus `constant`."""
+        if aeidon.util.numpy_available():
+            import numpy as np
+            values = np.array(values, dtype=np.int64)
+            if coefficient != 1:
+                values = np.rint(values * coefficient).astype(np.int64)
+            return (values + constant).tolist()
+        if coefficient != 1:
+            values = [round(x * coefficient) for x in values]
+        return [x + constant for x in values]
+
     @aeidon.deco.export
     @aeidon.deco.revertable
     def set_framerate(self, framerate, register=-1):
@@ -150,22 +217,55 @@ class PositionAgent(aeidon.Delegate):
 
     @aeidon.deco.export
     @aeidon.deco.revertable
-    def shift_positions(self, indices, value, register=-1):
+    def shift_positions(self, indices, value, mode=None, register=-1):
         """
         Make subtitles appear earlier or later.
 
         `indices` can be ``None`` to process all subtitles.
         `value` can be any valid position type, negative to make subtitles
-        appear ealier, positive to make subtitles appear later.
+        appear ealier, positive to make subtitles appear later. If `mode` is
+        given, `value` should be in internal units of `mode`, i.e. integer
+        milliseconds for :attr:`aeidon.modes.TIME` and integer frames for
+        :attr:`aeidon.modes.FRAME`.
         """
-        new_subtitles = []
+        orig_indices = indices
         indices = indices or self.get_all_indices()
-        for index in indices:
-            subtitle = self.subtitles[index].copy()
-            subtitle.shift_positions(value)
-            new_subtitles.append(subtitle)
-        self.replace_positions(indices, new_subtitles, register=register)
-        self.set_action_description(register, _("Shifting positions"))
+        if mode is None:
+            mode = self.get_mode()
+            value = self._to_internal(value)
+        if mode == self.get_mode():
+            starts, ends = self._get_positions(indices)
+            starts = self._scale(starts, 1, value)
+            ends = self._scale(ends, 1, value)
+            self.set_positions(indices, starts, ends, register=None)
+        else:
+            # Shift in units of the mode shifted in originally,
+            # which can differ after saving in another format.
+            subtitles = [self.subtitles[i].copy() for i in indices]
+            for subtitle in subtitles:
+                subtitle.mode = mode
+            starts = self._scale([x._start for x in subtitles], 1, value)
+            ends = self._scale([x._end for x in subtitles], 1, value)
+            self.set_positions(indices, starts, ends, mode, register=None)
+        # Shifting is exactly reverted by shifting back, which
+        # avoids keeping original positions of all subtitles.
+        if orig_indices is not None:
+            orig_indices = aeidon.util.pack_indices(orig_indices)
+        action = aeidon.RevertableAction(register=register)
+        action.docs = tuple(aeidon.documents)
+        action.description = _("Shifting positions")
+        action.revert_function = self.shift_positions
+        action.revert_args = (orig_indices, -value, mode)
+        self.register_action(action)
+
+    def _to_internal(self, pos):
+        """Return position `pos` converted to internal units."""
+        if self.get_mode() == aeidon.modes.TIME:
+            return self.calc.to_milliseconds(pos)
+        if self.get_mode() == aeidon.modes.FRAME:
+            return self.calc.to_frame(pos)
+        raise ValueError("Invalid mode: {}"
+                         .format(repr(self.get_mode())))
 
     @aeidon.deco.export
     @aeidon.deco.revertable
@@ -176,13 +276,11 @@ class PositionAgent(aeidon.Delegate):
         `indices` can be ``None`` to process all subtitles.
         `p1` and `p2` should be tuples of index, position.
         """
-        new_subtitles = []
         indices = indices or self.get_all_indices()
         coefficient, constant = self._get_transform(p1, p2)
-        for index in indices:
-            subtitle = self.subtitles[index].copy()
-            subtitle.scale_positions(coefficient)
-            subtitle.shift_positions(constant)
-            new_subtitles.append(subtitle)
-        self.replace_positions(indices, new_subtitles, register=register)
+        constant = self._to_internal(constant)
+        starts, ends = self._get_positions(indices)
+        starts = self._scale(starts, coefficient, constant)
+        ends = self._scale(ends, coefficient, constant)
+        self.set_positions(indices, starts, ends, register=register)
         self.set_action_description(register, _("Transforming positions"))
@@ -55,6 +55,7 @@ class PreviewAgent(aeidon.Delegate):
         e.g. 'movie.avi' for 'movie.en.srt'.
         """
         if self.main_file is None: return None
+        if self.main_file.path is None: return None
         dirname = os.path.dirname(self.main_file.path)
         subname = os.path.basename(self.main_file.path)
         for name in os.listdir(dirname):
@@ -80,6 +81,8 @@ class PreviewAgent(aeidon.Delegate):
         file = self.get_file(doc)
         if file is None or encoding != file.encoding:
             return self.new_temp_file(doc)
+        if file.path is None:
+            return self.new_temp_file(doc)
         if doc == aeidon.documents.MAIN:
             if not self.main_changed and not temp:
                 return self.main_file.path
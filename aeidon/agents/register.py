@@ -40,9 +40,16 @@ resulting action needs to be grouped as one using :meth:`group_actions`.
 If a revertable method needs to be performed without the possibility of
 reverting, the `register` keyword argument should be given a value of ``None``.
 This way it will not be in any way processed by the undo/redo system.
+
+Undo and redo stacks are deques with the most recent action at index zero,
+which makes pushing and popping actions independent of the size of the stacks.
+If :attr:`aeidon.Project.undo_memory_limit` is set, the oldest actions are
+written to a temporary file and replaced in the stacks by instances of
+:class:`aeidon.RevertableActionStub`, which are read back when reverted.
 """
 
 import aeidon
+import time
 
 
 class RegisterAgent(aeidon.Delegate):
@@ -50,20 +57,26 @@ class RegisterAgent(aeidon.Delegate):
     """
     Managing revertable actions.
 
+    :ivar _coalesce_candidate: Tuple of last action done and time or ``None``
     :ivar _do_description: Original description of the action
+    :ivar _memory: Approximate bytes of actions in stacks kept in memory
+    :ivar _spill_path: Path to temporary file to write actions to or ``None``
     """
 
     def __init__(self, master):
         """Initialize a :class:`RegisterAgent` instance."""
         aeidon.Delegate.__init__(self, master)
+        self._coalesce_candidate = None
         self._do_description = None
+        self._memory = 0
+        self._spill_path = None
         aeidon.util.connect(self, self, "notify::undo_limit")
+        aeidon.util.connect(self, self, "notify::undo_memory_limit")
 
-    def _break_action_group(self, stack, index=0):
+    def _break_action_group(self, stack):
         """Break the action group in `stack` and return amount broken into."""
-        action_group = stack.pop(index)
-        for action in reversed(action_group.actions):
-            stack.insert(index, action)
+        action_group = stack.popleft()
+        stack.extendleft(reversed(action_group.actions))
         return len(action_group.actions)
 
     @aeidon.deco.export
@@ -76,12 +89,61 @@ class RegisterAgent(aeidon.Delegate):
         """Return ``True`` if one or more actions can be undone."""
         return len(self.undoables) >= count
 
+    @aeidon.deco.export
+    def coalesce_actions(self, register):
+        """Merge the most recent action done with the preceding if possible."""
+        if register != aeidon.registers.DO: return
+        if self.undo_coalesce_time is None: return
+        # Actions done in a batch are grouped as one
+        # and must not merge with those done before.
+        if self._batch is not None: return
+        if not self.undoables: return
+        now = time.monotonic()
+        candidate = self._coalesce_candidate
+        self._coalesce_candidate = (self.undoables[0], now)
+        if candidate is None: return
+        if len(self.undoables) < 2: return
+        action, previous = self.undoables[0], self.undoables[1]
+        # Merge only with the action done immediately before,
+        # not one that has since been undone and redone.
+        if previous is not candidate[0]: return
+        if now - candidate[1] > self.undo_coalesce_time: return
+        key = getattr(action, "coalesce_key", None)
+        if key is None: return
+        if key != getattr(previous, "coalesce_key", None): return
+        # Keep the unchanged state of documents reachable by undoing.
+        if aeidon.documents.MAIN in action.docs:
+            if self.main_changed == 1: return
+        if aeidon.documents.TRAN in action.docs:
+            if self.tran_changed == 1: return
+        # The preceding action reverts to the value before both.
+        self._count_memory(self.undoables.popleft(), -1)
+        self._shift_changed_value(action, -1)
+        self._coalesce_candidate = (previous, now)
+
+    def _count_memory(self, action, shift):
+        """Count size of `action` added to (1) or removed from (-1) stacks."""
+        if self.undo_memory_limit is None: return
+        self._memory += shift * action.get_size()
+
+    @aeidon.deco.export
+    def count_reversion_memory(self):
+        """Count size of actions in undo and redo stacks from scratch."""
+        if self.undo_memory_limit is None: return
+        self._memory = sum(x.get_size()
+                           for stack in (self.undoables, self.redoables)
+                           for x in stack)
+
     @aeidon.deco.export
     def cut_reversion_stacks(self):
         """Cut undo and redo stacks to their maximum lengths."""
         if self.undo_limit is not None:
-            del self.redoables[self.undo_limit:]
-            del self.undoables[self.undo_limit:]
+            for stack in (self.redoables, self.undoables):
+                while len(stack) > self.undo_limit:
+                    self._count_memory(stack.pop(), -1)
+        if self.undo_memory_limit is not None:
+            if self._memory > self.undo_memory_limit:
+                self._spill_actions()
 
     @aeidon.deco.export
     def emit_action_signal(self, register):
@@ -117,40 +179,61 @@ class RegisterAgent(aeidon.Delegate):
         action_group.description = description
         stack = self._get_destination_stack(register)
         for i in range(count):
-            action = stack.pop(0)
+            action = stack.popleft()
+            if isinstance(action, aeidon.RevertableActionStub):
+                action = action.load(self)
+                self._count_memory(action, 1)
             if isinstance(action, aeidon.RevertableActionGroup):
                 action_group.actions.extend(action.actions)
             else: # Single action
                 action_group.actions.append(action)
-        stack.insert(0, action_group)
+        stack.appendleft(action_group)
+
+    def _load_action(self, stack):
+        """Read the most recent action in `stack` back if written to disk."""
+        if isinstance(stack[0], aeidon.RevertableActionStub):
+            stack[0] = stack[0].load(self)
+            self._count_memory(stack[0], 1)
 
     def _on_notify_undo_limit(self, *args):
         """Cut reversion stacks if limit set."""
         if self.undo_limit is not None:
             self.cut_reversion_stacks()
 
+    def _on_notify_undo_memory_limit(self, *args):
+        """Write actions to disk if limit set."""
+        if self.undo_memory_limit is not None:
+            self._spill_actions()
+
     @aeidon.deco.export
     def redo(self, count=1):
         """Redo `count` amount of actions from the redoable stack."""
         group = aeidon.RevertableActionGroup
+        self._load_action(self.redoables)
         if count > 1 or isinstance(self.redoables[0], group):
             return self._revert_multiple(count, aeidon.registers.REDO)
         self._do_description = self.redoables[0].description
-        self.redoables.pop(0).revert()
+        action = self.redoables.popleft()
+        self._count_memory(action, -1)
+        action.revert()
 
     @aeidon.deco.export
     def register_action(self, action):
         """Register `action` as done, undone or redone."""
+        if action.register is not None:
+            self._count_memory(action, 1)
         if action.register == aeidon.registers.DO:
-            self.undoables.insert(0, action)
-            self.redoables = []
+            self.undoables.appendleft(action)
+            for redoable in self.redoables:
+                self._count_memory(redoable, -1)
+            self.redoables.clear()
             self._shift_changed_value(action, action.register.shift)
         if action.register == aeidon.registers.UNDO:
-            self.redoables.insert(0, action)
+            self.redoables.appendleft(action)
             action.description = self._do_description
             self._shift_changed_value(action, action.register.shift)
         if action.register == aeidon.registers.REDO:
-            self.undoables.insert(0, action)
+            self.undoables.appendleft(action)
             action.description = self._do_description
             self._shift_changed_value(action, action.register.shift)
 
@@ -159,13 +242,16 @@ class RegisterAgent(aeidon.Delegate):
         self.block(register.signal)
         stack = self._get_source_stack(register)
         for i in range(count):
+            self._load_action(stack)
             part_count = 1
             if isinstance(stack[0], aeidon.RevertableActionGroup):
                 description = stack[0].description
                 part_count = self._break_action_group(stack)
             for j in range(part_count):
                 self._do_description = stack[0].description
-                stack.pop(0).revert()
+                action = stack.popleft()
+                self._count_memory(action, -1)
+                action.revert()
             if part_count > 1:
                 self.group_actions(register, part_count, description)
         self.unblock(register.signal)
@@ -179,6 +265,49 @@ class RegisterAgent(aeidon.Delegate):
         stack = self._get_destination_stack(register)
         stack[0].description = description
 
+    def _spill_actions(self):
+        """Write the oldest actions exceeding memory limit to disk."""
+        # Keep only half of the limit in memory so that the stacks
+        # need not be walked through again at every action registered.
+        limit = self.undo_memory_limit / 2
+        stacks = (self.undoables, self.redoables)
+        items = []
+        total = 0
+        for stack in stacks:
+            for i, action in enumerate(stack):
+                if isinstance(action, aeidon.RevertableActionStub): break
+                total += action.get_size()
+                # Always keep the most recent action in memory.
+                if i == 0 or total <= limit: continue
+                with aeidon.util.silent(TypeError, ValueError):
+                    data = aeidon.session.dump_action(action)
+                    items.append((stack, i, action, data))
+        self._memory = total
+        if not items: return
+        if self._spill_path is None:
+            self._spill_path = aeidon.temp.create(".undo")
+        # Start the file over once no earlier actions are needed.
+        stubs = any(isinstance(x, aeidon.RevertableActionStub)
+                    for stack in stacks for x in stack)
+
+        mode = "ab" if stubs else "wb"
+        try:
+            with open(self._spill_path, mode) as f:
+                offset = f.tell()
+                f.write(b"".join(x[3] for x in items))
+        except OSError:
+            # Keep actions in memory if writing fails.
+            return
+        for stack, i, action, data in items:
+            stack[i] = aeidon.RevertableActionStub(
+                description=action.description,
+                length=len(data),
+                offset=offset,
+                path=self._spill_path)
+
+            offset += len(data)
+            self._memory -= action.get_size()
+
     def _shift_changed_value(self, action, shift):
         """Shift the values of changed attributes."""
         if aeidon.documents.MAIN in action.docs:
@@ -195,7 +324,10 @@ class RegisterAgent(aeidon.Delegate):
     def undo(self, count=1):
         """Undo `count` amount of actions from the undoable stack."""
         group = aeidon.RevertableActionGroup
+        self._load_action(self.undoables)
         if count > 1 or isinstance(self.undoables[0], group):
             return self._revert_multiple(count, aeidon.registers.UNDO)
         self._do_description = self.undoables[0].description
-        self.undoables.pop(0).revert()
+        action = self.undoables.popleft()
+        self._count_memory(action, -1)
+        action.revert()
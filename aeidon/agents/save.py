@@ -24,10 +24,12 @@ class SaveAgent(aeidon.Delegate):
 
     """Writing subtitle data to file."""
 
-    def _save(self, doc, file, keep_changes):
+    def _save(self, doc, file, keep_changes, f=None):
         """
         Write subtitle data from `doc` to `file`.
 
+        If `f` is not ``None``, write to file object `f` instead of the path
+        of `file`.
         Return indices of texts changed due to markup conversion.
         Raise :exc:`IOError` if writing fails.
         Raise :exc:`UnicodeError` if encoding fails.
@@ -44,7 +46,10 @@ class SaveAgent(aeidon.Delegate):
                 if new_text == text: continue
                 subtitle.set_text(doc, new_text)
                 indices.append(i)
-        file.write(self.subtitles, doc)
+        if f is None:
+            file.write(self.subtitles, doc)
+        else:
+            file.write_to_stream(self.subtitles, doc, f)
         if keep_changes: return indices
         for i, subtitle in enumerate(self.subtitles):
             subtitle.set_text(doc, orig_texts[i])
@@ -108,3 +113,26 @@ class SaveAgent(aeidon.Delegate):
             self.tran_changed = 0
             self.emit("translation-texts-changed", indices)
         self.emit("translation-file-saved", file)
+
+    @aeidon.deco.export
+    def save_to_stream(self, doc, f, file=None):
+        """
+        Write subtitle data from `doc` to file object `f`.
+
+        `f` can be a binary or a text file object, see
+        :meth:`aeidon.SubtitleFile.write_to_stream`. `file` can be ``None``
+        to use the file of `doc`, otherwise format, encoding and newlines of
+        `file` are used. Unlike when saving to a file, the file and changed
+        status of `doc` are not changed, and neither are texts of `doc` if
+        markup needs to be converted.
+        Raise :exc:`IOError` if writing fails.
+        Raise :exc:`UnicodeError` if encoding fails.
+        """
+        current_file = self.get_file(doc)
+        file = file or current_file
+        if file is None:
+            raise ValueError("No file to determine format of {}"
+                             .format(repr(doc)))
+        if current_file is not None:
+            file.copy_from(current_file)
+        self._save(doc, file, False, f)
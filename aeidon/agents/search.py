@@ -34,7 +34,7 @@ class SearchAgent(aeidon.Delegate):
     :ivar _match_passed: ``True`` if the position of last match has been passed
     :ivar _match_index: Index of the last match
     :ivar _match_span: Start and end positions of the last match
-    :ivar _indices: Sequence of target indices or ``None`` for all
+    :ivar _indices: :class:`aeidon.IndexSet` of targets or ``None`` for all
     :ivar _wrap: ``True`` to wrap search, ``False`` to stop at the last index
 
     Searching is done with the help of an instance of :class:`aeidon.Finder`.
@@ -80,7 +80,7 @@ class SearchAgent(aeidon.Delegate):
             # Proceed to the next document or raise StopIteration.
             self._match_passed = True
             doc = self._get_document(doc, next)
-            index = (min(indices) if next else max(indices))
+            index = (indices[0] if next else indices[-1])
             pos = None
 
     @aeidon.deco.export
@@ -134,6 +134,13 @@ class SearchAgent(aeidon.Delegate):
         raise ValueError("Invalid document: {} or invalid next: {}"
                          .format(repr(doc), repr(next)))
 
+    def _get_texts(self, doc):
+        """Return list of texts of all subtitles corresponding to `doc`."""
+        if isinstance(self.subtitles, aeidon.SubtitleStore):
+            # Read column directly without instantiating subtitle views.
+            return self.subtitles.get_texts(doc)
+        return [x.get_text(doc) for x in self.subtitles]
+
     def _next_in_document(self, index, doc, pos=None):
         """
         Find the next match in `doc` starting from `pos`.
@@ -144,7 +151,7 @@ class SearchAgent(aeidon.Delegate):
         Return tuple of index, document, match span.
         """
         indices = self._indices or self.get_all_indices()
-        for index in range(index, max(indices)+1):
+        for index in range(index, indices[-1]+1):
             text = self.subtitles[index].get_text(doc)
             # Avoid resetting finder's match span.
             if text != self._finder.text:
@@ -181,7 +188,7 @@ class SearchAgent(aeidon.Delegate):
         Return tuple of index, document, match span.
         """
         indices = self._indices or self.get_all_indices()
-        for index in reversed(range(min(indices), index+1)):
+        for index in reversed(range(indices[0], index+1)):
             text = self.subtitles[index].get_text(doc)
             # Avoid resetting finder's match span.
             if text != self._finder.text:
@@ -239,8 +246,7 @@ class SearchAgent(aeidon.Delegate):
             counts[doc] = 0
             new_indices = []
             new_texts = []
-            for index, subtitle in enumerate(self.subtitles):
-                text = subtitle.get_text(doc)
+            for index, text in enumerate(self._get_texts(doc)):
                 self._finder.set_text(text)
                 sub_count = self._finder.replace_all()
                 if sub_count > 0:
@@ -288,6 +294,6 @@ class SearchAgent(aeidon.Delegate):
         `indices` can be ``None`` to target all subtitles.
         `docs` can be ``None`` to target all documents.
         """
-        self._indices = (tuple(indices) if indices else None)
+        self._indices = (aeidon.IndexSet(indices) if indices else None)
         self._docs = tuple(docs or aeidon.documents)
         self._wrap = wrap
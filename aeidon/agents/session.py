@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2005 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Saving and loading the complete state of a project."""
+
+import aeidon
+
+
+class SessionAgent(aeidon.Delegate):
+
+    """
+    Saving and loading the complete state of a project.
+
+    Sessions hold subtitles, main and translation files, framerate, video path
+    and undo and redo stacks, allowing a project to be restored as it was
+    without reading and parsing the subtitle files, see :mod:`aeidon.session`.
+    """
+
+    @aeidon.deco.export
+    @aeidon.deco.notify_frozen
+    def load_session(self, path):
+        """
+        Read and restore the state of the project from session file at `path`.
+
+        Raise :exc:`IOError` if reading fails.
+        Raise :exc:`aeidon.ParseError` if parsing fails.
+        """
+        state = aeidon.session.read(path, self)
+        self.framerate = state["framerate"]
+        self.calc = aeidon.Calculator(self.framerate)
+        self.subtitles = state["subtitles"]
+        self.main_file = state["main_file"]
+        self.main_changed = state["main_changed"]
+        self.tran_file = state["tran_file"]
+        self.tran_changed = state["tran_changed"]
+        self.video_path = state["video_path"]
+        self.undoables = state["undoables"]
+        self.redoables = state["redoables"]
+        self.undo_limit = state["undo_limit"]
+        self.count_reversion_memory()
+        self.cut_reversion_stacks()
+        if self.main_file is not None:
+            self.emit("main-file-opened", self.main_file)
+        if self.tran_file is not None:
+            self.emit("translation-file-opened", self.tran_file)
+
+    @aeidon.deco.export
+    def save_session(self, path):
+        """
+        Write the state of the project to session file at `path`.
+
+        Raise :exc:`IOError` if writing fails.
+        """
+        aeidon.session.write(path, self)
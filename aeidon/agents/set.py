@@ -58,6 +58,7 @@ class SetAgent(aeidon.Delegate):
         action.description = _("Editing position")
         action.revert_function = self.set_end
         action.revert_args = (index, orig_end)
+        action.coalesce_key = ("end", index)
         self.register_action(action)
         self.emit("positions-changed", (index,))
 
@@ -80,6 +81,7 @@ class SetAgent(aeidon.Delegate):
         action.description = _("Editing position")
         action.revert_function = self.set_end
         action.revert_args = (index, orig_value)
+        action.coalesce_key = ("end", index)
         self.register_action(action)
         self.emit("positions-changed", (index,))
 
@@ -107,12 +109,17 @@ class SetAgent(aeidon.Delegate):
         orig_value = subtitle.start
         subtitle.start = value
         if subtitle.start == orig_value: return
-        index = self._move_if_needed(index)
+        new_index = self._move_if_needed(index)
         action = aeidon.RevertableAction(register=register)
         action.docs = tuple(aeidon.documents)
         action.description = _("Editing position")
         action.revert_function = self.set_start
-        action.revert_args = (index, orig_value)
+        action.revert_args = (new_index, orig_value)
+        # Merging with an earlier action would revert
+        # the wrong subtitle if this one was moved.
+        if new_index == index:
+            action.coalesce_key = ("start", index)
+        index = new_index
         self.register_action(action)
         self.emit("positions-changed", (index,))
 
@@ -129,6 +136,7 @@ class SetAgent(aeidon.Delegate):
         action.description = _("Editing text")
         action.revert_function = self.set_text
         action.revert_args = (index, doc, orig_value)
+        action.coalesce_key = ("text", index, doc)
         self.register_action(action)
         signal = self.get_text_signal(doc)
         self.emit(signal, (index,))
@@ -17,6 +17,8 @@
 
 import aeidon
 
+from unittest.mock import patch
+
 
 class TestEditAgent(aeidon.TestCase):
 
@@ -107,6 +109,38 @@ class TestEditAgent(aeidon.TestCase):
         assert self.project.subtitles[1].main_text == ""
         assert self.project.subtitles[2].main_text == ""
 
+    def test_replace_texts__unchanged(self):
+        doc = aeidon.documents.MAIN
+        text = self.project.subtitles[1].main_text
+        self.project.replace_texts((1, 2, 3), doc, (text, "", ""))
+        action = self.project.undoables[0]
+        assert action.revert_args[0] == range(2, 4)
+        assert len(action.revert_args[2]) == 2
+
+    @aeidon.deco.reversion_test
+    def test_set_positions(self):
+        subtitles = self.project.subtitles
+        self.project.set_positions((1, 2), (10, 20), (15, 25))
+        assert subtitles[1]._start == 10
+        assert subtitles[2]._end == 25
+
+    @aeidon.deco.reversion_test
+    def test_set_positions__mode(self):
+        subtitles = self.project.subtitles
+        mode = aeidon.modes.TIME
+        self.project.set_positions((0,), (1000,), (2000,), mode)
+        assert subtitles[0].start_seconds == 1.0
+        assert subtitles[0].end_seconds == 2.0
+
+    def test_set_positions__register_none(self):
+        reversion = "_get_positions_reversion"
+        agent = self.project._delegations["set_positions"].__self__
+        with patch.object(agent, reversion) as get_reversion:
+            self.project.set_positions((1,), (10,), (15,), register=None)
+            assert not get_reversion.called
+        assert self.project.subtitles[1]._start == 10
+        assert not self.project.undoables
+
     @aeidon.deco.reversion_test
     def test_split_subtitle(self):
         subtitles = self.project.subtitles
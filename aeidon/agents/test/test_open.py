@@ -18,6 +18,8 @@
 import aeidon
 import codecs
 
+from unittest.mock import patch
+
 
 class TestOpenAgent(aeidon.TestCase):
 
@@ -38,6 +40,45 @@ class TestOpenAgent(aeidon.TestCase):
         assert self.project.subtitles
         assert self.project.main_file.encoding == "utf_8_sig"
 
+    def test_open_main__cache(self):
+        path = self.new_subrip_file()
+        cache = aeidon.FileCache(aeidon.temp.create_directory())
+        self.project.cache = cache
+        self.project.open_main(path, "ascii")
+        subtitles = self.project.subtitles
+        assert cache.get(path, "ascii") is not None
+        self.project.open_main(path, "ascii")
+        assert self.project.subtitles == subtitles
+        assert self.project.main_file.format == aeidon.formats.SUBRIP
+
+    def test_open_main__encodings(self):
+        path = self.new_subrip_file()
+        blob = open(path, "rb").read()
+        open(path, "wb").write(blob.replace(b"a", "\u00e4".encode("cp1252")))
+        self.project.open_main(path, ("utf_8", "cp1252"))
+        assert self.project.subtitles
+        assert self.project.main_file.encoding == "cp1252"
+
+    def test_open_main__lazy(self):
+        path = self.new_temp_file(aeidon.formats.ASS)
+        lazy = aeidon.containers.LazySubStationAlpha
+        self.project.open_main(path, "ascii", lazy=True)
+        assert isinstance(self.project.subtitles[0].ssa, lazy)
+        assert not aeidon.files.AdvSubStationAlpha.lazy
+        self.project.open_main(path, "ascii")
+        assert not isinstance(self.project.subtitles[0].ssa, lazy)
+
+    def test_open_main__parse_error(self):
+        path = self.new_subrip_file()
+        read = patch.object(aeidon.files.SubRip, "read", side_effect=KeyError)
+        try:
+            with read:
+                self.project.open_main(path, "ascii")
+        except aeidon.ParseError as error:
+            assert error.format == aeidon.formats.SUBRIP
+        else:
+            raise AssertionError("Invalid file parsed")
+
     def test_open_main__sort(self):
         path = self.new_microdvd_file()
         with open(path, "w") as f:
@@ -47,6 +88,21 @@ class TestOpenAgent(aeidon.TestCase):
         sort_count = self.project.open_main(path, "ascii")
         assert sort_count == 1
 
+    def test_open_main_from_bytes(self):
+        path = self.new_subrip_file()
+        data = open(path, "rb").read()
+        self.project.open_main_from_bytes(codecs.BOM_UTF8 + data, "ascii")
+        assert self.project.subtitles
+        assert self.project.main_file.path is None
+        assert self.project.main_file.encoding == "utf_8_sig"
+
+    def test_open_main_from_stream(self):
+        path = self.new_microdvd_file()
+        with open(path, "r") as f:
+            self.project.open_main_from_stream(f, "ascii")
+        assert self.project.subtitles
+        assert self.project.main_file.format == aeidon.formats.MICRODVD
+
     def test_open_translation__align_number(self):
         for format in aeidon.formats:
             path = self.new_temp_file(format)
@@ -66,3 +122,10 @@ class TestOpenAgent(aeidon.TestCase):
         self.project.open_translation(path, "ascii")
         assert self.project.subtitles
         assert self.project.tran_file.encoding == "utf_8_sig"
+
+    def test_open_translation_from_bytes(self):
+        path = self.new_subrip_file()
+        data = open(path, "rb").read()
+        self.project.open_translation_from_bytes(data, "ascii")
+        assert self.project.tran_file.path is None
+        assert all(x.tran_text for x in self.project.subtitles)
@@ -17,6 +17,8 @@
 
 import aeidon
 
+from unittest.mock import patch
+
 
 class TestPositionAgent(aeidon.TestCase):
 
@@ -136,6 +138,28 @@ class TestPositionAgent(aeidon.TestCase):
             assert subtitle.start_frame == start
             assert subtitle.end_frame == end
 
+    def test_shift_positions__mode(self):
+        self.project.open_main(self.new_microdvd_file(), "ascii")
+        orig_subtitles = [x.copy() for x in self.project.subtitles]
+        self.project.shift_positions(None, 5)
+        path = self.new_temp_file(aeidon.formats.SUBRIP)
+        file = aeidon.files.new(aeidon.formats.SUBRIP, path, "ascii")
+        self.project.save_main(file)
+        assert self.project.get_mode() == aeidon.modes.TIME
+        self.project.undo()
+        for i, subtitle in enumerate(self.project.subtitles):
+            assert subtitle.start_time == orig_subtitles[i].start_time
+            assert subtitle.end_time == orig_subtitles[i].end_time
+
+    def test_shift_positions__reversion(self):
+        orig_subtitles = [x.copy() for x in self.project.subtitles]
+        self.project.shift_positions((0, 1, 2), -1.5)
+        action = self.project.undoables[0]
+        assert action.revert_function == self.project.shift_positions
+        assert action.revert_args == (range(0, 3), 1500, aeidon.modes.TIME)
+        self.project.undo()
+        assert self.project.subtitles == orig_subtitles
+
     @aeidon.deco.reversion_test
     def test_transform_positions(self):
         a, b = "00:00:01.000", "00:00:45.000"
@@ -144,3 +168,21 @@ class TestPositionAgent(aeidon.TestCase):
         for subtitle in self.project.subtitles[3:6]:
             assert a < subtitle.start_time < b
         assert self.project.subtitles[6].start_time == b
+
+
+class TestPositionAgentPython(TestPositionAgent):
+
+    def setup_method(self, method):
+        TestPositionAgent.setup_method(self, method)
+        self.patcher = patch("aeidon.util.numpy_available", lambda: False)
+        self.patcher.start()
+
+    def teardown_method(self, method):
+        self.patcher.stop()
+        TestPositionAgent.teardown_method(self, method)
+
+
+class TestPositionAgentColumnar(TestPositionAgent):
+
+    def new_project(self):
+        return aeidon.TestCase.new_project(self, columnar=True)
@@ -27,6 +27,68 @@ class TestRegisterAgent(aeidon.TestCase):
         self.project = self.new_project()
         self.delegate = self.project.undo.__self__
 
+    def test_coalesce_actions(self):
+        self.project.undo_coalesce_time = 60
+        text = self.project.subtitles[0].main_text
+        self.project.set_text(0, MAIN, "a")
+        self.project.set_text(0, MAIN, "ab")
+        self.project.set_text(0, MAIN, "abc")
+        assert len(self.project.undoables) == 1
+        assert self.project.main_changed == 1
+        self.project.undo()
+        assert self.project.subtitles[0].main_text == text
+        self.project.redo()
+        assert self.project.subtitles[0].main_text == "abc"
+
+    def test_coalesce_actions__different(self):
+        self.project.undo_coalesce_time = 60
+        self.project.set_text(0, MAIN, "a")
+        self.project.set_text(1, MAIN, "a")
+        self.project.set_text(1, TRAN, "a")
+        self.project.set_end(1, self.project.subtitles[1].end_seconds + 1)
+        assert len(self.project.undoables) == 4
+
+    def test_coalesce_actions__disabled(self):
+        self.project.set_text(0, MAIN, "a")
+        self.project.set_text(0, MAIN, "ab")
+        assert len(self.project.undoables) == 2
+
+    def test_coalesce_actions__nested(self):
+        self.project.undo_coalesce_time = 60
+        self.project.set_main_text(0, "a")
+        self.project.set_main_text(0, "ab")
+        assert len(self.project.undoables) == 1
+        self.project.clear_texts((0, 1), MAIN)
+        assert len(self.project.undoables) == 2
+
+    def test_coalesce_actions__saved(self):
+        self.project.undo_coalesce_time = 60
+        self.project.set_text(0, MAIN, "a")
+        self.project.main_changed = 0
+        self.project.set_text(0, MAIN, "ab")
+        assert len(self.project.undoables) == 2
+        self.project.undo()
+        assert self.project.main_changed == 0
+
+    def test_coalesce_actions__undone(self):
+        self.project.undo_coalesce_time = 60
+        subtitle = self.project.subtitles[1]
+        self.project.set_end(1, subtitle.end_seconds + 0.1)
+        self.project.set_end(1, subtitle.end_seconds + 0.1)
+        assert len(self.project.undoables) == 1
+        self.project.undo()
+        self.project.redo()
+        self.project.set_end(1, subtitle.end_seconds + 0.1)
+        assert len(self.project.undoables) == 2
+
+    def test_cut_reversion_stacks(self):
+        for i in range(5):
+            self.project.set_text(0, MAIN, str(i))
+        self.project.undo_limit = 3
+        assert len(self.project.undoables) == 3
+        self.project.undo(3)
+        assert self.project.subtitles[0].main_text == "1"
+
     def test_redo(self):
         text_0 = self.project.subtitles[0].main_text
         text_1 = self.project.subtitles[1].main_text
@@ -44,6 +106,64 @@ class TestRegisterAgent(aeidon.TestCase):
         assert self.project.subtitles[1].main_text == ""
         assert self.project.subtitles[2].main_text == ""
 
+    def test_spill_actions(self):
+        texts = [x.main_text for x in self.project.subtitles[:5]]
+        self.project.undo_memory_limit = 1
+        for i in range(5):
+            self.project.set_text(i, MAIN, str(i))
+        stub = aeidon.RevertableActionStub
+        assert not isinstance(self.project.undoables[0], stub)
+        assert all(isinstance(x, stub) for x in
+                   list(self.project.undoables)[1:])
+        self.project.undo(2)
+        self.project.undo(3)
+        assert [x.main_text for x in self.project.subtitles[:5]] == texts
+        self.project.redo(5)
+        for i in range(5):
+            assert self.project.subtitles[i].main_text == str(i)
+
+    def test_spill_actions__group(self):
+        subtitles = [x.copy() for x in self.project.subtitles]
+        self.project.undo_memory_limit = 1
+        self.project.remove_subtitles((0, 1, 2))
+        self.project.merge_subtitles((0, 1))
+        self.project.clear_texts((0, 1), MAIN)
+        assert isinstance(self.project.undoables[2],
+                          aeidon.RevertableActionStub)
+        self.project.undo(3)
+        assert self.project.subtitles == subtitles
+        self.project.redo()
+        assert len(self.project.subtitles) == len(subtitles) - 3
+
+    def test_spill_actions__limit(self):
+        for i in range(5):
+            self.project.set_text(i, MAIN, str(i))
+        self.project.undo_memory_limit = 10**9
+        stub = aeidon.RevertableActionStub
+        assert not any(isinstance(x, stub) for x in self.project.undoables)
+        self.project.undo_memory_limit = 1
+        assert isinstance(self.project.undoables[4], stub)
+
+    def test_spill_actions__memory(self):
+        agent = self.project._delegations["undo"].__self__
+        path = self.project.main_file.path
+        self.project.undo_memory_limit = 10**9
+        self.project.set_text(0, MAIN, "test")
+        self.project.shift_positions(None, 1000)
+        size = sum(x.get_size() for x in self.project.undoables)
+        self.project.undo_memory_limit = size * 25
+        for i in range(10):
+            self.project.open_main(path, "ascii")
+            self.project.set_text(0, MAIN, str(i))
+            self.project.shift_positions(None, 1000)
+            self.project.undo(2)
+            self.project.redo(2)
+            assert agent._memory == sum(x.get_size()
+                                        for x in self.project.undoables)
+
+        stub = aeidon.RevertableActionStub
+        assert not any(isinstance(x, stub) for x in self.project.undoables)
+
     def test_undo(self):
         text_0 = self.project.subtitles[0].main_text
         text_1 = self.project.subtitles[1].main_text
@@ -16,6 +16,7 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 import aeidon
+import io
 
 
 class TestSaveAgent(aeidon.TestCase):
@@ -34,6 +35,22 @@ class TestSaveAgent(aeidon.TestCase):
             self.project.save_main(file, keep_changes=True)
             assert self.project.main_changed == 0
 
+    def test_save_main__verbatim(self):
+        path = self.new_subrip_file()
+        with open(path, "w") as f:
+            f.write("1\n00:00:01,500 --> 00:00:02,500 \nfoo\n\n"
+                    "2\n0:0:3,5 --> 0:0:4,5\nbar\n")
+        self.project.open_main(path, "ascii")
+        self.project.set_text(0, aeidon.documents.MAIN, "test")
+        self.project.save_main()
+        lines = open(path, "r").read().split("\n")
+        assert lines[1] == "00:00:01,500 --> 00:00:02,500"
+        assert lines[5] == "0:0:3,5 --> 0:0:4,5"
+        self.project.undo()
+        self.project.save_main()
+        lines = open(path, "r").read().split("\n")
+        assert lines[1] == "00:00:01,500 --> 00:00:02,500 "
+
     def test_save_translation(self):
         for format in aeidon.formats:
             self.project.clear_texts((0,), aeidon.documents.TRAN)
@@ -43,3 +60,21 @@ class TestSaveAgent(aeidon.TestCase):
             assert self.project.tran_changed == 1
             self.project.save_translation(file, keep_changes=True)
             assert self.project.tran_changed == 0
+
+    def test_save_to_stream(self):
+        self.project.clear_texts((0,), aeidon.documents.MAIN)
+        f = io.BytesIO()
+        self.project.save_to_stream(aeidon.documents.MAIN, f)
+        assert self.project.main_changed == 1
+        self.project.save_main()
+        with open(self.project.main_file.path, "rb") as g:
+            assert f.getvalue() == g.read()
+
+    def test_save_to_stream__format(self):
+        path = self.project.tran_file.path
+        file = aeidon.files.new(aeidon.formats.SUBRIP, None, "ascii")
+        f = io.StringIO()
+        self.project.save_to_stream(aeidon.documents.TRAN, f, file)
+        assert self.project.tran_file.path == path
+        assert self.project.tran_file.format == aeidon.formats.MICRODVD
+        assert " --> " in f.getvalue()
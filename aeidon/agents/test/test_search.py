@@ -99,3 +99,9 @@ class TestSearchAgent(aeidon.TestCase):
         for i, text in enumerate(texts):
             assert self.project.subtitles[i].main_text == text
             assert self.project.subtitles[i].tran_text == text
+
+
+class TestSearchAgentColumnar(TestSearchAgent):
+
+    def new_project(self):
+        return aeidon.TestCase.new_project(self, columnar=True)
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2005 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+import struct
+import zlib
+
+MAIN = aeidon.documents.MAIN
+TRAN = aeidon.documents.TRAN
+
+
+class TestSessionAgent(aeidon.TestCase):
+
+    def edit(self, project):
+        project.set_text(0, MAIN, "test")
+        project.remove_subtitles((1, 2))
+        project.shift_positions(None, aeidon.as_seconds(1.5))
+        project.shift_positions((0, 2), aeidon.as_seconds(-0.5))
+        project.clear_texts((0, 1), MAIN)
+        project.set_framerate(aeidon.framerates.FPS_25_000)
+        project.merge_subtitles((3, 4))
+        project.undo()
+
+    def edit_header(self, path, old, new):
+        data = open(path, "rb").read()
+        start = len(aeidon.session.MAGIC) + 2
+        payload = zlib.decompress(data[start:])
+        length = struct.unpack_from("<I", payload)[0]
+        header = payload[4:4 + length].replace(old, new)
+        payload = (struct.pack("<I", len(header)) +
+                   header + payload[4 + length:])
+
+        open(path, "wb").write(data[:start] + zlib.compress(payload))
+
+    def get_state(self, project):
+        return ([(x._start, x._end, x.main_text, x.tran_text,
+                  x.mode, x.framerate) for x in project.subtitles],
+                project.framerate,
+                project.main_changed,
+                project.tran_changed)
+
+    def load(self, columnar=False):
+        path = aeidon.temp.create(".session")
+        self.project.save_session(path)
+        project = aeidon.Project(columnar=columnar)
+        project.load_session(path)
+        return project
+
+    def setup_method(self, method):
+        self.project = self.new_project()
+
+    def test_load_session(self):
+        self.edit(self.project)
+        project = self.load()
+        assert self.get_state(project) == self.get_state(self.project)
+        assert project.main_file.path == self.project.main_file.path
+        assert project.main_file.format == self.project.main_file.format
+        assert project.tran_file.path == self.project.tran_file.path
+        assert project.tran_file.format == self.project.tran_file.format
+        assert len(project.undoables) == len(self.project.undoables)
+        assert len(project.redoables) == len(self.project.redoables)
+
+    def test_load_session__columnar(self):
+        self.edit(self.project)
+        project = self.load(columnar=True)
+        assert isinstance(project.subtitles, aeidon.SubtitleStore)
+        assert self.get_state(project) == self.get_state(self.project)
+
+    def test_load_session__containers(self):
+        path = self.new_temp_file(aeidon.formats.ASS)
+        self.project.open_main(path, "ascii")
+        self.project.subtitles[0].ssa.layer = 2
+        project = self.load()
+        assert project.subtitles[0].ssa.layer == 2
+        assert project.main_file.event_fields == (
+            self.project.main_file.event_fields)
+
+    def test_load_session__function(self):
+        self.project.set_text(0, MAIN, "test")
+        path = aeidon.temp.create(".session")
+        self.project.save_session(path)
+        self.edit_header(path, b'"set_text"', b'"save_main"')
+        self.assert_raises(aeidon.ParseError,
+                           self.project.load_session,
+                           path)
+
+    def test_load_session__indices(self):
+        indices = aeidon.IndexSet([0, 1, 3])
+        action = aeidon.RevertableAction(
+            description="test",
+            docs=(MAIN,),
+            register=aeidon.registers.DO,
+            revert_function=self.project.replace_texts,
+            revert_args=(indices, MAIN, ["a", "b", "c"]))
+
+        self.project.undoables.appendleft(action)
+        project = self.load()
+        action = project.undoables[0]
+        assert isinstance(action.revert_args[0], aeidon.IndexSet)
+        assert action.revert_args[0] == indices
+
+    def test_load_session__invalid(self):
+        path = aeidon.temp.create(".session")
+        version = struct.pack("<H", aeidon.session.VERSION)
+        open(path, "wb").write(aeidon.session.MAGIC + version + b"invalid")
+        self.assert_raises(aeidon.ParseError,
+                           self.project.load_session,
+                           path)
+
+    def test_load_session__redo(self):
+        self.edit(self.project)
+        project = self.load()
+        self.project.redo()
+        project.redo()
+        assert self.get_state(project) == self.get_state(self.project)
+
+    def test_load_session__spilled(self):
+        self.project.undo_memory_limit = 1
+        self.edit(self.project)
+        assert isinstance(self.project.undoables[-1],
+                          aeidon.RevertableActionStub)
+        project = self.load()
+        count = len(self.project.undoables)
+        self.project.undo(count)
+        project.undo(count)
+        assert self.get_state(project) == self.get_state(self.project)
+
+    def test_load_session__undo(self):
+        self.edit(self.project)
+        project = self.load()
+        count = len(self.project.undoables)
+        self.project.undo(count)
+        project.undo(count)
+        assert self.get_state(project) == self.get_state(self.project)
+        assert project.subtitles
+        assert not project.can_undo()
+
+    def test_load_session__version(self):
+        path = aeidon.temp.create(".session")
+        self.project.save_session(path)
+        data = open(path, "rb").read()
+        start = len(aeidon.session.MAGIC)
+        data = data[:start] + struct.pack("<H", 2) + data[start + 2:]
+        open(path, "wb").write(data)
+        try:
+            self.project.load_session(path)
+        except aeidon.ParseError as error:
+            assert "version 2" in str(error)
+        else:
+            raise AssertionError("Older version read")
+
+    def test_save_session(self):
+        path = aeidon.temp.create(".session")
+        self.project.save_session(path)
+        data = open(path, "rb").read()
+        assert data.startswith(aeidon.session.MAGIC)
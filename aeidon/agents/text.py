@@ -243,15 +243,18 @@ class TextAgent(aeidon.Delegate):
                 new_texts.append(text)
         if not new_indices: return
         new_texts = self._remove_leftover_hi(new_texts, parser)
-        self.replace_texts(new_indices, doc, new_texts, register=register)
-        description = _("Removing hearing impaired texts")
-        self.set_action_description(register, description)
         remove_indices = []
         for i, text in (x for x in enumerate(new_texts) if not x[1]):
             remove_indices.append(new_indices[i])
-        if not remove_indices: return
-        self.remove_subtitles(remove_indices, register=register)
-        self.group_actions(register, 2, description)
+        description = _("Removing hearing impaired texts")
+        # Emit signals once to avoid updating
+        # removed subtitles as changed first.
+        with self.batch():
+            self.replace_texts(new_indices, doc, new_texts, register=register)
+            self.set_action_description(register, description)
+            if not remove_indices: return
+            self.remove_subtitles(remove_indices, register=register)
+            self.group_actions(register, 2, description)
 
     def _remove_leftover_hi(self, texts, parser):
         """Remove leftover hearing impaired whitespace and junk."""
@@ -26,8 +26,8 @@ class UtilityAgent(aeidon.Delegate):
 
     @aeidon.deco.export
     def get_all_indices(self):
-        """Return a list of all indices of subtitles."""
-        return list(range(len(self.subtitles)))
+        """Return all indices of subtitles as :class:`aeidon.IndexSet`."""
+        return aeidon.IndexSet(range(len(self.subtitles)))
 
     @aeidon.deco.export
     def get_changed(self, doc):
@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2005 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Signals and actions collected while doing multiple actions as one."""
+
+import aeidon
+import bisect
+
+__all__ = ("Batch",)
+
+_CHANGED_SIGNALS = (
+    "main-texts-changed",
+    "positions-changed",
+    "subtitles-changed",
+    "translation-texts-changed",
+)
+
+
+def _shift_inserted(indices, inserted):
+    """Return sorted `indices` shifted by subtitles `inserted`."""
+    shifted = []
+    i = shift = 0
+    for index in indices:
+        while i < len(inserted) and inserted[i] <= index + shift:
+            shift += 1
+            i += 1
+        shifted.append(index + shift)
+    return shifted
+
+def _shift_removed(indices, removed):
+    """Return sorted `indices` not `removed` shifted by subtitles removed."""
+    shifted = []
+    i = 0
+    for index in indices:
+        while i < len(removed) and removed[i] < index:
+            i += 1
+        if i < len(removed) and removed[i] == index: continue
+        shifted.append(index - i)
+    return shifted
+
+
+class Batch:
+
+    """
+    Signals and actions collected while doing multiple actions as one.
+
+    :ivar actions: List of actions done in order, possibly repeated
+    :ivar changed: Dictionary mapping signals to sets of changed indices
+    :ivar inserted: Sorted list of current indices of inserted subtitles
+    :ivar removed: Sorted list of original indices of removed subtitles
+
+    Any sequence of insertions and removals of subtitles is equivalent to
+    removing some of the original subtitles and then inserting new ones.
+    Indices of subtitles inserted and removed are kept in that form and
+    emitted as at most two signals, followed by changed indices of the other
+    signals, which are kept current, i.e. shifted by subtitles inserted and
+    removed later. See :meth:`aeidon.Project.batch`.
+    """
+
+    def __init__(self):
+        """Initialize a :class:`Batch` instance."""
+        self.actions = []
+        self.changed = {}
+        self.inserted = []
+        self.removed = []
+
+    def add(self, signal, *args):
+        """
+        Add `signal` emitted with `args`.
+
+        Return ``False`` if `signal` is not collected, but should be emitted
+        immediately, otherwise ``True``.
+        """
+        if signal == "action-done":
+            self.actions.append(args[0])
+            return True
+        if signal == "subtitles-inserted":
+            self._insert(sorted(set(args[0])))
+            return True
+        if signal == "subtitles-removed":
+            self._remove(sorted(set(args[0])))
+            return True
+        if signal in _CHANGED_SIGNALS:
+            self.changed.setdefault(signal, set()).update(args[0])
+            return True
+        return False
+
+    def get_signals(self):
+        """Return a list of signals and :class:`aeidon.IndexSet` to emit."""
+        signals = []
+        if self.removed:
+            signals.append(("subtitles-removed",
+                            aeidon.IndexSet(self.removed)))
+        if self.inserted:
+            signals.append(("subtitles-inserted",
+                            aeidon.IndexSet(self.inserted)))
+        # Inserted subtitles are new as a whole
+        # and need not be signalled as changed.
+        inserted = set(self.inserted)
+        for signal, indices in self.changed.items():
+            indices = aeidon.IndexSet(indices - inserted)
+            if not indices: continue
+            signals.append((signal, indices))
+        return signals
+
+    def _insert(self, indices):
+        """Add subtitles inserted at `indices`."""
+        for signal, changed in self.changed.items():
+            self.changed[signal] = set(
+                _shift_inserted(sorted(changed), indices))
+
+        inserted = _shift_inserted(self.inserted, indices)
+        self.inserted = sorted(set(inserted).union(indices))
+
+    def _remove(self, indices):
+        """Add subtitles removed at `indices`."""
+        # Subtitles inserted and removed are left out altogether,
+        # others are mapped back to indices before the batch.
+        inserted = set(self.inserted)
+        kept = [x - bisect.bisect_left(self.inserted, x)
+                for x in indices if not x in inserted]
+
+        removed = _shift_inserted(kept, self.removed)
+        self.removed = sorted(set(self.removed).union(removed))
+        for signal, changed in self.changed.items():
+            self.changed[signal] = set(
+                _shift_removed(sorted(changed), indices))
+
+        self.inserted = _shift_removed(self.inserted, indices)
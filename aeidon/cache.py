@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2005 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""On-disk cache of parsed subtitle files."""
+
+import aeidon
+import hashlib
+import json
+import os
+import zlib
+
+__all__ = ("FileCache",)
+
+
+def _get_size(path):
+    """Return size of file at `path` or zero if it doesn't exist."""
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+class FileCache:
+
+    """
+    On-disk cache of parsed subtitle files.
+
+    :cvar version: Version of the format of cache entries
+    :ivar directory: Path to the directory to keep cache entries in
+    :ivar max_size: Maximum total size of cache entries in bytes
+    :ivar _size: Total size of cache entries in bytes or ``None``
+
+    Entries are keyed by the absolute path, size and modification time of the
+    subtitle file and the encoding requested when opening it. A modified file
+    thus never matches an old entry, which will eventually be evicted. Entries
+    contain the file's properties and subtitle data, including unmodified
+    records for writing subtitles back verbatim, as compressed JSON. Files
+    with lazily decoded containers are not cached, since their records
+    depend on the containers being left undecoded.
+
+    The total size of entries is counted once and then kept up to date when
+    adding entries. When the total exceeds `max_size`, least recently used
+    entries are removed and the total counted anew, which also accounts for
+    entries added by other processes.
+
+    Failing to read or write the cache is never an error, but instead causes
+    the file to be read and parsed as if no cache was used.
+    """
+
+    version = 2
+
+    def __init__(self, directory=None, max_size=67108864):
+        """Initialize a :class:`FileCache` instance."""
+        self.directory = (directory or
+                          os.path.join(aeidon.CONFIG_HOME_DIR, "cache"))
+        self.max_size = max_size
+        self._size = None
+
+    def clear(self):
+        """Remove all cache entries."""
+        for path in self._list_entries():
+            with aeidon.util.silent(OSError):
+                os.remove(path)
+        self._size = None
+
+    def _decode(self, path, data):
+        """Return file and subtitles decoded from entry `data`."""
+        data = json.loads(str(zlib.decompress(data), "utf_8"))
+        if data["version"] != self.version:
+            raise ValueError("Unsupported version: {}"
+                             .format(repr(data["version"])))
+        format = aeidon.formats.find_item("name", data["format"])
+        newline = aeidon.newlines.find_item("name", data["newline"])
+        file = aeidon.files.new(format, path, data["encoding"], newline)
+        file.set_properties(data["properties"])
+        mode = aeidon.modes.find_item("name", data["mode"])
+        subtitles = []
+        for start, end, text, record in zip(data["starts"],
+                                            data["ends"],
+                                            data["texts"],
+                                            data["records"]):
+
+            subtitle = aeidon.Subtitle(mode)
+            subtitle._start = start
+            subtitle._end = end
+            subtitle._main_text = text
+            if record is not None:
+                file._set_record(subtitle, record)
+            subtitles.append(subtitle)
+        aeidon.containers.decode_table(data["containers"], subtitles)
+        return file, subtitles
+
+    def _encode(self, file, subtitles):
+        """Return entry data encoded from `file` and `subtitles`."""
+        mode = subtitles[0].mode if subtitles else file.mode
+        data = dict(version=self.version,
+                    format=file.format.name,
+                    encoding=file.encoding,
+                    newline=file.newline.name,
+                    properties=file.get_properties(),
+                    mode=mode.name,
+                    starts=[x._start for x in subtitles],
+                    ends=[x._end for x in subtitles],
+                    texts=[x._main_text for x in subtitles],
+                    records=[self._encode_record(file, x)
+                             for x in subtitles],
+                    containers=aeidon.containers.encode_table(subtitles))
+
+        data = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+        return zlib.compress(data.encode("utf_8"), 1)
+
+    def _encode_record(self, file, subtitle):
+        """Return text of unmodified record of `subtitle` or ``None``."""
+        record = subtitle._record
+        if record is None: return None
+        key, text, start, end, main_text = record
+        if (key == file._get_record_key() and
+            subtitle._start == start and
+            subtitle._end == end and
+            subtitle._main_text == main_text):
+            return text
+        return None
+
+    def _evict(self):
+        """Remove least recently used entries exceeding `max_size`."""
+        entries = []
+        for path in self._list_entries():
+            with aeidon.util.silent(OSError):
+                stat = os.stat(path)
+                entries.append((stat.st_mtime_ns, stat.st_size, path))
+        total = 0
+        for mtime, size, path in sorted(entries, reverse=True):
+            if total + size <= self.max_size:
+                total += size
+                continue
+            with aeidon.util.silent(OSError):
+                os.remove(path)
+        self._size = total
+
+    def get(self, path, encoding):
+        """
+        Return file and subtitles of `path` or ``None`` if not cached.
+
+        `encoding` should be the encoding requested when opening the file,
+        which can also be a sequence of encodings to try in order.
+        """
+        entry = self._get_entry_path(path, encoding)
+        if entry is None: return None
+        try:
+            with open(entry, "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+        try:
+            file, subtitles = self._decode(path, data)
+        except Exception:
+            # Remove entries that fail to decode,
+            # e.g. from an older version of the cache.
+            with aeidon.util.silent(OSError):
+                os.remove(entry)
+            return None
+        # Modification time of the entry
+        # is used to track recent use.
+        with aeidon.util.silent(OSError):
+            os.utime(entry)
+        return file, subtitles
+
+    def _get_entry_path(self, path, encoding):
+        """Return path of cache entry for `path` or ``None``."""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        if not isinstance(encoding, str):
+            encoding = list(encoding)
+        key = json.dumps([os.path.abspath(path),
+                          stat.st_size,
+                          stat.st_mtime_ns,
+                          encoding])
+
+        name = hashlib.sha1(key.encode("utf_8")).hexdigest()
+        return os.path.join(self.directory, "{}.cache".format(name))
+
+    def _list_entries(self):
+        """Return a list of paths of all cache entries."""
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return []
+        return [os.path.join(self.directory, x)
+                for x in names if x.endswith(".cache")]
+
+    def put(self, path, encoding, file, subtitles):
+        """
+        Save `file` and `subtitles` read from `path` to the cache.
+
+        `encoding` should be the encoding requested when opening the file,
+        which can also be a sequence of encodings to try in order.
+        """
+        # Records of lazy containers can only be written verbatim
+        # as long as the containers have not been decoded.
+        lazy = aeidon.containers.LazySubStationAlpha
+        if any(x.has_container("ssa") and isinstance(x.ssa, lazy)
+               for x in subtitles): return
+        entry = self._get_entry_path(path, encoding)
+        if entry is None: return
+        with aeidon.util.silent(OSError, TypeError, ValueError):
+            data = self._encode(file, subtitles)
+            if self._size is None:
+                self._size = sum(map(_get_size, self._list_entries()))
+            self._size -= _get_size(entry)
+            aeidon.util.makedirs(self.directory)
+            with aeidon.util.atomic_open(entry, "wb") as f:
+                f.write(data)
+            self._size += len(data)
+            if self._size > self.max_size:
+                self._evict()
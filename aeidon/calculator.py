@@ -21,6 +21,14 @@ import aeidon
 
 __all__ = ("Calculator",)
 
+# Lookup tables of zero-padded fields used to format times without calling
+# str.format separately for each field of each time.
+_HOURS = tuple("{:02d}".format(x) for x in range(100))
+_MINUTES_SECONDS = tuple("{:02d}:{:02d}".format(*divmod(x, 60))
+                         for x in range(3600))
+
+_MILLISECONDS = tuple("{:03d}".format(x) for x in range(1000))
+
 
 class Calculator:
 
@@ -29,6 +37,15 @@ class Calculator:
 
     Times are handled as strings, frames as integers and seconds as floats.
     Only one instance of :class:`Calculator` exists for a given framerate.
+
+    Additionally, positions can be converted to and from integer milliseconds,
+    which :class:`aeidon.Subtitle` uses internally to store times in order to
+    avoid parsing and formatting strings in calculations.
+
+    Methods with plural names, e.g. :meth:`seconds_to_times` and
+    :meth:`to_seconds_many`, convert entire sequences of positions at once and
+    return lists. These avoid per-item type dispatch and are preferred when
+    converting whole columns of data.
     """
 
     _instances = {}
@@ -86,6 +103,17 @@ class Calculator:
         seconds = self.frame_to_seconds(frame)
         return self.seconds_to_time(seconds)
 
+    def frames_to_seconds(self, frames):
+        """Convert sequence of `frames` to a list of seconds."""
+        framerate = self._framerate
+        return [x / framerate for x in frames]
+
+    def frames_to_times(self, frames):
+        """Convert sequence of `frames` to a list of times."""
+        framerate = self._framerate
+        return self.milliseconds_to_times(
+            round(1000 * x / framerate) for x in frames)
+
     def get_middle(self, x, y):
         """Return time, frame or seconds halfway between `x` and `y`."""
         if aeidon.is_time(x):
@@ -141,6 +169,25 @@ class Calculator:
                 0 <= seconds  <=  59 and
                 0 <= mseconds <= 999)
 
+    def milliseconds_to_time(self, milliseconds):
+        """Convert integer `milliseconds` to time."""
+        sign = ""
+        if milliseconds < 0:
+            sign = "-"
+            milliseconds = -milliseconds
+        if milliseconds > 359999999:
+            return sign + "99:59:59.999"
+        seconds, milliseconds = divmod(milliseconds, 1000)
+        hours, seconds = divmod(seconds, 3600)
+        return "".join((sign,
+                        _HOURS[hours], ":",
+                        _MINUTES_SECONDS[seconds], ".",
+                        _MILLISECONDS[milliseconds]))
+
+    def milliseconds_to_times(self, milliseconds):
+        """Convert sequence of integer `milliseconds` to a list of times."""
+        return list(map(self.milliseconds_to_time, milliseconds))
+
     def normalize_time(self, time):
         """
         Convert `time` to valid format.
@@ -188,30 +235,34 @@ class Calculator:
 
     def seconds_to_time(self, seconds):
         """Convert `seconds` to time."""
-        sign = ("-" if seconds < 0 else "")
-        seconds = abs(round(seconds, 3))
-        if seconds > 359999.999:
-            return "{}99:59:59.999".format(sign)
-        return ("{}{:02.0f}:{:02.0f}:{:02.0f}.{:03.0f}"
-                .format(sign,
-                        seconds // 3600,
-                        (seconds % 3600) // 60,
-                        int(seconds % 60),
-                        (seconds % 1) * 1000))
+        return self.milliseconds_to_time(round(seconds * 1000))
+
+    def seconds_to_times(self, seconds):
+        """Convert sequence of `seconds` to a list of times."""
+        return self.milliseconds_to_times(round(x * 1000) for x in seconds)
 
     def time_to_frame(self, time):
         """Convert `time` to frame."""
         seconds = self.time_to_seconds(time)
         return self.seconds_to_frame(seconds)
 
+    def time_to_milliseconds(self, time):
+        """Convert `time` to integer milliseconds."""
+        if time.startswith("-"):
+            return -self.time_to_milliseconds(time[1:])
+        return (int(time[ :2]) * 3600000 +
+                int(time[3:5]) *   60000 +
+                int(time[6:8]) *    1000 +
+                int(time[9: ]))
+
     def time_to_seconds(self, time):
         """Convert `time` to seconds."""
-        coefficient = (-1 if time.startswith("-") else 1)
-        time = (time[1:] if time.startswith("-") else time)
-        return coefficient * sum((float(time[ :2]) * 3600,
-                                  float(time[3:5]) * 60,
-                                  float(time[6:8]),
-                                  float(time[9: ]) / 1000))
+        return self.time_to_milliseconds(time) / 1000
+
+    def times_to_seconds(self, times):
+        """Convert sequence of `times` to a list of seconds."""
+        time_to_milliseconds = self.time_to_milliseconds
+        return [time_to_milliseconds(x) / 1000 for x in times]
 
     def to_frame(self, pos):
         """Convert `pos` to frame."""
@@ -224,6 +275,30 @@ class Calculator:
         raise ValueError("Invalid type for pos: {}"
                          .format(repr(type(pos))))
 
+    def to_frames_many(self, positions):
+        """Convert sequence of `positions` to a list of frames."""
+        positions = list(positions)
+        types = set(map(type, positions))
+        if types == {str}:
+            return [self.time_to_frame(x) for x in positions]
+        if types == {int}:
+            return positions
+        if types == {float}:
+            framerate = self._framerate
+            return [int(round(x * framerate, 0)) for x in positions]
+        return list(map(self.to_frame, positions))
+
+    def to_milliseconds(self, pos):
+        """Convert `pos` to integer milliseconds."""
+        if aeidon.is_time(pos):
+            return self.time_to_milliseconds(pos)
+        if aeidon.is_frame(pos):
+            return round(1000 * pos / self._framerate)
+        if aeidon.is_seconds(pos):
+            return round(1000 * pos)
+        raise ValueError("Invalid type for pos: {}"
+                         .format(repr(type(pos))))
+
     def to_seconds(self, pos):
         """Convert `pos` to seconds."""
         if aeidon.is_time(pos):
@@ -235,6 +310,18 @@ class Calculator:
         raise ValueError("Invalid type for pos: {}"
                          .format(repr(type(pos))))
 
+    def to_seconds_many(self, positions):
+        """Convert sequence of `positions` to a list of seconds."""
+        positions = list(positions)
+        types = set(map(type, positions))
+        if types == {str}:
+            return self.times_to_seconds(positions)
+        if types == {int}:
+            return self.frames_to_seconds(positions)
+        if types == {float}:
+            return positions
+        return list(map(self.to_seconds, positions))
+
     def to_time(self, pos):
         """Convert `pos` to time."""
         if aeidon.is_time(pos):
@@ -245,3 +332,15 @@ class Calculator:
             return self.seconds_to_time(pos)
         raise ValueError("Invalid type for pos: {}"
                          .format(repr(type(pos))))
+
+    def to_times_many(self, positions):
+        """Convert sequence of `positions` to a list of times."""
+        positions = list(positions)
+        types = set(map(type, positions))
+        if types == {str}:
+            return positions
+        if types == {int}:
+            return self.frames_to_times(positions)
+        if types == {float}:
+            return self.seconds_to_times(positions)
+        return list(map(self.to_time, positions))
@@ -0,0 +1,382 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2005 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Headless batch conversion of subtitle files.
+
+Files are converted independently of each other in a pool of worker
+processes, each file with its own :class:`aeidon.Project`. Timing and
+possible failure of each file are reported as files are finished and
+a summary is printed at the end.
+"""
+
+import aeidon
+import argparse
+import concurrent.futures
+import json
+import os
+import sys
+import time
+import traceback
+
+from aeidon.i18n import _
+
+# Pattern managers are slow to initialize and are
+# thus cached per process, keyed by pattern type.
+_pattern_managers = {}
+
+
+def convert(path, output, options):
+    """
+    Convert file at `path` and write it to `output`.
+
+    `options` should be a namespace of parsed command line arguments.
+    Return the amount of subtitles written.
+
+    Raise :exc:`IOError` if reading or writing fails.
+    Raise :exc:`UnicodeError` if decoding or encoding fails.
+    Raise :exc:`aeidon.FormatError` if unable to detect format.
+    Raise :exc:`aeidon.ParseError` if parsing fails.
+    """
+    encoding = options.encoding
+    if encoding == "auto":
+        encoding = aeidon.encodings.detect(path)
+        if encoding is None:
+            raise UnicodeError("Failed to detect encoding")
+    project = aeidon.Project(options.framerate)
+    project.open_main(path, encoding)
+    doc = aeidon.documents.MAIN
+    if options.shift:
+        project.shift_positions(None, options.shift, register=None)
+    if options.output_framerate is not None:
+        project.convert_framerate(None,
+                                  project.framerate,
+                                  options.output_framerate,
+                                  register=None)
+
+    if options.correct_common_errors:
+        patterns = _get_patterns("common-error", options.language)
+        project.correct_common_errors(None, doc, patterns, register=None)
+    if options.remove_hearing_impaired:
+        patterns = _get_patterns("hearing-impaired", options.language)
+        project.remove_hearing_impaired(None, doc, patterns, register=None)
+    source = project.main_file
+    file = aeidon.files.new(options.format or source.format,
+                            output,
+                            options.output_encoding or source.encoding,
+                            options.newline or source.newline)
+
+    aeidon.util.makedirs(os.path.dirname(output))
+    project.save_main(file)
+    return len(project.subtitles)
+
+def _convert_task(task):
+    """Convert file of `task` and return a result dictionary."""
+    path, output, options = task
+    start = time.time()
+    result = dict(path=path, output=output, error=None, subtitles=0)
+    try:
+        result["subtitles"] = convert(path, output, options)
+    except Exception as error:
+        result["error"] = "".join(traceback.format_exception_only(
+            type(error), error)).strip()
+    result["time"] = time.time() - start
+    return result
+
+def _find_files(paths):
+    """Return a list of tuples of files and their root paths."""
+    extensions = tuple(set(x.extension for x in aeidon.formats))
+    files = []
+    for path in paths:
+        if not os.path.isdir(path):
+            files.append((path, os.path.dirname(path)))
+            continue
+        for root, dirs, names in os.walk(path):
+            dirs.sort()
+            for name in sorted(names):
+                if not name.endswith(extensions): continue
+                files.append((os.path.join(root, name), path))
+    return files
+
+def _get_output_path(path, root, options):
+    """Return path to write converted file at `path` to."""
+    if options.output_dir is None:
+        output = path
+    else:
+        relative = os.path.relpath(path, root)
+        output = os.path.join(options.output_dir, relative)
+    if options.format is None: return output
+    return aeidon.util.replace_extension(output, options.format)
+
+def _get_patterns(pattern_type, code):
+    """Return patterns of `pattern_type` for `code`."""
+    if not pattern_type in _pattern_managers:
+        manager = aeidon.PatternManager(pattern_type)
+        _pattern_managers[pattern_type] = manager
+    manager = _pattern_managers[pattern_type]
+    script, language, country = (code.split("-") + [None, None])[:3]
+    return manager.get_patterns(script, language, country)
+
+def main(args):
+    """Convert files given as command line arguments `args`."""
+    options = _parse_args(args)
+    files = _find_files(options.paths)
+    tasks = [(x, _get_output_path(x, root, options), options)
+             for x, root in files]
+
+    if not options.in_place:
+        for path, output, _options in tasks:
+            if os.path.abspath(output) != os.path.abspath(path): continue
+            raise SystemExit(_("Refusing to overwrite {} without --in-place")
+                             .format(repr(path)))
+
+    start = time.time()
+    results = []
+    for result in _run(tasks, options.jobs):
+        _print_result(result)
+        results.append(result)
+    summary = _summarize(results, time.time() - start, options.jobs)
+    _print_summary(summary)
+    if options.summary is not None:
+        with open(options.summary, "w", encoding="utf_8") as f:
+            json.dump(summary, f, indent=2)
+            f.write("\n")
+    raise SystemExit(1 if summary["failed"] else 0)
+
+def _parse_args(args):
+    """Parse and return command line arguments `args`."""
+    parser = argparse.ArgumentParser(
+        prog="aeidon",
+        usage=_("aeidon [OPTION...] PATH..."),
+        description=_("Convert subtitle files in batch"))
+
+    parser.add_argument(
+        "paths",
+        metavar=_("PATH..."),
+        nargs="+",
+        help=_("subtitle files or directories of subtitle files to convert"))
+
+    parser.add_argument(
+        "--version",
+        action="version",
+        version="aeidon {}".format(aeidon.__version__))
+
+    parser.add_argument(
+        "-o", "--output-dir",
+        action="store",
+        metavar=_("DIRECTORY"),
+        dest="output_dir",
+        default=None,
+        help=_("write converted files under directory"))
+
+    parser.add_argument(
+        "-i", "--in-place",
+        action="store_true",
+        dest="in_place",
+        default=False,
+        help=_("allow overwriting original files"))
+
+    parser.add_argument(
+        "-f", "--format",
+        action="store",
+        metavar=_("FORMAT"),
+        dest="format",
+        default=None,
+        type=_parse_format,
+        help=_("convert to format, e.g. 'subrip'"))
+
+    parser.add_argument(
+        "-e", "--encoding",
+        action="store",
+        metavar=_("ENCODING"),
+        dest="encoding",
+        default=None,
+        type=_parse_encoding,
+        help=_("set the character encoding used to open files"))
+
+    parser.add_argument(
+        "--output-encoding",
+        action="store",
+        metavar=_("ENCODING"),
+        dest="output_encoding",
+        default=None,
+        type=_parse_encoding,
+        help=_("convert to character encoding"))
+
+    parser.add_argument(
+        "--framerate",
+        action="store",
+        metavar=_("FPS"),
+        dest="framerate",
+        default=None,
+        type=_parse_framerate,
+        help=_("set the framerate used to open files"))
+
+    parser.add_argument(
+        "--output-framerate",
+        action="store",
+        metavar=_("FPS"),
+        dest="output_framerate",
+        default=None,
+        type=_parse_framerate,
+        help=_("convert positions to framerate"))
+
+    parser.add_argument(
+        "--newline",
+        action="store",
+        metavar=_("NEWLINE"),
+        dest="newline",
+        default=None,
+        type=_parse_newline,
+        help=_("convert to newlines: 'mac', 'unix' or 'windows'"))
+
+    parser.add_argument(
+        "-s", "--shift",
+        action="store",
+        metavar=_("SECONDS"),
+        dest="shift",
+        default=0.0,
+        type=float,
+        help=_("shift positions by seconds, negative to make earlier"))
+
+    parser.add_argument(
+        "--correct-common-errors",
+        action="store_true",
+        dest="correct_common_errors",
+        default=False,
+        help=_("correct common human and OCR errors in texts"))
+
+    parser.add_argument(
+        "--remove-hearing-impaired",
+        action="store_true",
+        dest="remove_hearing_impaired",
+        default=False,
+        help=_("remove hearing impaired parts from texts"))
+
+    parser.add_argument(
+        "-l", "--language",
+        action="store",
+        metavar=_("CODE"),
+        dest="language",
+        default="Latn",
+        help=_("set language of texts for corrections, e.g. 'Latn-en-US'"))
+
+    parser.add_argument(
+        "-j", "--jobs",
+        action="store",
+        metavar=_("NUMBER"),
+        dest="jobs",
+        default=os.cpu_count() or 1,
+        type=int,
+        help=_("convert number of files in parallel"))
+
+    parser.add_argument(
+        "--summary",
+        action="store",
+        metavar=_("FILE"),
+        dest="summary",
+        default=None,
+        help=_("write summary of conversion to file as JSON"))
+
+    options = parser.parse_args(args)
+    options.encoding = (options.encoding or
+                        aeidon.util.get_default_encoding())
+    options.jobs = max(1, options.jobs)
+    return options
+
+def _parse_encoding(value):
+    """Return encoding code corresponding to `value`."""
+    if value == "auto": return value
+    try:
+        return aeidon.encodings.translate_code(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            _("invalid encoding: {}").format(repr(value)))
+
+def _parse_format(value):
+    """Return :attr:`aeidon.formats` item corresponding to `value`."""
+    for format in aeidon.formats:
+        if format.name.lower() == value.lower().replace("-", "_"):
+            return format
+    raise argparse.ArgumentTypeError(
+        _("invalid format: {}").format(repr(value)))
+
+def _parse_framerate(value):
+    """Return :attr:`aeidon.framerates` item corresponding to `value`."""
+    with aeidon.util.silent(ValueError):
+        fps = float(value)
+        for framerate in aeidon.framerates:
+            if abs(framerate.value - fps) < 0.01:
+                return framerate
+    raise argparse.ArgumentTypeError(
+        _("invalid framerate: {}").format(repr(value)))
+
+def _parse_newline(value):
+    """Return :attr:`aeidon.newlines` item corresponding to `value`."""
+    for newline in aeidon.newlines:
+        if newline.name.lower() == value.lower():
+            return newline
+    raise argparse.ArgumentTypeError(
+        _("invalid newline: {}").format(repr(value)))
+
+def _print_result(result):
+    """Print the outcome of converting a single file."""
+    if result["error"] is None:
+        print("{:8.3f} s  {} -> {}".format(
+            result["time"], result["path"], result["output"]))
+    else:
+        print("{:8.3f} s  {}: {}".format(
+            result["time"], result["path"], result["error"]),
+              file=sys.stderr)
+
+def _print_summary(summary):
+    """Print summary of conversion."""
+    print(_("Converted {:d} of {:d} files in {:.3f} s ({:.1f} files/s)")
+          .format(summary["converted"],
+                  summary["total"],
+                  summary["time"],
+                  summary["rate"]))
+
+    if summary["failed"]:
+        print(_("Failed to convert {:d} files:").format(summary["failed"]))
+        for result in summary["failures"]:
+            print("  {}: {}".format(result["path"], result["error"]))
+
+def _run(tasks, jobs):
+    """Convert `tasks` and yield results as they are finished."""
+    if jobs == 1 or len(tasks) < 2:
+        yield from map(_convert_task, tasks)
+        return
+    # Send files to workers in chunks to keep overhead low when converting
+    # large amounts of small files, but small enough chunks to keep all
+    # workers busy until the end.
+    chunksize = max(1, min(32, len(tasks) // (jobs * 4)))
+    with concurrent.futures.ProcessPoolExecutor(jobs) as executor:
+        yield from executor.map(_convert_task, tasks, chunksize=chunksize)
+
+def _summarize(results, elapsed, jobs):
+    """Return a dictionary summarizing `results`."""
+    failures = [x for x in results if x["error"] is not None]
+    return dict(total=len(results),
+                converted=len(results) - len(failures),
+                failed=len(failures),
+                subtitles=sum(x["subtitles"] for x in results),
+                jobs=jobs,
+                time=elapsed,
+                rate=len(results) / max(elapsed, 1e-9),
+                failures=failures,
+                files=results)
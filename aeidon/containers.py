@@ -17,6 +17,8 @@
 
 """Containers for additional format-specific subtitle attributes."""
 
+import aeidon
+
 
 class SubRip:
 
@@ -60,6 +62,87 @@ class SubStationAlpha:
     effect = ""
 
 
+class LazySubStationAlpha(SubStationAlpha):
+
+    """
+    Sub Station Alpha attributes decoded from a file on first access.
+
+    :ivar _decode: Function to call with the container to decode attributes
+
+    Before any attribute is accessed or set, the container holds only the
+    data needed to decode the attributes. On first access the attributes are
+    decoded and the container turns into a regular :class:`SubStationAlpha`.
+    """
+
+    def __init__(self, decode):
+        """Initialize a :class:`LazySubStationAlpha` instance."""
+        object.__setattr__(self, "_decode", decode)
+
+    def __getattribute__(self, name):
+        """Return value of attribute `name`, decoding if needed."""
+        if name.startswith("_"):
+            return object.__getattribute__(self, name)
+        self._load()
+        return getattr(self, name)
+
+    def __setattr__(self, name, value):
+        """Set value of attribute `name`, decoding first if needed."""
+        self._load()
+        setattr(self, name, value)
+
+    def _load(self):
+        """Decode attributes and turn into a regular container."""
+        decode = self._decode
+        del self._decode
+        object.__setattr__(self, "__class__", SubStationAlpha)
+        decode(self)
+
+
+def decode_table(data, subtitles):
+    """
+    Set containers of `subtitles` from `data` of :func:`encode_table`.
+
+    Raise :exc:`ValueError` if `data` contains unknown containers.
+    """
+    for name, (fields, rows) in data.items():
+        if not name in aeidon.subtitle._CONTAINERS:
+            raise ValueError("Invalid container: {}"
+                             .format(repr(name)))
+        for row in rows:
+            container = new(name)
+            vars(container).update(zip(fields, row[1:]))
+            setattr(subtitles[row[0]], name, container)
+
+def encode_table(subtitles):
+    """
+    Return a dictionary of containers of `subtitles` as rows of values.
+
+    Containers of each name are kept as rows of values of the same attributes
+    to avoid repeating attribute names for every subtitle. Returned dictionary
+    maps names of containers to a tuple of attribute names and rows, each of
+    which starts with the index of the subtitle. Lazy containers are decoded
+    into copies, leaving the containers themselves lazy.
+    """
+    table = {}
+    for name in aeidon.subtitle._CONTAINERS:
+        items = [(i, getattr(x, name)) for i, x in enumerate(subtitles)
+                 if x.has_container(name)]
+
+        if not items: continue
+        items = [(i, _get_attributes(x)) for i, x in items]
+        fields = list(dict.fromkeys(key for i, x in items for key in x))
+        rows = [[i] + [x.get(key) for key in fields] for i, x in items]
+        table[name] = (fields, rows)
+    return table
+
+def _get_attributes(container):
+    """Return a dictionary of attributes set in `container`."""
+    if isinstance(container, LazySubStationAlpha):
+        copy = SubStationAlpha()
+        container._decode(copy)
+        return dict(vars(copy))
+    return dict(vars(container))
+
 def new(name):
     """Return a new container instance given the container's `name`."""
     if name == "ssa":
@@ -189,9 +189,15 @@ def revertable(function):
             value = function(*args, **kwargs)
         finally:
             project.unblock(register.signal)
+        changed = (project.main_changed != main_changed or
+                   project.tran_changed != tran_changed)
+
+        if changed:
+            # Merge only actions of outermost calls, since nested
+            # calls are grouped as one action by the caller.
+            project.coalesce_actions(register)
         project.cut_reversion_stacks()
-        if (project.main_changed != main_changed or
-            project.tran_changed != tran_changed):
+        if changed:
             project.emit_action_signal(register)
         return value
     return wrapper
@@ -23,7 +23,9 @@ For functions dealing with character encodings, see also :mod:`aeidon.util`.
 
 import aeidon
 import codecs
+import concurrent.futures
 import locale
+import os
 import re
 
 from aeidon.i18n import _
@@ -165,22 +167,77 @@ def code_to_name(code):
     raise ValueError("Code {} not found"
                      .format(repr(code)))
 
+def decode(data, encodings, size=65536):
+    """
+    Decode `data` trying `encodings` in order and return text and encoding.
+
+    `encodings` is a sequence of codes, which can include ``"auto"`` to try the
+    encoding detected from `data`. Decoding is done incrementally in chunks of
+    `size` bytes, which allows giving up on a candidate encoding at the first
+    error without decoding the rest of `data`.
+
+    Raise :exc:`UnicodeError` if decoding fails with all encodings.
+    """
+    data = memoryview(data)
+    for encoding in encodings:
+        if encoding == "auto":
+            encoding = detect_from_bytes(bytes(data))
+            if encoding is None: continue
+        decoder = codecs.getincrementaldecoder(encoding)("strict")
+        chunks = []
+        try:
+            for i in range(0, len(data), size):
+                chunks.append(decoder.decode(data[i:i+size]))
+            chunks.append(decoder.decode(b"", final=True))
+        except UnicodeError:
+            continue
+        return "".join(chunks), encoding
+    raise UnicodeError("Failed to decode with any of {}"
+                       .format(repr(tuple(encodings))))
+
 def detect(path):
     """
     Detect the encoding of file at `path` and return code or ``None``.
 
+    Results are cached by path, size and modification time of the file.
     Raise :exc:`IOError` if reading fails.
     """
-    bom_encoding = detect_bom(path)
+    stat = os.stat(path)
+    return _detect_cached(os.path.abspath(path),
+                          stat.st_size,
+                          stat.st_mtime_ns)
+
+@aeidon.deco.memoize(1000)
+def _detect_cached(path, size, mtime):
+    """Detect the encoding of file at `path` and return code or ``None``."""
+    with open(path, "rb") as f:
+        return detect_from_bytes(f.read())
+
+def detect_from_bytes(data, size=65536):
+    """
+    Detect the encoding of `data` and return code or ``None``.
+
+    Only the first `size` bytes of `data` are fed to :mod:`chardet`.
+    """
+    bom_encoding = detect_bom_from_bytes(data)
     if bom_encoding is not None:
         return bom_encoding
+    # Legacy 8-bit encoded text is very unlikely to be valid UTF-8, so if
+    # strict decoding succeeds, there is no need for the much slower chardet.
+    # Plain ASCII is reported as such, same as chardet does. Null bytes
+    # indicate UTF-16 or UTF-32 without a BOM, leave those to chardet.
+    if not b"\x00" in data:
+        with aeidon.util.silent(UnicodeDecodeError):
+            data.decode("ascii", "strict")
+            return "ascii"
+        with aeidon.util.silent(UnicodeDecodeError):
+            data.decode("utf_8", "strict")
+            return "utf_8"
     from chardet import universaldetector
     detector = universaldetector.UniversalDetector()
-    with open(path, "rb") as f:
-        detector.reset()
-        for line in f:
-            detector.feed(line)
-            if detector.done: break
+    for line in data[:size].splitlines(True):
+        detector.feed(line)
+        if detector.done: break
     detector.close()
     code = detector.result["encoding"]
     if code is None: return None
@@ -192,23 +249,40 @@ def detect(path):
     except ValueError:
         return None
 
+def detect_many(paths, threads=None):
+    """
+    Detect the encodings of files at `paths` and return list of codes.
+
+    Files are read and detected in a pool of `threads` threads, ``None`` to
+    use the default amount. Codes are returned in the same order as `paths`,
+    with ``None`` for files whose encoding could not be detected.
+
+    Raise :exc:`IOError` if reading fails.
+    """
+    with concurrent.futures.ThreadPoolExecutor(threads) as executor:
+        return list(executor.map(detect, paths))
+
 def detect_bom(path):
     """Return corresponding encoding if BOM found, else ``None``."""
     with open(path, "rb") as f:
         line = f.readline()
-    if (line.startswith(codecs.BOM_UTF32_BE) and
+    return detect_bom_from_bytes(line)
+
+def detect_bom_from_bytes(data):
+    """Return corresponding encoding if `data` starts with BOM, else ``None``."""
+    if (data.startswith(codecs.BOM_UTF32_BE) and
         is_valid_code("utf_32_be")):
         return "utf_32_be"
-    if (line.startswith(codecs.BOM_UTF32_LE) and
+    if (data.startswith(codecs.BOM_UTF32_LE) and
         is_valid_code("utf_32_le")):
         return "utf_32_le"
-    if (line.startswith(codecs.BOM_UTF8) and
+    if (data.startswith(codecs.BOM_UTF8) and
         is_valid_code("utf_8_sig")):
         return "utf_8_sig"
-    if (line.startswith(codecs.BOM_UTF16_BE) and
+    if (data.startswith(codecs.BOM_UTF16_BE) and
         is_valid_code("utf_16_be")):
         return "utf_16_be"
-    if (line.startswith(codecs.BOM_UTF16_LE) and
+    if (data.startswith(codecs.BOM_UTF16_LE) and
         is_valid_code("utf_16_le")):
         return "utf_16_le"
     return None
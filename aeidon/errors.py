@@ -61,9 +61,14 @@ class ParseError(Error):
 
     :exc:`ParseError` is caused by either a syntax error in the file being
     parsed or a programming error in the code doing the parsing.
+
+    :ivar format: :attr:`aeidon.formats` item of the file or ``None``
     """
 
-    pass
+    def __init__(self, *args, format=None):
+        """Initialize a :exc:`ParseError` instance."""
+        Error.__init__(self, *args)
+        self.format = format
 
 
 class ProcessError(Error):
@@ -19,8 +19,10 @@
 
 import aeidon
 import codecs
+import contextlib
+import io
+import mmap
 import os
-import re
 
 __all__ = ("SubtitleFile",)
 
@@ -36,12 +38,26 @@ class SubtitleFile:
     :ivar has_utf_16_bom: True if BOM found for UTF-16-BE or UTF-16-LE
     :ivar header: String of metadata at the top of the file
     :ivar newline: :attr:`aeidon.newlines` item, detected upon read
-    :ivar path: Full, absolute path to the file on disk
+    :ivar path: Full, absolute path to the file on disk or ``None``
+    :ivar _text: Decoded text read in advance or ``None``
 
     If the file format contains a header, it will default to a fairly blank
     template header read upon instantiation of the class, from either
     ``aeidon.DATA_DIR/headers`` or ``aeidon.DATA_HOME_DIR/headers``. If the
     read file contains a header, it will replace the template.
+
+    Files need not exist on disk. Files read from memory, see
+    :func:`aeidon.files.load_from_bytes`, can have `path` ``None`` and are
+    read from text given in advance. Any file can be written to a file object
+    instead of `path` using :meth:`write_to_stream`.
+
+    Formats can keep the raw text of each record read along with the
+    subtitle (see :meth:`_set_record`) and when writing, write records of
+    subtitles whose positions and texts have not been changed verbatim (see
+    :meth:`_get_record`). This keeps unchanged parts of the file intact
+    regardless of differences in how the file was originally formatted, e.g.
+    zero-padding and rounding of times, and makes writing mostly unchanged
+    files faster.
     """
     format = aeidon.formats.NONE
     mode = aeidon.modes.NONE
@@ -54,7 +70,8 @@ class SubtitleFile:
                        if self.format.has_header else "")
 
         self.newline = newline or aeidon.util.get_default_newline()
-        self.path = os.path.abspath(path)
+        self.path = os.path.abspath(path) if path is not None else None
+        self._text = None
 
     def copy_from(self, other):
         """Copy generic properties from `other`."""
@@ -62,10 +79,177 @@ class SubtitleFile:
         if self.format != other.format: return
         self.header = other.header
 
+    def get_properties(self):
+        """
+        Return a dictionary of format-specific properties.
+
+        Returned properties exclude those passed when creating the file,
+        i.e. `path`, `encoding` and `newline`, and text read in advance.
+        See :meth:`set_properties`.
+        """
+        properties = dict(vars(self))
+        for name in ("encoding", "newline", "path", "_text"):
+            properties.pop(name, None)
+        return properties
+
+    def _get_record(self, subtitle, doc):
+        """Return unmodified record of `subtitle` or ``None``."""
+        record = subtitle._record
+        if record is None: return None
+        key, text, start, end, main_text = record
+        # Any changes made to the subtitle, whether by editing or
+        # undoing or redoing, are detected by comparing the values
+        # to those decoded from the record when reading.
+        if (key == self._get_record_key() and
+            subtitle._mode == self.mode and
+            subtitle._start == start and
+            subtitle._end == end and
+            subtitle.get_text(doc) == main_text):
+            return text
+        return None
+
+    def _get_record_key(self):
+        """Return data identifying how records of file are formatted."""
+        return self.format
+
     def _get_subtitle(self):
         """Return a new subtitle instance with proper properties."""
         return aeidon.Subtitle(self.mode)
 
+    def _iter_lines(self):
+        """
+        Read file and iterate over lines.
+
+        All newlines are stripped.
+        All blank lines from beginning and end are skipped.
+        Raise :exc:`IOError` if reading fails.
+        Raise :exc:`UnicodeError` if decoding fails.
+        """
+        # Use text read in advance by aeidon.files.load if available
+        # to avoid reading the file again. Release it once used.
+        text, self._text = self._text, None
+        # Split lines the same way as universal newlines mode does,
+        # but keep the original newlines in order to detect them.
+        f = (io.StringIO(text, newline="") if text is not None else
+             open(self.path, "r", encoding=self.encoding, newline=""))
+        with f:
+            lines = self._iter_stripped_lines(f)
+            if self.encoding.startswith("utf_16"):
+                lines = self._iter_utf_16_lines(lines)
+            yield from lines
+
+    def _iter_stripped_lines(self, f):
+        """Iterate over lines of `f` with newlines and blank ends stripped."""
+        blank_lines = []
+        found_newlines = []
+        started = False
+        for line in f:
+            text = line.rstrip("\r\n")
+            newline = line[len(text):]
+            if newline and not newline in found_newlines:
+                found_newlines.append(newline)
+                # This is not actually correct. If both CR and LF are
+                # detected, it could mean a mixture of Mac and Unix newlines
+                # on separate lines or one Windows newline in a mostly
+                # something else file, see aeidon.util.detect_newlines.
+                self.newline = (aeidon.newlines.WINDOWS
+                                if len(found_newlines) > 1 else
+                                aeidon.newlines.find_item("value", newline))
+            if not started and self.encoding == "utf_8":
+                bom = str(codecs.BOM_UTF8, "utf_8")
+                if text.startswith(bom):
+                    # If a UTF-8 BOM (a.k.a. signature) is found, switch to
+                    # UTF-8-SIG encoding, which automatically strips the BOM
+                    # when reading and adds it when writing.
+                    self.encoding = "utf_8_sig"
+                    text = text[len(bom):]
+            if not text.strip():
+                # Hold blank lines until it is known
+                # whether they are at the end or not.
+                if started: blank_lines.append(text)
+                continue
+            if blank_lines:
+                yield from blank_lines
+                blank_lines = []
+            started = True
+            yield text
+
+    def iter_subtitles(self):
+        """
+        Read file and iterate over subtitles.
+
+        Subtitles are parsed one at a time while reading the file, which
+        allows processing large files without keeping all subtitles in memory.
+        Raise :exc:`IOError` if reading fails.
+        Raise :exc:`UnicodeError` if decoding fails.
+        """
+        raise NotImplementedError
+
+    def _iter_utf_16_lines(self, lines):
+        """Iterate over `lines` with UTF-16 specific issues fixed."""
+        # Python automatically strips the UTF-16 BOM when reading, but only
+        # when using UTF-16. If using UTF-16-BE or UTF-16-LE, the BOM is
+        # kept at the beginning of the first line. It is read correctly, so
+        # it should FE FF for both BE and LE.
+        bom = str(codecs.BOM_UTF16_BE, "utf_16_be")
+        # Handle erroneous (?) UTF-16 encoded subtitles that use
+        # NULL-character filled linebreaks '\x00\r\x00\n', which
+        # are interpreted as two separate linebreaks. Lines need to be
+        # buffered only as long as every second line is blank.
+        buffer = []
+        for i, line in enumerate(lines):
+            if i == 0 and line.startswith(bom):
+                self.has_utf_16_bom = True
+                line = line.replace(bom, "")
+            if buffer is None:
+                yield line
+                continue
+            buffer.append(line)
+            if len(buffer) % 2 == 0 and line:
+                yield from buffer
+                buffer = None
+        if buffer is not None:
+            yield from buffer[::2]
+
+    @contextlib.contextmanager
+    def _map(self):
+        """
+        Memory-map file and yield the map and encoding to decode text with.
+
+        Memory-mapped parsing is supported if the file is on disk, is not
+        empty, uses an ASCII-compatible encoding and Unix or Windows newlines.
+        If not supported or if text has been read in advance, yield ``None``
+        for the map. Newlines and a possible UTF-8
+        BOM are detected and set the same way as when reading lines.
+        Raise :exc:`IOError` if reading fails.
+        """
+        encoding = ("utf_8" if self.encoding == "utf_8_sig"
+                    else self.encoding)
+        ascii = bytes(range(128))
+        if (self._text is not None or
+            str(ascii, "ascii").encode(encoding) != ascii):
+            yield None, encoding
+            return
+        with open(self.path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                yield None, encoding
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                i = data.find(b"\n")
+                if i < 0 and data.find(b"\r") >= 0:
+                    # Bytes regular expressions recognize
+                    # only LF as a line boundary.
+                    yield None, encoding
+                    return
+                if i >= 0:
+                    self.newline = (aeidon.newlines.WINDOWS
+                                    if data[i-1:i] == b"\r" else
+                                    aeidon.newlines.UNIX)
+                if (self.encoding == "utf_8" and
+                    data[:3] == codecs.BOM_UTF8):
+                    self.encoding = "utf_8_sig"
+                yield data, encoding
+
     def read(self):
         """
         Read file and return subtitles.
@@ -73,7 +257,7 @@ class SubtitleFile:
         Raise :exc:`IOError` if reading fails.
         Raise :exc:`UnicodeError` if decoding fails.
         """
-        raise NotImplementedError
+        return list(self.iter_subtitles())
 
     def _read_lines(self):
         """
@@ -85,39 +269,28 @@ class SubtitleFile:
         Raise :exc:`UnicodeError` if decoding fails.
         Return a list of lines read.
         """
-        re_newline_char = re.compile(r"\r?\n?$")
-        with open(self.path, "r", encoding=self.encoding) as f:
-            lines = f.readlines()
-            lines = [re_newline_char.sub("", x) for x in lines]
-        for index in (0, -1):
-            while lines and not lines[index].strip():
-                lines.pop(index)
-        newline = aeidon.util.detect_newlines(self.path)
-        if newline is not None:
-            self.newline = newline
-        if self.encoding == "utf_8":
-            bom = str(codecs.BOM_UTF8, "utf_8")
-            if lines and lines[0].startswith(bom):
-                # If a UTF-8 BOM (a.k.a. signature) is found, reread file with
-                # UTF-8-SIG encoding, which automatically strips the BOM when
-                # reading and adds it when writing.
-                self.encoding = "utf_8_sig"
-                return SubtitleFile._read_lines(self)
-        if self.encoding.startswith("utf_16"):
-            # Python automatically strips the UTF-16 BOM when reading, but only
-            # when using UTF-16. If using UTF-16-BE or UTF-16-LE, the BOM is
-            # kept at the beginning of the first line. It is read correctly, so
-            # it should FE FF for both BE and LE.
-            bom = str(codecs.BOM_UTF16_BE, "utf_16_be")
-            if lines and lines[0].startswith(bom):
-                self.has_utf_16_bom = True
-                lines[0] = lines[0].replace(bom, "")
-            # Handle erroneous (?) UTF-16 encoded subtitles that use
-            # NULL-character filled linebreaks '\x00\r\x00\n', which
-            # readlines interprets as two separate linebreaks.
-            if not any(lines[i] for i in range(1, len(lines), 2)):
-                lines = [lines[i] for i in range(0, len(lines), 2)]
-        return lines
+        return list(self._iter_lines())
+
+    def set_properties(self, properties):
+        """
+        Set format-specific properties from `properties`.
+
+        `properties` should be a dictionary returned by
+        :meth:`get_properties`, possibly via serialization, which can turn
+        tuples into lists. Lists are converted back to tuples where expected.
+        """
+        for name, value in properties.items():
+            if isinstance(getattr(self, name, None), tuple):
+                value = tuple(value)
+            setattr(self, name, value)
+
+    def _set_record(self, subtitle, text):
+        """Keep `text` as the unmodified record of `subtitle`."""
+        subtitle._record = (self._get_record_key(),
+                            text,
+                            subtitle._start,
+                            subtitle._end,
+                            subtitle._main_text)
 
     def write(self, subtitles, doc):
         """
@@ -126,20 +299,37 @@ class SubtitleFile:
         Raise :exc:`IOError` if writing fails.
         Raise :exc:`UnicodeError` if encoding fails.
         """
-        with aeidon.util.atomic_open(self.path,
-                                     mode="w",
-                                     encoding=self.encoding,
-                                     newline=self.newline.value) as f:
-
-            # UTF-8-SIG automatically adds the UTF-8 signature BOM. Likewise,
-            # UTF-16 automatically adds the system default BOM, but
-            # UTF-16-BE and UTF-16-LE don't. For the latter two, add the BOM,
-            # if it was originally read in the file.
-            if self.has_utf_16_bom and self.encoding == "utf_16_be":
-                f.write(str(codecs.BOM_UTF16_BE, "utf_16_be"))
-            if self.has_utf_16_bom and self.encoding == "utf_16_le":
-                f.write(str(codecs.BOM_UTF16_LE, "utf_16_le"))
-            self.write_to_file(subtitles, doc, f)
+        with aeidon.util.atomic_open(self.path, mode="wb") as f:
+            self.write_to_stream(subtitles, doc, f)
+
+    def write_to_stream(self, subtitles, doc, f):
+        """
+        Write `subtitles` with text from `doc` to file object `f`.
+
+        `f` can be a binary file object, e.g. :class:`io.BytesIO`, to which
+        text is written encoded with :attr:`encoding` or a text file object,
+        e.g. :class:`io.StringIO`, to which text is written as is. In both
+        cases newlines are written as :attr:`newline`.
+        Raise :exc:`IOError` if writing fails.
+        Raise :exc:`UnicodeError` if encoding fails.
+        """
+        # Collect text written by format-specific code and encode it in
+        # bulk instead of passing each small piece separately through
+        # a text mode wrapper, which adds considerable overhead.
+        binary = not isinstance(f, io.TextIOBase)
+        encoding = self.encoding if binary else None
+        buffer = _EncodingBuffer(f, encoding, self.newline.value)
+        # UTF-8-SIG automatically adds the UTF-8 signature BOM. Likewise,
+        # UTF-16 automatically adds the system default BOM, but
+        # UTF-16-BE and UTF-16-LE don't. For the latter two, add the BOM,
+        # if it was originally read in the file.
+        if binary and self.has_utf_16_bom:
+            if self.encoding == "utf_16_be":
+                buffer.write(str(codecs.BOM_UTF16_BE, "utf_16_be"))
+            if self.encoding == "utf_16_le":
+                buffer.write(str(codecs.BOM_UTF16_LE, "utf_16_le"))
+        self.write_to_file(subtitles, doc, buffer)
+        buffer.flush(final=True)
 
     def write_to_file(self, subtitles, doc, f):
         """
@@ -149,3 +339,53 @@ class SubtitleFile:
         Raise :exc:`UnicodeError` if encoding fails.
         """
         raise NotImplementedError
+
+
+class _EncodingBuffer:
+
+    """
+    Text file-like buffer writing encoded text to a binary file in chunks.
+
+    :cvar chunk_size: Amount of characters to collect before encoding
+    :ivar _chunks: List of strings written, but not yet encoded
+    :ivar _encoder: Incremental encoder of the file's encoding or ``None``
+    :ivar _f: Binary file object to write to
+    :ivar _newline: String to translate ``\\n`` newlines to
+    :ivar _size: Total amount of characters in `_chunks`
+
+    Unless the output exceeds `chunk_size`, the whole file is written with
+    a single call. Larger output is written in chunks in order to keep memory
+    use bounded when writing subtitles as they are generated. If `encoding`
+    is ``None``, text is written to `f` as is, i.e. `f` should be a text file
+    object.
+    """
+
+    chunk_size = 1048576
+
+    def __init__(self, f, encoding, newline):
+        """Initialize an :class:`_EncodingBuffer` instance."""
+        self._chunks = []
+        self._encoder = (codecs.getincrementalencoder(encoding)()
+                         if encoding is not None else None)
+        self._f = f
+        self._newline = newline
+        self._size = 0
+
+    def flush(self, final=False):
+        """Encode and write collected text to file."""
+        text = "".join(self._chunks)
+        if self._newline != "\n":
+            text = text.replace("\n", self._newline)
+        if self._encoder is not None:
+            text = self._encoder.encode(text, final)
+        self._f.write(text)
+        self._chunks = []
+        self._size = 0
+
+    def write(self, text):
+        """Add `text` to be written to file."""
+        self._chunks.append(text)
+        self._size += len(text)
+        if self._size >= self.chunk_size:
+            self.flush()
+        return len(text)
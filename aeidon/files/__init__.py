@@ -42,6 +42,86 @@ def add(cls):
     globals()[cls.__name__] = cls
     __all__.append(cls.__name__)
 
+def load(path, encoding):
+    """
+    Read file at `path` and return a new :class:`aeidon.SubtitleFile` instance.
+
+    The file is read only once and BOM, format, newlines and lines are all
+    detected from the same data. `encoding` can be a single encoding or
+    a sequence of encodings to try in order, see
+    :func:`aeidon.encodings.decode`. If a BOM is found, the corresponding
+    encoding is used instead of `encoding`. Subtitles are parsed from the same
+    data when calling :meth:`aeidon.SubtitleFile.read` of the returned instance.
+
+    Raise :exc:`IOError` if reading fails.
+    Raise :exc:`UnicodeError` if decoding fails.
+    Raise :exc:`aeidon.FormatError` if unable to detect format.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    return load_from_bytes(data, encoding, path)
+
+def load_from_bytes(data, encoding, path=None):
+    """
+    Return a new :class:`aeidon.SubtitleFile` instance for `data`.
+
+    `data` should be the raw bytes of a subtitle file, which are decoded and
+    from which BOM, format and newlines are detected the same way as by
+    :func:`load`. `path` is used only as the path to write the file to,
+    if ``None``, the file can only be written with
+    :meth:`aeidon.SubtitleFile.write_to_stream`. Subtitles can be read only
+    once when calling :meth:`aeidon.SubtitleFile.read` of the returned
+    instance.
+
+    Raise :exc:`UnicodeError` if decoding fails.
+    Raise :exc:`aeidon.FormatError` if unable to detect format.
+    """
+    encodings = [encoding] if isinstance(encoding, str) else encoding
+    bom_encoding = aeidon.encodings.detect_bom_from_bytes(data)
+    if bom_encoding is not None:
+        encodings = [bom_encoding]
+    text, encoding = aeidon.encodings.decode(data, encodings)
+    return load_from_text(text, encoding, path)
+
+def load_from_stream(f, encoding, path=None):
+    """
+    Return a new :class:`aeidon.SubtitleFile` instance for file object `f`.
+
+    `f` can be either a binary file object, which is read and decoded using
+    `encoding` as with :func:`load_from_bytes` or a text file object, which
+    is read as is and `encoding` is used only when writing.
+
+    Raise :exc:`IOError` if reading fails.
+    Raise :exc:`UnicodeError` if decoding fails.
+    Raise :exc:`aeidon.FormatError` if unable to detect format.
+    """
+    data = f.read()
+    if isinstance(data, str):
+        if not isinstance(encoding, str):
+            encoding = list(encoding)[0]
+        return load_from_text(data, encoding, path)
+    return load_from_bytes(data, encoding, path)
+
+def load_from_text(text, encoding, path=None):
+    """
+    Return a new :class:`aeidon.SubtitleFile` instance for `text`.
+
+    `text` should be the decoded text of a subtitle file, from which format
+    and newlines are detected. `encoding` is used only when writing the file.
+    Subtitles can be read only once when calling
+    :meth:`aeidon.SubtitleFile.read` of the returned instance.
+
+    Raise :exc:`aeidon.FormatError` if unable to detect format.
+    """
+    format = aeidon.util.detect_format_from_text(text)
+    if format is None:
+        raise aeidon.FormatError("Failed to detect format of file {}"
+                                 .format(repr(path or "<memory>")))
+
+    file = new(format, path, encoding)
+    file._text = text
+    return file
+
 def new(format, path, encoding, newline=None):
     """Return a new :class:`aeidon.SubtitleFile` instance given `format`."""
     for cls in map(eval, __all__):
@@ -39,16 +39,20 @@ class AdvSubStationAlpha(aeidon.files.SubStationAlpha):
             "Layer", "Start", "End", "Style", "Name",
             "MarginL", "MarginR", "MarginV", "Effect", "Text")
 
-    def _decode_field(self, field_name, value, subtitle):
-        """Save `value` of field as a subtitle attribute."""
+    def _get_decoder(self, field_name):
+        """Return a function to save string value of field to a subtitle."""
         if field_name == "Layer":
-            return setattr(subtitle.ssa, "layer", int(value))
-        decode = aeidon.files.SubStationAlpha._decode_field
-        return decode(self, field_name, value, subtitle)
-
-    def _encode_field(self, field_name, subtitle, doc):
-        """Return value of field as string to be written to file."""
+            def decode(subtitle, value):
+                subtitle.ssa.layer = int(value)
+            return decode
+        get_decoder = aeidon.files.SubStationAlpha._get_decoder
+        return get_decoder(self, field_name)
+
+    def _get_encoder(self, field_name):
+        """Return a function to return value of field as string."""
         if field_name == "Layer":
-            return str(subtitle.ssa.layer)
-        encode = aeidon.files.SubStationAlpha._encode_field
-        return encode(self, field_name, subtitle, doc)
+            def encode(subtitle, doc):
+                return str(subtitle.ssa.layer)
+            return encode
+        get_encoder = aeidon.files.SubStationAlpha._get_encoder
+        return get_encoder(self, field_name)
@@ -31,25 +31,61 @@ class MicroDVD(aeidon.SubtitleFile):
     mode = aeidon.modes.FRAME
     _re_line = re.compile(r"^\{(-?\d+)\}\{(-?\d+)\}(.*?)$")
 
-    def read(self):
+    # Lines of subtitles or the header in raw bytes. The first
+    # line can alternatively be preceded by a UTF-8 BOM.
+    _re_bytes_line = re.compile((rb"(?:^|\A\xef\xbb\xbf)"
+                                 rb"(?:\{(-?\d+)\}\{(-?\d+)\}([^\r\n]*)"
+                                 rb"|(\{DEFAULT\}[^\r\n]*))"),
+                                re.MULTILINE)
+
+    def iter_mapped_subtitles(self):
+        """
+        Read memory-mapped file and iterate over subtitles.
+
+        Lines are found directly from raw bytes and only texts are decoded,
+        which is considerably faster than :meth:`iter_subtitles` for large
+        files. If the encoding or newlines of the file are not supported,
+        :meth:`iter_subtitles` is used instead.
+        Raise :exc:`IOError` if reading fails.
+        Raise :exc:`UnicodeError` if decoding fails.
+        """
+        with self._map() as (data, encoding):
+            if data is None:
+                yield from self.iter_subtitles()
+                return
+            for match in self._re_bytes_line.finditer(data):
+                if match.lastindex == 4:
+                    self.header = str(match.group(4), encoding)
+                    continue
+                subtitle = self._get_subtitle()
+                # Set positions directly in internal units, which
+                # for subtitles in frame mode are integer frames.
+                subtitle._start = int(match.group(1))
+                subtitle._end = int(match.group(2))
+                text = str(match.group(3), encoding)
+                subtitle.main_text = text.replace("|", "\n")
+                line = str(match.group(0), encoding).lstrip("\ufeff")
+                self._set_record(subtitle, line)
+                yield subtitle
+
+    def iter_subtitles(self):
         """
-        Read file and return subtitles.
+        Read file and iterate over subtitles.
 
         Raise :exc:`IOError` if reading fails.
         Raise :exc:`UnicodeError` if decoding fails.
         """
-        subtitles = []
-        for line in self._read_lines():
+        for line in self._iter_lines():
             match = self._re_line.match(line)
             if match is not None:
                 subtitle = self._get_subtitle()
                 subtitle.start_frame = int(match.group(1))
                 subtitle.end_frame = int(match.group(2))
                 subtitle.main_text = match.group(3).replace("|", "\n")
-                subtitles.append(subtitle)
+                self._set_record(subtitle, line)
+                yield subtitle
             elif line.startswith("{DEFAULT}"):
                 self.header = line
-        return subtitles
 
     def write_to_file(self, subtitles, doc, f):
         """
@@ -61,6 +97,10 @@ class MicroDVD(aeidon.SubtitleFile):
         if self.header.strip():
             f.write(self.header + "\n")
         for subtitle in subtitles:
+            line = self._get_record(subtitle, doc)
+            if line is not None:
+                f.write(line + "\n")
+                continue
             text = subtitle.get_text(doc).replace("\n", "|")
             f.write(("{{{:d}}}{{{:d}}}{}\n"
                      .format(subtitle.start_frame,
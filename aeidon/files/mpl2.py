@@ -31,23 +31,22 @@ class MPL2(aeidon.SubtitleFile):
     mode = aeidon.modes.TIME
     _re_line = re.compile(r"^\[(-?\d+)\]\[(-?\d+)\](.*?)$")
 
-    def read(self):
+    def iter_subtitles(self):
         """
-        Read file and return subtitles.
+        Read file and iterate over subtitles.
 
         Raise :exc:`IOError` if reading fails.
         Raise :exc:`UnicodeError` if decoding fails.
         """
-        subtitles = []
-        for line in self._read_lines():
+        for line in self._iter_lines():
             match = self._re_line.match(line)
             if match is None: continue
             subtitle = self._get_subtitle()
             subtitle.start_seconds = float(match.group(1)) / 10
             subtitle.end_seconds = float(match.group(2)) / 10
             subtitle.main_text = match.group(3).replace("|", "\n")
-            subtitles.append(subtitle)
-        return subtitles
+            self._set_record(subtitle, line)
+            yield subtitle
 
     def write_to_file(self, subtitles, doc, f):
         """
@@ -57,6 +56,10 @@ class MPL2(aeidon.SubtitleFile):
         Raise :exc:`UnicodeError` if encoding fails.
         """
         for subtitle in subtitles:
+            line = self._get_record(subtitle, doc)
+            if line is not None:
+                f.write(line + "\n")
+                continue
             text = subtitle.get_text(doc).replace("\n", "|")
             f.write(("[{:.0f}][{:.0f}]{}\n"
                      .format(subtitle.start_seconds*10,
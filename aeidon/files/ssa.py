@@ -18,6 +18,8 @@
 """Sub Station Alpha file."""
 
 import aeidon
+import functools
+import operator
 import re
 
 __all__ = ("SubStationAlpha",)
@@ -28,15 +30,26 @@ class SubStationAlpha(aeidon.SubtitleFile):
     """
     Sub Station Alpha file.
 
+    :cvar lazy: ``True`` to decode format-specific fields on first access
     :ivar event_fields: Tuple of field names for the ``[Events]`` section
+
+    If `lazy` is ``True``, only positions and texts of events are decoded when
+    reading. Other fields are kept raw and decoded when any of them is first
+    accessed, see :class:`aeidon.containers.LazySubStationAlpha`. Events whose
+    format-specific fields have not been accessed and whose positions and texts
+    have not been changed are written back verbatim. Note that in lazy mode
+    errors in format-specific fields are raised only when decoding them.
+
+    `lazy` is the default for all files, which can be overridden for a single
+    file by setting `lazy` of the instance before reading, e.g. via the `lazy`
+    argument of :meth:`aeidon.Project.open_main`.
     """
 
     format = aeidon.formats.SSA
+    lazy = False
     mode = aeidon.modes.TIME
 
-    _re_file_time = re.compile(r"^(-?)(.+)$")
     _re_separator = re.compile(r",\s*")
-    _re_subtitle_time = re.compile(r"(-?)\d(.{10})\d")
 
     def __init__(self, path, encoding, newline=None):
         """Initialize a :class:`SubStationAlpha` instance."""
@@ -51,82 +64,161 @@ class SubStationAlpha(aeidon.SubtitleFile):
         if self.format != other.format: return
         self.event_fields = tuple(other.event_fields)
 
-    def _decode_field(self, field_name, value, subtitle):
-        """Save string `value` from file as a subtitle attribute."""
+    def _decode_container(self, decoders, values, container):
+        """Save format-specific fields from `values` to `container`."""
+        subtitle = self._get_subtitle()
+        subtitle.ssa = container
+        for index, decode in decoders:
+            decode(subtitle, values[index])
+
+    def _decode_time(self, value):
+        """Return time `value` from file as integer milliseconds."""
+        if value.startswith("-"):
+            return -self._decode_time(value[1:])
+        # Times in file have only one digit of hours
+        # and two digits of fractions of seconds.
+        return (int(value[0])     * 3600000 +
+                int(value[2:4])   *   60000 +
+                int(value[5:7])   *    1000 +
+                int(value[8:] + "0"))
+
+    def _encode_time(self, subtitle, position):
+        """Return `position` of `subtitle` as time to be written to file."""
+        calc = subtitle.calc
+        if subtitle.mode == aeidon.modes.FRAME:
+            position = calc.time_to_milliseconds(calc.frame_to_time(position))
+        # Round to centiseconds the same way as calc.round does.
+        milliseconds = round(round(position / 1000, 2) * 1000)
+        time = calc.milliseconds_to_time(milliseconds)
+        # Drop the first digit of hours and the last digit of milliseconds.
+        if time.startswith("-"):
+            return "-" + time[2:-1]
+        return time[1:-1]
+
+    def _get_decoder(self, field_name):
+        """Return a function to save string value of field to a subtitle."""
         if field_name == "Marked":
-            value = int(value.split("=")[-1])
-            return setattr(subtitle.ssa, "marked", value)
+            def decode(subtitle, value):
+                subtitle.ssa.marked = int(value.split("=")[-1])
+            return decode
         if field_name == "Start":
-            value = self._re_file_time.sub(r"\1\060\2\060", value)
-            return setattr(subtitle, "start_time", value)
+            def decode(subtitle, value):
+                subtitle._start = self._decode_time(value)
+            return decode
         if field_name == "End":
-            value = self._re_file_time.sub(r"\1\060\2\060", value)
-            return setattr(subtitle, "end_time", value)
+            def decode(subtitle, value):
+                subtitle._end = self._decode_time(value)
+            return decode
         if field_name == "Text":
-            value = value.replace("\\n", "\n")
-            value = value.replace("\\N", "\n")
-            return setattr(subtitle, "main_text", value)
+            def decode(subtitle, value):
+                value = value.replace("\\n", "\n")
+                value = value.replace("\\N", "\n")
+                subtitle.main_text = value
+            return decode
+        name = aeidon.util.title_to_lower_case(field_name)
         if field_name in ("MarginL", "MarginR", "MarginV"):
-            name = aeidon.util.title_to_lower_case(field_name)
-            return setattr(subtitle.ssa, name, int(value))
+            def decode(subtitle, value):
+                setattr(subtitle.ssa, name, int(value))
+            return decode
         # Set plain string container attribute value.
-        name = aeidon.util.title_to_lower_case(field_name)
-        setattr(subtitle.ssa, name, value)
+        def decode(subtitle, value):
+            setattr(subtitle.ssa, name, value)
+        return decode
 
-    def _encode_field(self, field_name, subtitle, doc):
-        """Return value of field as string to be written to file."""
+    def _get_decoders(self, fields):
+        """Return a tuple of pairs of field indices and decoders."""
+        return tuple((i, self._get_decoder(x)) for i, x in enumerate(fields))
+
+    def _get_encoder(self, field_name):
+        """Return a function to return value of field as string."""
         if field_name == "Marked":
-            return "Marked={:d}".format(subtitle.ssa.marked)
+            def encode(subtitle, doc):
+                return "Marked={:d}".format(subtitle.ssa.marked)
+            return encode
         if field_name == "Start":
-            value = subtitle.calc.round(subtitle.start_time, 2)
-            return self._re_subtitle_time.sub(r"\1\2", value)
+            def encode(subtitle, doc):
+                return self._encode_time(subtitle, subtitle._start)
+            return encode
         if field_name == "End":
-            value = subtitle.calc.round(subtitle.end_time, 2)
-            return self._re_subtitle_time.sub(r"\1\2", value)
+            def encode(subtitle, doc):
+                return self._encode_time(subtitle, subtitle._end)
+            return encode
         if field_name == "Text":
-            value = subtitle.get_text(doc)
-            return value.replace("\n", "\\N")
+            def encode(subtitle, doc):
+                return subtitle.get_text(doc).replace("\n", "\\N")
+            return encode
+        get = operator.attrgetter("ssa.{}".format(
+            aeidon.util.title_to_lower_case(field_name)))
         if field_name in ("MarginL", "MarginR", "MarginV"):
-            name = aeidon.util.title_to_lower_case(field_name)
-            return "{:04d}".format(getattr(subtitle.ssa, name))
+            def encode(subtitle, doc):
+                return "{:04d}".format(get(subtitle))
+            return encode
         # Return plain string container attribute value.
-        name = aeidon.util.title_to_lower_case(field_name)
-        return getattr(subtitle.ssa, name)
-
-    def read(self):
+        def encode(subtitle, doc):
+            return get(subtitle)
+        return encode
+
+    def _get_encoders(self, fields):
+        """Return a tuple of encoders for `fields`."""
+        return tuple(map(self._get_encoder, fields))
+
+    def _get_record(self, subtitle, doc):
+        """Return unmodified event line of `subtitle` or ``None``."""
+        # Format-specific fields are known to be unchanged
+        # only if they have not been decoded at all.
+        if not subtitle.has_container("ssa"): return None
+        container = subtitle.ssa
+        if not isinstance(container, aeidon.containers.LazySubStationAlpha):
+            return None
+        return aeidon.SubtitleFile._get_record(self, subtitle, doc)
+
+    def _get_record_key(self):
+        """Return data identifying how records of file are formatted."""
+        return (self.format, self.event_fields)
+
+    def iter_subtitles(self):
         """
-        Read file and return subtitles.
+        Read file and iterate over subtitles.
 
         Raise :exc:`IOError` if reading fails.
         Raise :exc:`UnicodeError` if decoding fails.
         """
-        subtitles = []
-        lines = self._read_lines()
-        self._read_header(lines)
+        header = []
+        lines = self._iter_lines()
         for line in lines:
-            if not line.startswith("Format:"): continue
-            line = line.replace("Format:", "").strip()
-            fields = self._re_separator.split(line)
-            indices = dict((x, fields.index(x)) for x in fields)
-            max_split = len(fields) - 1
+            if line.startswith("[Events]"): break
+            header.append(line)
+        self.header = "\n".join(header).strip()
         for line in lines:
+            if line.startswith("Format:"):
+                # Resolve how to decode each field once per format line
+                # instead of once per field of every event.
+                line = line.replace("Format:", "").strip()
+                fields = self._re_separator.split(line)
+                decoders = self._get_decoders(fields)
+                positions = tuple(x for x in decoders
+                                  if fields[x[0]] in ("Start", "End", "Text"))
+                others = tuple(x for x in decoders if not x in positions)
+                max_split = len(fields) - 1
+                self.event_fields = tuple(fields)
             if not line.startswith("Dialogue:"): continue
-            line = line.replace("Dialogue:", "").lstrip()
-            values = self._re_separator.split(line, max_split)
+            event = line.replace("Dialogue:", "").lstrip()
+            values = self._re_separator.split(event, max_split)
+            if len(values) < len(fields):
+                raise ValueError("Too few fields in event {}"
+                                 .format(repr(line)))
             subtitle = self._get_subtitle()
-            for name, index in indices.items():
-                self._decode_field(name, values[index], subtitle)
-            subtitles.append(subtitle)
-        self.event_fields = tuple(fields)
-        return subtitles
-
-    def _read_header(self, lines):
-        """Read header and remove its lines."""
-        self.header = ""
-        while not lines[0].startswith("[Events]"):
-            self.header += "\n"
-            self.header += lines.pop(0)
-        self.header = self.header.strip()
+            if not self.lazy:
+                for index, decode in decoders:
+                    decode(subtitle, values[index])
+                yield subtitle
+                continue
+            for index, decode in positions:
+                decode(subtitle, values[index])
+            decode = functools.partial(self._decode_container, others, values)
+            subtitle.ssa = aeidon.containers.LazySubStationAlpha(decode)
+            self._set_record(subtitle, line)
+            yield subtitle
 
     def write_to_file(self, subtitles, doc, f):
         """
@@ -139,7 +231,11 @@ class SubStationAlpha(aeidon.SubtitleFile):
         f.write("[Events]\n")
         fields = ", ".join(self.event_fields)
         f.write("Format: {}\n".format(fields))
+        encoders = self._get_encoders(self.event_fields)
         for subtitle in subtitles:
+            line = self._get_record(subtitle, doc)
+            if line is not None:
+                f.write(line + "\n")
+                continue
             f.write("Dialogue: {}\n".format(",".join([
-                self._encode_field(x, subtitle, doc)
-                for x in self.event_fields])))
+                encode(subtitle, doc) for encode in encoders])))
@@ -39,45 +39,174 @@ class SubRip(aeidon.SubtitleFile):
             r" (-?\d{1,2}:\d{1,2}:\d{1,2},\d{1,3})"
             r"(  X1:(\d+) X2:(\d+) Y1:(\d+) Y2:(\d+))?\s*$"))
 
-    def read(self):
+    # Time lines in raw bytes with all fields of times captured separately,
+    # see _re_time_line. The first line can be preceded by a UTF-8 BOM.
+    _re_bytes_time_line = re.compile((
+            rb"(?:^|\A\xef\xbb\xbf)"
+            rb"(-?)(\d{1,2}):(\d{1,2}):(\d{1,2}),(\d{1,3}) -->"
+            rb" (-?)(\d{1,2}):(\d{1,2}):(\d{1,2}),(\d{1,3})"
+            rb"(?:  X1:(\d+) X2:(\d+) Y1:(\d+) Y2:(\d+))?[^\S\n]*$"),
+                                     re.MULTILINE)
+
+    def _bytes_to_milliseconds(self, sign, hours, minutes, seconds, fraction):
+        """Return time fields as bytes converted to integer milliseconds."""
+        # Same as calc.normalize_time, a fraction lacking digits
+        # is assumed to lack zero-padding from the right.
+        milliseconds = (int(hours) * 3600000 +
+                        int(minutes) * 60000 +
+                        int(seconds) * 1000 +
+                        int(fraction.ljust(3, b"0")))
+        return -milliseconds if sign else milliseconds
+
+    def _finish_subtitle(self, subtitle, texts, time_line=None):
         """
-        Read file and return subtitles.
+        Set main text of `subtitle` from `texts` and return `subtitle`.
+
+        If `time_line` is not ``None``, keep it as the unmodified record of
+        `subtitle` to be written back verbatim if not changed.
+        """
+        # Skip blank lines at the beginning of the text.
+        while texts and not texts[0]:
+            texts.pop(0)
+        subtitle.main_text = "\n".join(texts)
+        if time_line is not None:
+            self._set_record(subtitle, time_line)
+        return subtitle
+
+    def _get_time_line(self, subtitle):
+        """Return time line of `subtitle` formatted anew."""
+        start = subtitle.start_time.replace(".", ",")
+        end = subtitle.end_time.replace(".", ",")
+        coordinates = ""
+        # Write Extended SubRip coordinates only if the container
+        # has been initialized and the coordinates make some sense.
+        if subtitle.has_container("subrip"):
+            x1 = subtitle.subrip.x1
+            x2 = subtitle.subrip.x2
+            y1 = subtitle.subrip.y1
+            y2 = subtitle.subrip.y2
+            if not x1 == x2 == y1 == y2 == 0:
+                coordinates = ("  X1:{:03d} X2:{:03d} Y1:{:03d} Y2:{:03d}"
+                               .format(x1, x2, y1, y2))
+        return "{} --> {}{}".format(start, end, coordinates)
 
+    def iter_mapped_subtitles(self):
+        """
+        Read memory-mapped file and iterate over subtitles.
+
+        Time lines are found directly from raw bytes and only texts are
+        decoded, which is considerably faster than :meth:`iter_subtitles` for
+        large files. If the encoding or newlines of the file are not supported,
+        :meth:`iter_subtitles` is used instead.
         Raise :exc:`IOError` if reading fails.
         Raise :exc:`UnicodeError` if decoding fails.
         """
-        subtitles = []
-        for line in self._read_lines():
+        with self._map() as (data, encoding):
+            if data is None:
+                yield from self.iter_subtitles()
+                return
+            subtitle = None
+            time_line = None
+            start = 0
+            for match in self._re_bytes_time_line.finditer(data):
+                # Split text between time lines, dropping the empty
+                # remainder after the last newline before the time line.
+                text = str(data[start:match.start()], encoding)
+                if subtitle is None:
+                    text = text.lstrip("\ufeff")
+                texts = self._split_lines(text)[:-1]
+                # Remove the number and a blank line above it.
+                if texts and texts[-1].strip().isdigit():
+                    texts.pop(-1)
+                    if texts and not texts[-1].strip():
+                        texts.pop(-1)
+                if subtitle is not None:
+                    yield self._finish_subtitle(subtitle, texts, time_line)
+                elif any(x.strip() for x in texts):
+                    raise ValueError("Text before first subtitle")
+                subtitle = self._get_subtitle()
+                # Set positions directly in internal integer milliseconds
+                # to avoid the relatively expensive parsing of time strings.
+                subtitle._start = self._bytes_to_milliseconds(*match.group(
+                    1, 2, 3, 4, 5))
+                subtitle._end = self._bytes_to_milliseconds(*match.group(
+                    6, 7, 8, 9, 10))
+                # Keep the time line as iter_subtitles does, stripping
+                # the BOM and a CR that is part of a Windows newline.
+                time_line = None
+                if match.group(11) is None:
+                    time_line = str(match.group(0), encoding)
+                    time_line = time_line.lstrip("\ufeff").rstrip("\r")
+                if match.group(11) is not None:
+                    subtitle.subrip.x1 = int(match.group(11))
+                    subtitle.subrip.x2 = int(match.group(12))
+                    subtitle.subrip.y1 = int(match.group(13))
+                    subtitle.subrip.y2 = int(match.group(14))
+                # Continue after the newline ending the time line.
+                start = match.end() + 1
+            if subtitle is not None:
+                texts = self._split_lines(str(data[start:], encoding))
+                # Skip blank lines at the end of the file.
+                while texts and not texts[-1].strip():
+                    texts.pop(-1)
+                yield self._finish_subtitle(subtitle, texts, time_line)
+
+    def iter_subtitles(self):
+        """
+        Read file and iterate over subtitles.
+
+        Raise :exc:`IOError` if reading fails.
+        Raise :exc:`UnicodeError` if decoding fails.
+        """
+        subtitle = None
+        time_line = None
+        texts = []
+        # Hold the previous two lines, since a subtitle number and
+        # a blank line above it are known to be part of the separator
+        # and not text only once the following time line is found.
+        # The initial blank line stands for the beginning of file.
+        held = [""]
+        for line in self._iter_lines():
             match = self._re_time_line.match(line)
             if match is None:
-                if subtitles[-1].main_text:
-                    subtitles[-1].main_text += "\n"
-                subtitles[-1].main_text += line
+                held.append(line)
+                if len(held) > 2:
+                    texts.append(held.pop(0))
+                    if subtitle is None:
+                        raise ValueError("Text before first subtitle")
                 continue
+            # Remove numbers and blank lines above them.
+            if held and held[-1].strip().isdigit():
+                held.pop(-1)
+                if held and not held[-1].strip():
+                    held.pop(-1)
+            texts.extend(held)
+            if texts and subtitle is None:
+                raise ValueError("Text before first subtitle")
+            if subtitle is not None:
+                yield self._finish_subtitle(subtitle, texts, time_line)
             subtitle = self._get_subtitle()
             subtitle.start_time = subtitle.calc.normalize_time(match.group(1))
             subtitle.end_time = subtitle.calc.normalize_time(match.group(2))
+            # Time lines with coordinates are always written anew,
+            # since changes to coordinates would not be detected.
+            time_line = line if match.group(3) is None else None
             if match.group(3) is not None:
                 subtitle.subrip.x1 = int(match.group(4))
                 subtitle.subrip.x2 = int(match.group(5))
                 subtitle.subrip.y1 = int(match.group(6))
                 subtitle.subrip.y2 = int(match.group(7))
-            subtitles.append(subtitle)
-        return subtitles
-
-    def _read_lines(self):
-        """Read file to a unicoded list of lines."""
-        lines = ["\n"]
-        for line in aeidon.SubtitleFile._read_lines(self):
-            lines.append(line)
-            match = self._re_time_line.match(line)
-            if match is None: continue
-            # Remove numbers and blank lines above them.
-            if lines[-2].strip().isdigit():
-                if not lines[-3].strip():
-                    lines.pop(-3)
-                lines.pop(-2)
-        return lines
+            texts = []
+            held = []
+        if subtitle is not None:
+            texts.extend(held)
+            yield self._finish_subtitle(subtitle, texts, time_line)
+
+    def _split_lines(self, text):
+        """Return a list of lines in `text` split at any newlines."""
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        return text.split("\n")
 
     def write_to_file(self, subtitles, doc, f):
         """
@@ -87,19 +216,12 @@ class SubRip(aeidon.SubtitleFile):
         Raise :exc:`UnicodeError` if encoding fails.
         """
         for i, subtitle in enumerate(subtitles):
-            if i > 0: f.write("\n")
-            f.write("{:d}\n".format(i+1))
-            start = subtitle.start_time.replace(".", ",")
-            end = subtitle.end_time.replace(".", ",")
-            f.write("{} --> {}".format(start, end))
-            # Write Extended SubRip coordinates only if the container
-            # has been initialized and the coordinates make some sense.
-            if subtitle.has_container("subrip"):
-                x1 = subtitle.subrip.x1
-                x2 = subtitle.subrip.x2
-                y1 = subtitle.subrip.y1
-                y2 = subtitle.subrip.y2
-                if not x1 == x2 == y1 == y2 == 0:
-                    f.write("  X1:{:03d} X2:{:03d}".format(x1, x2))
-                    f.write( " Y1:{:03d} Y2:{:03d}".format(y1, y2))
-            f.write("\n{}\n".format(subtitle.get_text(doc)))
+            # Numbers are always written anew, since they
+            # change when subtitles are inserted or removed.
+            time_line = self._get_record(subtitle, doc)
+            if time_line is None or subtitle.has_container("subrip"):
+                time_line = self._get_time_line(subtitle)
+            f.write("{}{:d}\n{}\n{}\n".format(
+                "\n" if i > 0 else "",
+                i+1, time_line,
+                subtitle.get_text(doc)))
@@ -32,30 +32,39 @@ class SubViewer2(aeidon.SubtitleFile):
     _re_time_line = re.compile((r"^(-?\d\d:\d\d:\d\d.\d\d)"
                                 r",(-?\d\d:\d\d:\d\d.\d\d)\s*$"))
 
-    def read(self):
+    def iter_subtitles(self):
         """
-        Read file and return subtitles.
+        Read file and iterate over subtitles.
 
         Raise :exc:`IOError` if reading fails.
         Raise :exc:`UnicodeError` if decoding fails.
         """
         self.header = ""
-        subtitles = []
-        lines = self._read_lines()
-        while lines[0].startswith("["):
-            self.header += "\n"
-            self.header += lines.pop(0)
-        self.header = self.header.lstrip()
-        for i, line in enumerate(lines + [""]):
+        header = True
+        subtitle = None
+        time_line = None
+        for line in self._iter_lines():
+            if header and line.startswith("["):
+                self.header += "\n"
+                self.header += line
+                continue
+            if header:
+                self.header = self.header.lstrip()
+                header = False
+            if subtitle is not None:
+                # Text is on the line following the time line.
+                subtitle.main_text = line.replace("[br]", "\n")
+                self._set_record(subtitle, "\n".join((time_line, line)))
+                yield subtitle
+                subtitle = None
             match = self._re_time_line.match(line)
             if match is None: continue
             subtitle = self._get_subtitle()
             subtitle.start_time = match.group(1) + "0"
             subtitle.end_time = match.group(2) + "0"
-            text = lines[i+1].replace("[br]", "\n")
-            subtitle.main_text = text
-            subtitles.append(subtitle)
-        return subtitles
+            time_line = line
+        if subtitle is not None:
+            raise ValueError("No text found for last subtitle")
 
     def write_to_file(self, subtitles, doc, f):
         """
@@ -66,6 +75,10 @@ class SubViewer2(aeidon.SubtitleFile):
         """
         f.write(self.header + "\n")
         for subtitle in subtitles:
+            lines = self._get_record(subtitle, doc)
+            if lines is not None:
+                f.write("\n{}\n".format(lines))
+                continue
             start = subtitle.calc.round(subtitle.start_time, 2)[:-1]
             end = subtitle.calc.round(subtitle.end_time, 2)[:-1]
             text = subtitle.get_text(doc).replace("\n", "[br]")
@@ -27,11 +27,61 @@ class TestSubStationAlpha(aeidon.TestCase):
                                      self.new_temp_file(self.format),
                                      "ascii")
 
+    def test_iter_subtitles(self):
+        subtitles = list(self.file.iter_subtitles())
+        assert subtitles
+        assert subtitles == self.file.read()
+
+    def test_read__lazy(self):
+        subtitles = self.file.read()
+        self.file.lazy = True
+        lazy_subtitles = self.file.read()
+        assert lazy_subtitles == subtitles
+        for subtitle, lazy_subtitle in zip(subtitles, lazy_subtitles):
+            assert lazy_subtitle.ssa.layer == subtitle.ssa.layer
+            assert lazy_subtitle.ssa.style == subtitle.ssa.style
+            assert lazy_subtitle.ssa.margin_v == subtitle.ssa.margin_v
+
     def test_read(self):
         assert self.file.read()
         assert self.file.header
 
+    def test_read__fields(self):
+        open(self.file.path, "w").write("\n".join((
+            "[Events]",
+            "Format: Style, End, Start, Text",
+            "Dialogue: Custom,0:00:02.50,-0:00:01.05,a, b\\Nc")))
+        subtitle = self.file.read()[0]
+        assert subtitle.start_time == "-00:00:01.050"
+        assert subtitle.end_time == "00:00:02.500"
+        assert subtitle.main_text == "a, b\nc"
+        assert subtitle.ssa.style == "Custom"
+        assert self.file.event_fields == ("Style", "End", "Start", "Text")
+
     def test_write(self):
         self.file.write(self.file.read(), aeidon.documents.MAIN)
         text = open(self.file.path, "r").read().strip()
         assert text == self.get_sample_text(self.format)
+
+    def test_write__frame(self):
+        subtitle = aeidon.Subtitle(aeidon.modes.FRAME)
+        subtitle.start_time = "00:00:01.004"
+        subtitle.end_time = "00:00:02.000"
+        self.file.write([subtitle], aeidon.documents.MAIN)
+        text = open(self.file.path, "r").read()
+        assert ",0:00:01.00,0:00:02.00," in text
+
+    def test_write__lazy(self):
+        text = self.get_sample_text(self.format)
+        text = text.replace(",Default,", ", Default,")
+        open(self.file.path, "w").write(text)
+        self.file.lazy = True
+        subtitles = self.file.read()
+        subtitles[0].main_text = "test"
+        subtitles[1].ssa.style = "Custom"
+        self.file.write(subtitles, aeidon.documents.MAIN)
+        lines = open(self.file.path, "r").read().strip().split("\n")
+        events = [x for x in lines if x.startswith("Dialogue:")]
+        assert events[0].endswith(",Default,,0000,0000,0000,,test")
+        assert ",Custom," in events[1]
+        assert all(", Default," in x for x in events[2:])
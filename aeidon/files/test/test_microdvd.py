@@ -16,6 +16,7 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 import aeidon
+import codecs
 
 
 class TestMicroDVD(aeidon.TestCase):
@@ -27,6 +28,27 @@ class TestMicroDVD(aeidon.TestCase):
                                      self.new_temp_file(self.format),
                                      "ascii")
 
+    def test_iter_mapped_subtitles(self):
+        subtitles = list(self.file.iter_mapped_subtitles())
+        assert subtitles
+        assert subtitles == self.file.read()
+        for subtitle, orig in zip(subtitles, self.file.read()):
+            assert subtitle._record == orig._record
+
+    def test_iter_mapped_subtitles__bom(self):
+        blob = open(self.file.path, "rb").read()
+        open(self.file.path, "wb").write(codecs.BOM_UTF8 + blob)
+        self.file.encoding = "utf_8"
+        subtitles = list(self.file.iter_mapped_subtitles())
+        assert len(subtitles) == len(self.file.read())
+        assert self.file.encoding == "utf_8_sig"
+        assert subtitles[0]._record == self.file.read()[0]._record
+
+    def test_iter_subtitles(self):
+        subtitles = list(self.file.iter_subtitles())
+        assert subtitles
+        assert subtitles == self.file.read()
+
     def test_read(self):
         assert self.file.read()
 
@@ -34,3 +56,13 @@ class TestMicroDVD(aeidon.TestCase):
         self.file.write(self.file.read(), aeidon.documents.MAIN)
         text = open(self.file.path, "r").read().strip()
         assert text == self.get_sample_text(self.format)
+
+    def test_write__verbatim(self):
+        open(self.file.path, "w").write("{1}{2}foo\n"
+                                        "{3}{4}{y:i}bar\n")
+        subtitles = self.file.read()
+        subtitles[0].main_text = "test"
+        self.file.header = ""
+        self.file.write(subtitles, aeidon.documents.MAIN)
+        text = open(self.file.path, "r").read()
+        assert text == "{1}{2}test\n{3}{4}{y:i}bar\n"
@@ -27,6 +27,11 @@ class TestMPL2(aeidon.TestCase):
                                      self.new_temp_file(self.format),
                                      "ascii")
 
+    def test_iter_subtitles(self):
+        subtitles = list(self.file.iter_subtitles())
+        assert subtitles
+        assert subtitles == self.file.read()
+
     def test_read(self):
         assert self.file.read()
 
@@ -34,3 +39,13 @@ class TestMPL2(aeidon.TestCase):
         self.file.write(self.file.read(), aeidon.documents.MAIN)
         text = open(self.file.path, "r").read().strip()
         assert text == self.get_sample_text(self.format)
+
+    def test_write__verbatim(self):
+        open(self.file.path, "w").write("[10][20]foo\n"
+                                        "[30][40]/bar|baz\n")
+        subtitles = self.file.read()
+        subtitles[0].start_time = "00:00:00.500"
+        subtitles[1].main_text = subtitles[1].main_text
+        self.file.write(subtitles, aeidon.documents.MAIN)
+        text = open(self.file.path, "r").read()
+        assert text == "[5][20]foo\n[30][40]/bar|baz\n"
@@ -27,9 +27,54 @@ class TestSubRip(aeidon.TestCase):
         path = self.new_temp_file(self.format, self.name)
         self.file = aeidon.files.new(self.format, path, "ascii")
 
+    def test_iter_mapped_subtitles(self):
+        subtitles = list(self.file.iter_mapped_subtitles())
+        assert subtitles
+        assert subtitles == self.file.read()
+        for subtitle, orig in zip(subtitles, self.file.read()):
+            assert subtitle._record == orig._record
+            if not orig.has_container("subrip"): continue
+            assert subtitle.subrip.x1 == orig.subrip.x1
+            assert subtitle.subrip.y2 == orig.subrip.y2
+
+    def test_iter_mapped_subtitles__numbers(self):
+        with open(self.file.path, "w", newline="\r\n") as f:
+            f.write("1\n00:00:01,000 --> 00:00:02,000\nfoo\n\n"
+                    "2\n\n3\n0:0:3,5 --> 00:00:04,000\n\n"
+                    "12\nbar\n\n")
+        subtitles = list(self.file.iter_mapped_subtitles())
+        assert subtitles == self.file.read()
+        for subtitle, orig in zip(subtitles, self.file.read()):
+            assert subtitle._record == orig._record
+        assert subtitles[0].main_text == "foo\n\n2"
+        assert subtitles[1].start_time == "00:00:03.500"
+        assert subtitles[1].main_text == "12\nbar"
+        assert self.file.newline == aeidon.newlines.WINDOWS
+
+    def test_iter_mapped_subtitles__utf_16(self):
+        text = open(self.file.path, "r").read()
+        open(self.file.path, "w", encoding="utf_16").write(text)
+        self.file.encoding = "utf_16"
+        subtitles = list(self.file.iter_mapped_subtitles())
+        assert subtitles == self.file.read()
+
+    def test_iter_subtitles(self):
+        subtitles = list(self.file.iter_subtitles())
+        assert subtitles
+        assert subtitles == self.file.read()
+
     def test_read(self):
         assert self.file.read()
 
+    def test_read__numbers(self):
+        with open(self.file.path, "w") as f:
+            f.write("1\n00:00:01,000 --> 00:00:02,000\nfoo\n\n"
+                    "2\n\n3\n00:00:03,000 --> 00:00:04,000\n\n"
+                    "12\nbar\n")
+        subtitles = self.file.read()
+        assert subtitles[0].main_text == "foo\n\n2"
+        assert subtitles[1].main_text == "12\nbar"
+
     def test_write(self):
         self.file.write(self.file.read(), aeidon.documents.MAIN)
         text = open(self.file.path, "r").read().strip()
@@ -39,3 +84,18 @@ class TestSubRip(aeidon.TestCase):
 class TestSubRipExtended(TestSubRip):
 
     name = "subrip-extended"
+
+    def test_write__verbatim(self):
+        with open(self.file.path, "w") as f:
+            f.write("1\n0:0:1,5 --> 0:0:2,5\nfoo\n\n"
+                    "2\n0:0:3,5 --> 0:0:4,5\nbar\n\n"
+                    "3\n0:0:5,5 --> 0:0:6,5\nbaz\n")
+        subtitles = self.file.read()
+        subtitles[0].main_text = "test"
+        subtitles[1].end_time = "00:00:05.000"
+        self.file.write(subtitles[::-1], aeidon.documents.MAIN)
+        lines = open(self.file.path, "r").read().split("\n")
+        assert lines[0:3] == ["1", "0:0:5,5 --> 0:0:6,5", "baz"]
+        assert lines[5] == "00:00:03,500 --> 00:00:05,000"
+        assert lines[9] == "00:00:01,500 --> 00:00:02,500"
+        assert lines[10] == "test"
@@ -27,6 +27,11 @@ class TestSubViewer2(aeidon.TestCase):
                                      self.new_temp_file(self.format),
                                      "ascii")
 
+    def test_iter_subtitles(self):
+        subtitles = list(self.file.iter_subtitles())
+        assert subtitles
+        assert subtitles == self.file.read()
+
     def test_read(self):
         assert self.file.read()
         assert self.file.header
@@ -35,3 +40,15 @@ class TestSubViewer2(aeidon.TestCase):
         self.file.write(self.file.read(), aeidon.documents.MAIN)
         text = open(self.file.path, "r").read().strip()
         assert text == self.get_sample_text(self.format)
+
+    def test_write__verbatim(self):
+        self.file.header = ""
+        open(self.file.path, "w").write("00:00:01.00,00:00:02.00 \nfoo\n\n"
+                                        "00:00:03.00,00:00:04.00 \nbar\n")
+        subtitles = self.file.read()
+        subtitles[1].main_text = "test"
+        self.file.write(subtitles, aeidon.documents.MAIN)
+        lines = open(self.file.path, "r").read().split("\n")
+        assert lines[2] == "00:00:01.00,00:00:02.00 "
+        assert lines[5] == "00:00:03.00,00:00:04.00"
+        assert lines[6] == "test"
@@ -43,15 +43,19 @@ class TMPlayer(aeidon.SubtitleFile):
         if self.format != other.format: return
         self.two_digit_hour = other.two_digit_hour
 
-    def read(self):
+    def iter_subtitles(self):
         """
-        Read file and return subtitles.
+        Read file and iterate over subtitles.
 
         Raise :exc:`IOError` if reading fails.
         Raise :exc:`UnicodeError` if decoding fails.
         """
-        subtitles = [self._get_subtitle()]
-        for line in self._read_lines():
+        # End positions are not stored in the file, but are the start
+        # positions of the following subtitles. Hence, hold each subtitle
+        # until the next one is found.
+        previous = self._get_subtitle()
+        first = True
+        for line in self._iter_lines():
             match = self._re_one_digit_hour.search(line)
             if match is not None:
                 i = match.span()[1]
@@ -62,22 +66,25 @@ class TMPlayer(aeidon.SubtitleFile):
                     time = time[1:]
                 time = sign + "0" + time
                 subtitle.start_time = time
-                subtitles[-1].end_time = time
+                previous.end_time = time
                 subtitle.main_text = line[i:].replace("|", "\n")
-                subtitles.append(subtitle)
+                if not first: yield previous
+                previous, first = subtitle, False
                 self.two_digit_hour = False
             match = self._re_two_digit_hour.search(line)
             if match is not None:
                 i = match.span()[1]
                 subtitle = self._get_subtitle()
                 subtitle.start_time = line[:i-1] + ".000"
-                subtitles[-1].end_time = subtitle.start_time
+                previous.end_time = subtitle.start_time
                 subtitle.main_text = line[i:].replace("|", "\n")
-                subtitles.append(subtitle)
+                if not first: yield previous
+                previous, first = subtitle, False
                 self.two_digit_hour = True
-        subtitles.pop(0)
-        subtitles[-1].duration_seconds = 5
-        return subtitles
+        if first:
+            raise ValueError("No subtitles found")
+        previous.duration_seconds = 5
+        yield previous
 
     def write_to_file(self, subtitles, doc, f):
         """
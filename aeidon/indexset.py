@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2005 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Sorted set of indices kept as runs of consecutive integers."""
+
+import array
+import bisect
+import collections.abc
+
+__all__ = ("IndexSet",)
+
+
+class IndexSet(collections.abc.Sequence):
+
+    """
+    Sorted set of indices kept as runs of consecutive integers.
+
+    :class:`IndexSet` is an immutable sequence of unique ascending integers,
+    which can be used wherever a sequence of indices is expected. Runs of
+    consecutive indices take constant space and e.g. all indices of
+    subtitles of a project are a single run. Membership, item access and
+    :meth:`index` take logarithmic time of the amount of runs. Being sorted,
+    the first and last items are the minimum and maximum. Slices are returned
+    as lists. An index set equals other sequences of the same integers.
+    """
+
+    __hash__ = None
+
+    def __init__(self, indices=()):
+        """
+        Initialize an :class:`IndexSet` instance.
+
+        `indices` can be any iterable of integers in any order.
+        """
+        if isinstance(indices, IndexSet):
+            self._starts = indices._starts
+            self._stops = indices._stops
+            self._offsets = indices._offsets
+            return
+        if isinstance(indices, range) and indices.step == 1:
+            ranges = [indices] if indices else []
+            return self._set_ranges(ranges)
+        ranges = []
+        for index in sorted(set(indices)):
+            if ranges and ranges[-1][1] == index:
+                ranges[-1][1] = index + 1
+                continue
+            ranges.append([index, index + 1])
+        self._set_ranges(range(*x) for x in ranges)
+
+    def __contains__(self, index):
+        """Return ``True`` if `index` is in set."""
+        i = bisect.bisect_right(self._starts, index) - 1
+        return i >= 0 and index < self._stops[i]
+
+    def __eq__(self, other):
+        """Return ``True`` if `other` contains the same integers."""
+        if isinstance(other, IndexSet):
+            return (self._starts == other._starts and
+                    self._stops == other._stops)
+
+        if isinstance(other, (list, tuple, range)):
+            return len(self) == len(other) and list(self) == list(other)
+        return NotImplemented
+
+    def __getitem__(self, i):
+        """Return index at position `i` or list of indices in slice `i`."""
+        if isinstance(i, slice):
+            return [self[x] for x in range(*i.indices(len(self)))]
+        length = len(self)
+        if i < 0: i += length
+        if not 0 <= i < length:
+            raise IndexError("Index out of range: {}".format(repr(i)))
+        run = bisect.bisect_right(self._offsets, i) - 1
+        return self._starts[run] + i - self._offsets[run]
+
+    def __iter__(self):
+        """Iterate over indices in ascending order."""
+        for start, stop in zip(self._starts, self._stops):
+            yield from range(start, stop)
+
+    def __len__(self):
+        """Return the amount of indices."""
+        if not self._starts: return 0
+        return self._offsets[-1] + self._stops[-1] - self._starts[-1]
+
+    def __repr__(self):
+        """Return evaluable string representation."""
+        return "IndexSet({})".format(repr(list(self)))
+
+    def __reversed__(self):
+        """Iterate over indices in descending order."""
+        for start, stop in zip(reversed(self._starts),
+                               reversed(self._stops)):
+            yield from range(stop - 1, start - 1, -1)
+
+    def count(self, index):
+        """Return the amount of occurrences of `index`, i.e. zero or one."""
+        return int(index in self)
+
+    @classmethod
+    def from_ranges(cls, ranges):
+        """Return a new index set of integers in `ranges`."""
+        runs = []
+        for rng in sorted((x for x in ranges if x), key=lambda x: x.start):
+            if rng.step != 1:
+                raise ValueError("Invalid step: {}".format(repr(rng.step)))
+            if runs and rng.start <= runs[-1][1]:
+                runs[-1][1] = max(runs[-1][1], rng.stop)
+                continue
+            runs.append([rng.start, rng.stop])
+        indices = cls()
+        indices._set_ranges(range(*x) for x in runs)
+        return indices
+
+    def get_ranges(self):
+        """Return a list of ranges of consecutive indices."""
+        return [range(*x) for x in zip(self._starts, self._stops)]
+
+    def index(self, index, *args):
+        """
+        Return position of `index` in set.
+
+        Raise :exc:`ValueError` if `index` not in set.
+        """
+        i = bisect.bisect_right(self._starts, index) - 1
+        if i < 0 or index >= self._stops[i]:
+            raise ValueError("{} is not in set".format(repr(index)))
+        position = self._offsets[i] + index - self._starts[i]
+        if args and not range(len(self))[slice(*args)].count(position):
+            raise ValueError("{} is not in set".format(repr(index)))
+        return position
+
+    def _set_ranges(self, ranges):
+        """Set runs of indices from sorted, non-adjacent `ranges`."""
+        self._starts = array.array("q")
+        self._stops = array.array("q")
+        self._offsets = array.array("q")
+        offset = 0
+        for rng in ranges:
+            self._starts.append(rng.start)
+            self._stops.append(rng.stop)
+            self._offsets.append(offset)
+            offset += len(rng)
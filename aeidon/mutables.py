@@ -17,10 +17,12 @@
 
 """Observable versions of built-in mutable objects."""
 
+import collections
 import copy
 import functools
 
-__all__ = ("ObservableDict", "ObservableList", "ObservableSet",)
+__all__ = ("ObservableDeque", "ObservableDict", "ObservableList",
+           "ObservableSet",)
 
 
 def _mutation(function):
@@ -33,6 +35,89 @@ def _mutation(function):
     return wrapper
 
 
+class ObservableDeque(collections.deque):
+
+    """
+    Observable version of ``collections.deque``.
+
+    :ivar master: Master instance with a ``notify`` method
+    :ivar name: Argument passed when calling :attr:`master`'s ``notify`` method
+    """
+
+    def __init__(self, *args, **kwargs):
+        collections.deque.__init__(self, *args[:-2], **kwargs)
+        self.master = args[-2]
+        self.name = args[-1]
+
+    def __copy__(self):
+        deq = collections.deque(copy.copy(x) for x in self)
+        return self.__class__(deq, self.master, self.name)
+
+    def __deepcopy__(self, memo):
+        deq = collections.deque(copy.deepcopy(x) for x in self)
+        return self.__class__(deq, self.master, self.name)
+
+    @_mutation
+    def __delitem__(self, *args, **kwargs):
+        return collections.deque.__delitem__(self, *args, **kwargs)
+
+    @_mutation
+    def __iadd__(self, *args, **kwargs):
+        return collections.deque.__iadd__(self, *args, **kwargs)
+
+    @_mutation
+    def __imul__(self, *args, **kwargs):
+        return collections.deque.__imul__(self, *args, **kwargs)
+
+    @_mutation
+    def __setitem__(self, *args, **kwargs):
+        return collections.deque.__setitem__(self, *args, **kwargs)
+
+    @_mutation
+    def append(self, *args, **kwargs):
+        return collections.deque.append(self, *args, **kwargs)
+
+    @_mutation
+    def appendleft(self, *args, **kwargs):
+        return collections.deque.appendleft(self, *args, **kwargs)
+
+    @_mutation
+    def clear(self, *args, **kwargs):
+        return collections.deque.clear(self, *args, **kwargs)
+
+    @_mutation
+    def extend(self, *args, **kwargs):
+        return collections.deque.extend(self, *args, **kwargs)
+
+    @_mutation
+    def extendleft(self, *args, **kwargs):
+        return collections.deque.extendleft(self, *args, **kwargs)
+
+    @_mutation
+    def insert(self, *args, **kwargs):
+        return collections.deque.insert(self, *args, **kwargs)
+
+    @_mutation
+    def pop(self, *args, **kwargs):
+        return collections.deque.pop(self, *args, **kwargs)
+
+    @_mutation
+    def popleft(self, *args, **kwargs):
+        return collections.deque.popleft(self, *args, **kwargs)
+
+    @_mutation
+    def remove(self, *args, **kwargs):
+        return collections.deque.remove(self, *args, **kwargs)
+
+    @_mutation
+    def reverse(self, *args, **kwargs):
+        return collections.deque.reverse(self, *args, **kwargs)
+
+    @_mutation
+    def rotate(self, *args, **kwargs):
+        return collections.deque.rotate(self, *args, **kwargs)
+
+
 class ObservableDict(dict):
 
     """
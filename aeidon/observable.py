@@ -18,6 +18,7 @@
 """Base class for observable objects."""
 
 import aeidon
+import collections
 
 __all__ = ("Observable",)
 
@@ -198,6 +199,8 @@ class Observable:
     def _validate(self, name, value):
         """Return `value` or an observable version if `value` is mutable."""
         args = (value, self, name)
+        if isinstance(value, collections.deque):
+            return aeidon.ObservableDeque(*args)
         if isinstance(value, dict):
             return aeidon.ObservableDict(*args)
         if isinstance(value, list):
@@ -18,6 +18,8 @@
 """Model for subtitle data."""
 
 import aeidon
+import collections
+import contextlib
 
 __all__ = ("Project",)
 
@@ -55,8 +57,10 @@ class Project(aeidon.Observable, metaclass=ProjectMeta):
     """
     Model for subtitle data.
 
+    :ivar cache: :class:`aeidon.FileCache` to open files from or ``None``
     :ivar calc: Instance of :class:`aeidon.Calculator` used
     :ivar clipboard: Instance of :class:`aeidon.Clipboard` used
+    :ivar _columnar: ``True`` to keep subtitles in columnar storage
     :ivar _delegations: Dictionary mapping method names to agent methods
     :ivar framerate: :attr:`aeidon.framerates` item corresponding to video
     :ivar main_changed: Integer, status of main document
@@ -67,7 +71,20 @@ class Project(aeidon.Observable, metaclass=ProjectMeta):
 
     :ivar main_file: Main instance of :class:`aeidon.SubtitleFile`
     :ivar redoables: Stack of :class:`aeidon.RevertableAction` instances
+
+       Stacks of actions are kept as deques with the most recent action at
+       index zero. Any list of actions assigned is converted to a deque.
+
     :ivar subtitles: List of :class:`aeidon.Subtitle` instances
+
+       If the project was created with `columnar` set to ``True``, this is
+       instead a :class:`aeidon.SubtitleStore`, which keeps subtitle data in
+       parallel columns and returns subtitle views on indexing. Any sequence
+       of subtitles assigned is copied into an observable store, which sends
+       notifications of changes the same way as a list. A columnar store uses
+       less memory for large projects and allows scanning positions and texts
+       without instantiating subtitles.
+
     :ivar tran_changed: Integer, status of translation document
 
        At unchanged state (i.e. file on disk corresponds to the state of the
@@ -75,7 +92,21 @@ class Project(aeidon.Observable, metaclass=ProjectMeta):
        one  and undoing decreases value by one.
 
     :ivar tran_file: Translation instance of :class:`aeidon.SubtitleFile`
+    :ivar undo_coalesce_time: Seconds to merge consecutive edits or None
+
+       If not ``None``, consecutive edits of the same text or position
+       of the same subtitle done within this amount of seconds of each other
+       are merged into one action, so that e.g. nudging a position several
+       times in a row can be undone at once.
+
     :ivar undo_limit: Maximum size of undo/redo stacks or None for no limit
+    :ivar undo_memory_limit: Bytes of actions to keep in memory or None
+
+       If not ``None``, the oldest actions in undo/redo stacks are written
+       to a temporary file once the approximate size of actions in memory
+       exceeds this amount of bytes and read back when undone or redone.
+       See :class:`aeidon.RevertableActionStub`.
+
     :ivar undoables: Stack of :class:`aeidon.RevertableAction` instances
     :ivar video_path: Full, absolute path to the video file on disk
 
@@ -111,9 +142,12 @@ class Project(aeidon.Observable, metaclass=ProjectMeta):
         "translation-texts-changed",
     )
 
-    def __init__(self, framerate=None):
+    def __init__(self, framerate=None, columnar=False):
         """Initialize a :class:`Project` instance."""
         aeidon.Observable.__init__(self)
+        self._batch = None
+        self.cache = None
+        self._columnar = columnar
         framerate = framerate or aeidon.framerates.FPS_23_976
         self.calc = aeidon.Calculator(framerate)
         self.clipboard = aeidon.Clipboard()
@@ -121,12 +155,14 @@ class Project(aeidon.Observable, metaclass=ProjectMeta):
         self.framerate = framerate
         self.main_changed = 0
         self.main_file = None
-        self.redoables = []
+        self.redoables = collections.deque()
         self.subtitles = []
         self.tran_changed = None
         self.tran_file = None
+        self.undo_coalesce_time = None
         self.undo_limit = 100000
-        self.undoables = []
+        self.undo_memory_limit = None
+        self.undoables = collections.deque()
         self.video_path = None
         self._init_delegations()
 
@@ -137,6 +173,50 @@ class Project(aeidon.Observable, metaclass=ProjectMeta):
         except LookupError:
             raise AttributeError
 
+    @contextlib.contextmanager
+    def batch(self, description=None):
+        """
+        Return a context manager to do multiple actions as one.
+
+        Actions done within the context are grouped as one action with
+        `description` or the description of the last action if ``None``.
+        Signals with indices of subtitles are collected and emitted once on
+        exit, see :class:`aeidon.Batch`, as is ``action-done``. Other signals
+        are emitted immediately. Actions should not be undone or redone
+        within the context. Nested contexts are part of the outermost one.
+        """
+        if self._batch is not None:
+            yield
+            return
+        self._batch = aeidon.Batch()
+        top = self.undoables[0] if self.undoables else None
+        try:
+            yield
+        finally:
+            batch, self._batch = self._batch, None
+            # Actions done can repeat if coalesced
+            # and include the one done before.
+            actions = dict((id(x), x) for x in batch.actions if x is not top)
+            count = min(len(actions), len(self.undoables))
+            register = aeidon.registers.DO
+            if count > 1:
+                description = description or self.undoables[0].description
+                self.group_actions(register, count, description)
+            elif count == 1 and description is not None:
+                self.set_action_description(register, description)
+            for signal, indices in batch.get_signals():
+                self.emit(signal, indices)
+            if count > 0:
+                self.emit_action_signal(register)
+
+    def emit(self, signal, *args):
+        """Send notification of `signal` or collect it if in :meth:`batch`."""
+        if (self._batch is not None and
+            not self._blocked_state and
+            not signal in self._blocked_signals and
+            self._batch.add(signal, *args)): return
+        return aeidon.Observable.emit(self, signal, *args)
+
     def _init_delegations(self):
         """Initialize the delegation mappings."""
         for agent_class_name in aeidon.agents.__all__:
@@ -158,3 +238,12 @@ class Project(aeidon.Observable, metaclass=ProjectMeta):
                 # Remove class-level function added by ProjectMeta.
                 if hasattr(self.__class__, attr_name):
                     delattr(self.__class__, attr_name)
+
+    def _validate(self, name, value):
+        """Return `value` or an observable version if `value` is mutable."""
+        if name == "subtitles" and self._columnar:
+            return aeidon.ObservableSubtitleStore(value, self, name)
+        if (name in ("redoables", "undoables") and
+            not isinstance(value, collections.deque)):
+            value = collections.deque(value)
+        return aeidon.Observable._validate(self, name, value)
@@ -18,8 +18,25 @@
 """Actions that can be reverted, i.e. undone and redone."""
 
 import aeidon
+import sys
 
-__all__ = ("RevertableAction", "RevertableActionGroup",)
+__all__ = ("RevertableAction", "RevertableActionGroup",
+           "RevertableActionStub",)
+
+
+def _get_size(value):
+    """Return approximate size of `value` in bytes."""
+    size = sys.getsizeof(value)
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return size + sum(map(_get_size, value))
+    if isinstance(value, dict):
+        return size + sum(map(_get_size, value.values()))
+    if isinstance(value, aeidon.Subtitle):
+        return (size +
+                sys.getsizeof(value._main_text) +
+                sys.getsizeof(value._tran_text))
+
+    return size
 
 
 class RevertableAction:
@@ -27,12 +44,18 @@ class RevertableAction:
     """
     Action that can be reverted, i.e. undone and redone.
 
+    :ivar coalesce_key: Key of the single field edited or ``None``
     :ivar description: Short one line description
     :ivar docs: Sequence of :attr:`aeidon.documents` items affected
     :ivar register: :attr:`aeidon.registers` item for action taken
     :ivar revert_args: Arguments passed to the revert method
     :ivar revert_function: Method called to revert this action
     :ivar revert_kwargs: Keyword arguments passed to the revert method
+
+    Consecutive actions with the same :attr:`coalesce_key` can be merged
+    into one, see :attr:`aeidon.Project.undo_coalesce_time`. The key should
+    identify the edited field, e.g. text of a document of a subtitle at an
+    index, so that reverting the earlier action reverts both.
     """
 
     def __init__(self, **kwargs):
@@ -44,12 +67,14 @@ class RevertableAction:
         :attr:`revert_function` are required to be set eventually, either with
         `kwargs` or direct assignment later.
         """
+        self.coalesce_key = None
         self.description = None
         self.docs = None
         self.register = None
         self.revert_args = ()
         self.revert_function = None
         self.revert_kwargs = {}
+        self._size = None
         for key, value in kwargs.items():
             setattr(self, key, value)
 
@@ -62,6 +87,16 @@ class RevertableAction:
         raise ValueError("Invalid register: {}"
                          .format(repr(self.register)))
 
+    def get_size(self):
+        """Return approximate size of reversion arguments in bytes."""
+        # Arguments are not changed once the action is
+        # registered, so the size needs to be counted once.
+        if self._size is None:
+            self._size = (sys.getsizeof(self) +
+                          _get_size(self.revert_args) +
+                          _get_size(self.revert_kwargs))
+        return self._size
+
     def revert(self):
         """Call the reversion function."""
         kwargs = self.revert_kwargs.copy()
@@ -90,3 +125,54 @@ class RevertableActionGroup:
         self.description = None
         for key, value in kwargs.items():
             setattr(self, key, value)
+
+    def get_size(self):
+        """Return approximate size of actions in bytes."""
+        return sum(x.get_size() for x in self.actions)
+
+
+class RevertableActionStub:
+
+    """
+    Placeholder of an action or action group written to a file.
+
+    :ivar description: Short one line description
+    :ivar length: Length of the encoded action in bytes
+    :ivar offset: Position of the encoded action in file
+    :ivar path: Path to the file the action is written to
+
+    Stubs take the place of the oldest actions in undo and redo stacks when
+    the size of actions exceeds :attr:`aeidon.Project.undo_memory_limit`.
+    Actions are encoded with :func:`aeidon.session.dump_action` and read
+    back with :meth:`load` when reverted.
+    """
+
+    def __init__(self, **kwargs):
+        """
+        Initialize a :class:`RevertableActionStub` instance.
+
+        `kwargs` can contain any of the names of public instance variables,
+        all of which are required to be set eventually, either with `kwargs`
+        or direct assignment later.
+        """
+        self.description = None
+        self.length = 0
+        self.offset = 0
+        self.path = None
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+
+    def get_size(self):
+        """Return approximate size in memory, which is zero."""
+        return 0
+
+    def load(self, project):
+        """
+        Return action or action group read from file.
+
+        Raise :exc:`IOError` if reading fails.
+        """
+        with open(self.path, "rb") as f:
+            f.seek(self.offset)
+            data = f.read(self.length)
+        return aeidon.session.load_action(data, project)
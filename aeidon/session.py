@@ -0,0 +1,437 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2005 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Reading and writing native session files.
+
+A session file holds the complete state of a :class:`aeidon.Project`, i.e.
+its subtitles, main and translation files, framerate, video path and undo and
+redo stacks. A session file starts with :data:`MAGIC` followed by the version
+number of the format as a little-endian unsigned short and a zlib-compressed
+payload. The payload consists of the length of a JSON header as a
+little-endian unsigned int, the header and packed arrays of integers.
+
+All texts are kept once in a table of strings in the header and referred to
+by their index. Subtitles, both those of the project and those referred to by
+actions, are kept as rows of packed columns of positions, text indices, modes
+and framerates. Actions are kept as names of their revert methods and tagged
+values of their arguments. Only values of known types are written and read,
+nothing is ever evaluated or unpickled, and only methods listed in
+:data:`REVERT_FUNCTIONS` are accepted as revert methods, so that undoing or
+redoing an action read from a session file cannot e.g. write files. Only
+session files of the current version are read.
+
+:var MAGIC: Bytes at the beginning of all session files
+:var REVERT_FUNCTIONS: Names of methods allowed to revert actions
+:var VERSION: Version number of the format written and read
+"""
+
+import aeidon
+import array
+import json
+import struct
+import sys
+import zlib
+
+MAGIC = b"AEIDON-SESSION\n"
+VERSION = 3
+
+REVERT_FUNCTIONS = (
+    "insert_subtitles",
+    "remove_subtitles",
+    "replace_positions",
+    "replace_texts",
+    "set_end",
+    "set_framerate",
+    "set_positions",
+    "set_start",
+    "set_text",
+    "shift_positions",
+)
+
+
+class _Decoder:
+
+    """
+    Decoder of data of a session file.
+
+    :ivar arrays: List of :class:`array.array` instances
+    :ivar project: :class:`aeidon.Project` instance to decode actions for
+    :ivar strings: List of strings
+    :ivar subtitles: List of subtitles in rows of the table
+    """
+
+    def __init__(self, project, header, data):
+        """Initialize a :class:`_Decoder` instance."""
+        self.arrays = []
+        self.project = project
+        self.strings = header["strings"]
+        self.subtitles = []
+        for typecode, start, end in header["arrays"]:
+            if not typecode in ("B", "i", "q"):
+                raise ValueError("Invalid typecode: {}"
+                                 .format(repr(typecode)))
+            values = array.array(typecode)
+            values.frombytes(data[start:end])
+            if sys.byteorder == "big":
+                values.byteswap()
+            self.arrays.append(values)
+        self._decode_table(header["table"])
+
+    def decode_action(self, data):
+        """Return action or action group decoded from `data`."""
+        if "actions" in data:
+            return aeidon.RevertableActionGroup(
+                actions=list(map(self.decode_action, data["actions"])),
+                description=data["description"])
+
+        name = data["function"]
+        if not name in REVERT_FUNCTIONS:
+            raise ValueError("Invalid revert function: {}"
+                             .format(repr(name)))
+        return aeidon.RevertableAction(
+            description=data["description"],
+            docs=self.decode_value(data["docs"]),
+            register=self.decode_value(data["register"]),
+            revert_function=getattr(self.project, name),
+            revert_args=self.decode_value(data["args"]),
+            revert_kwargs=dict((k, self.decode_value(v))
+                               for k, v in data["kwargs"].items()))
+
+    def decode_file(self, data):
+        """Return subtitle file decoded from `data` or ``None``."""
+        if data is None: return None
+        format = aeidon.formats.find_item("name", data["format"])
+        newline = aeidon.newlines.find_item("name", data["newline"])
+        file = aeidon.files.new(format,
+                                data["path"],
+                                data["encoding"],
+                                newline)
+
+        file.set_properties(data["properties"])
+        return file
+
+    def _decode_table(self, data):
+        """Decode subtitles from table `data`."""
+        strings = self.strings
+        columns = [self.arrays[data[x]] for x in (
+            "starts", "ends", "main_texts", "tran_texts",
+            "modes", "framerates")]
+
+        for start, end, main, tran, mode, framerate in zip(*columns):
+            subtitle = aeidon.Subtitle(aeidon.modes[mode],
+                                       aeidon.framerates[framerate])
+
+            subtitle._start = start
+            subtitle._end = end
+            subtitle._main_text = strings[main]
+            subtitle._tran_text = strings[tran]
+            self.subtitles.append(subtitle)
+        aeidon.containers.decode_table(data["containers"], self.subtitles)
+
+    def decode_value(self, data):
+        """Return value decoded from tagged `data`."""
+        if not isinstance(data, list):
+            return data
+        tag = data[0]
+        if tag == "array":
+            return self.arrays[data[1]]
+        if tag == "enum":
+            if not data[1] in aeidon.enums.__all__:
+                raise ValueError("Invalid enumeration: {}"
+                                 .format(repr(data[1])))
+            enum = getattr(aeidon, data[1])
+            return enum.find_item("name", data[2])
+        if tag == "indices":
+            return aeidon.IndexSet.from_ranges(map(
+                range, self.arrays[data[1]], self.arrays[data[2]]))
+        if tag == "str":
+            return self.strings[data[1]]
+        if tag == "subtitle":
+            return self.subtitles[data[1]]
+        if tag in ("list", "tuple"):
+            values = list(map(self.decode_value, data[1]))
+            return tuple(values) if tag == "tuple" else values
+        if tag == "range":
+            return range(data[1], data[2], data[3])
+        if tag in ("ints", "strs", "subtitles"):
+            values = self.arrays[data[1]].tolist()
+            if tag == "strs":
+                values = [self.strings[x] for x in values]
+            if tag == "subtitles":
+                values = [self.subtitles[x] for x in values]
+            return tuple(values) if data[2] == "tuple" else values
+        raise ValueError("Invalid tag: {}".format(repr(tag)))
+
+
+class _Encoder:
+
+    """
+    Encoder of data to write to a session file.
+
+    :ivar arrays: List of :class:`array.array` instances
+    :ivar strings: List of strings
+    :ivar subtitles: List of subtitles in rows of the table
+    :ivar _rows: Dictionary mapping subtitle identities to rows
+    :ivar _string_codes: Dictionary mapping strings to their indices
+    """
+
+    def __init__(self):
+        """Initialize an :class:`_Encoder` instance."""
+        self.arrays = []
+        self.strings = []
+        self.subtitles = []
+        self._rows = {}
+        self._string_codes = {}
+
+    def add_array(self, typecode, values):
+        """Add packed array of `values` and return its index."""
+        self.arrays.append(array.array(typecode, values))
+        return len(self.arrays) - 1
+
+    def add_string(self, text):
+        """Add `text` to the table of strings and return its index."""
+        code = self._string_codes.get(text)
+        if code is not None: return code
+        self.strings.append(text)
+        return self._string_codes.setdefault(text, len(self.strings) - 1)
+
+    def add_subtitle(self, subtitle):
+        """Add `subtitle` to the table and return its row."""
+        # Subtitles are added by identity, so that the same subtitle
+        # referred to in multiple places is decoded as the same subtitle.
+        item = self._rows.get(id(subtitle))
+        if item is not None: return item[0]
+        self.subtitles.append(subtitle)
+        row = len(self.subtitles) - 1
+        # Keep a reference to the subtitle to
+        # ensure that its identity is not reused.
+        self._rows[id(subtitle)] = (row, subtitle)
+        return row
+
+    def encode_action(self, action):
+        """Return data encoded from action or action group."""
+        if isinstance(action, aeidon.RevertableActionGroup):
+            return dict(description=action.description,
+                        actions=list(map(self.encode_action,
+                                         action.actions)))
+
+        name = action.revert_function.__name__
+        if not name in REVERT_FUNCTIONS:
+            raise ValueError("Cannot encode revert function: {}"
+                             .format(repr(name)))
+        return dict(description=action.description,
+                    docs=self.encode_value(tuple(action.docs)),
+                    register=self.encode_value(action.register),
+                    function=name,
+                    args=self.encode_value(tuple(action.revert_args)),
+                    kwargs=dict((k, self.encode_value(v))
+                                for k, v in action.revert_kwargs.items()))
+
+    def encode_file(self, file):
+        """Return data encoded from subtitle file or ``None``."""
+        if file is None: return None
+        return dict(format=file.format.name,
+                    path=file.path,
+                    encoding=file.encoding,
+                    newline=file.newline.name,
+                    properties=file.get_properties())
+
+    def encode_table(self):
+        """Return data encoded from subtitles in the table."""
+        subtitles = self.subtitles
+        add_string = self.add_string
+        return dict(
+            starts=self.add_array("q", [x._start for x in subtitles]),
+            ends=self.add_array("q", [x._end for x in subtitles]),
+            main_texts=self.add_array(
+                "i", [add_string(x._main_text) for x in subtitles]),
+            tran_texts=self.add_array(
+                "i", [add_string(x._tran_text) for x in subtitles]),
+            modes=self.add_array("B", [x._mode for x in subtitles]),
+            framerates=self.add_array(
+                "B", [x._framerate for x in subtitles]),
+            containers=aeidon.containers.encode_table(subtitles))
+
+    def encode_value(self, value):
+        """Return tagged data encoded from `value`."""
+        if isinstance(value, aeidon.EnumerationItem):
+            for name in aeidon.enums.__all__:
+                if getattr(aeidon, name) is value.parent:
+                    return ["enum", name, value.name]
+            raise TypeError("Cannot encode item of enumeration {}"
+                            .format(repr(value.parent)))
+        if value is None or isinstance(value, (bool, int, float)):
+            return value
+        if isinstance(value, str):
+            return ["str", self.add_string(value)]
+        if isinstance(value, aeidon.Subtitle):
+            return ["subtitle", self.add_subtitle(value)]
+        if isinstance(value, aeidon.IndexSet):
+            ranges = value.get_ranges()
+            return ["indices",
+                    self.add_array("q", [x.start for x in ranges]),
+                    self.add_array("q", [x.stop for x in ranges])]
+        if isinstance(value, range):
+            return ["range", value.start, value.stop, value.step]
+        if isinstance(value, array.array) and value.typecode in "Biq":
+            return ["array", self.add_array(value.typecode, value)]
+        if isinstance(value, (list, tuple)):
+            kind = "tuple" if isinstance(value, tuple) else "list"
+            types = set(map(type, value))
+            if value and types == {int}:
+                return ["ints", self.add_array("q", value), kind]
+            if value and types == {str}:
+                return ["strs", self.add_array(
+                    "i", map(self.add_string, value)), kind]
+            if value and all(isinstance(x, aeidon.Subtitle) for x in value):
+                return ["subtitles", self.add_array(
+                    "i", map(self.add_subtitle, value)), kind]
+            return [kind, list(map(self.encode_value, value))]
+        raise TypeError("Cannot encode value of type {}"
+                        .format(repr(type(value))))
+
+def dump_action(action):
+    """
+    Return bytes encoded from action or action group.
+
+    Returned bytes contain the action and the subtitles and strings it refers
+    to in the same form as the payload of a session file.
+    """
+    encoder = _Encoder()
+    header = dict(action=encoder.encode_action(action))
+    return _pack(encoder, header)
+
+def load_action(data, project):
+    """
+    Return action or action group decoded from bytes `data`.
+
+    `data` should be bytes returned by :func:`dump_action`. The decoded
+    action calls methods of `project` when reverted.
+    """
+    header, decoder = _unpack(data, project)
+    return decoder.decode_action(header["action"])
+
+def _load_actions(actions, project):
+    """Return `actions` with those written to disk read back."""
+    return [x.load(project)
+            if isinstance(x, aeidon.RevertableActionStub) else x
+            for x in actions]
+
+def _pack(encoder, header):
+    """Return compressed payload of `header` and data of `encoder`."""
+    # The table of subtitles and strings must be
+    # encoded last, once all values are encoded.
+    header["table"] = encoder.encode_table()
+    header["strings"] = encoder.strings
+    header["arrays"] = []
+    blobs = []
+    offset = 0
+    for values in encoder.arrays:
+        if sys.byteorder == "big":
+            values.byteswap()
+        blob = values.tobytes()
+        header["arrays"].append((values.typecode, offset, offset + len(blob)))
+        blobs.append(blob)
+        offset += len(blob)
+    header = json.dumps(header, ensure_ascii=False, separators=(",", ":"))
+    header = header.encode("utf_8")
+    data = b"".join([struct.pack("<I", len(header)), header] + blobs)
+    return zlib.compress(data)
+
+def read(path, project):
+    """
+    Read session file at `path` and return a dictionary of project state.
+
+    Returned dictionary contains items ``framerate``, ``main_changed``,
+    ``main_file``, ``redoables``, ``subtitles``, ``tran_changed``,
+    ``tran_file``, ``undo_limit``, ``undoables`` and ``video_path``. Actions
+    in the undo and redo stacks call methods of `project` when reverted.
+
+    Raise :exc:`IOError` if reading fails.
+    Raise :exc:`aeidon.ParseError` if parsing fails.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    try:
+        return _read(data, project)
+    except aeidon.ParseError:
+        raise
+    except Exception:
+        raise aeidon.ParseError("Failed to parse session file {}"
+                                .format(repr(path)))
+
+def _read(data, project):
+    """Return a dictionary of project state decoded from `data`."""
+    if not data.startswith(MAGIC):
+        raise ValueError("Not a session file")
+    start = len(MAGIC)
+    version = struct.unpack_from("<H", data, start)[0]
+    if version != VERSION:
+        # Older layouts are not migrated, but rejected
+        # rather than misread with the current layout.
+        raise aeidon.ParseError("Unsupported session file version {:d}, "
+                                "expected {:d}".format(version, VERSION))
+    header, decoder = _unpack(memoryview(data)[start + 2:], project)
+    return dict(
+        framerate=decoder.decode_value(header["framerate"]),
+        main_changed=header["main_changed"],
+        main_file=decoder.decode_file(header["main_file"]),
+        redoables=list(map(decoder.decode_action, header["redoables"])),
+        subtitles=decoder.decode_value(header["subtitles"]),
+        tran_changed=header["tran_changed"],
+        tran_file=decoder.decode_file(header["tran_file"]),
+        undo_limit=header["undo_limit"],
+        undoables=list(map(decoder.decode_action, header["undoables"])),
+        video_path=header["video_path"])
+
+def _unpack(data, project):
+    """Return header and decoder of compressed payload `data`."""
+    data = zlib.decompress(data)
+    length = struct.unpack_from("<I", data)[0]
+    header = json.loads(str(data[4:4 + length], "utf_8"))
+    return header, _Decoder(project, header, memoryview(data)[4 + length:])
+
+def write(path, project):
+    """
+    Write state of `project` to session file at `path`.
+
+    Raise :exc:`IOError` if writing fails.
+    Raise :exc:`ValueError` if an action has a revert method not listed in
+    :data:`REVERT_FUNCTIONS`.
+    """
+    encoder = _Encoder()
+    header = dict(
+        version=VERSION,
+        framerate=encoder.encode_value(project.framerate),
+        main_changed=project.main_changed,
+        main_file=encoder.encode_file(project.main_file),
+        redoables=list(map(encoder.encode_action,
+                           _load_actions(project.redoables, project))),
+        subtitles=encoder.encode_value(list(project.subtitles)),
+        tran_changed=project.tran_changed,
+        tran_file=encoder.encode_file(project.tran_file),
+        undo_limit=project.undo_limit,
+        undoables=list(map(encoder.encode_action,
+                           _load_actions(project.undoables, project))),
+        video_path=project.video_path)
+
+    data = _pack(encoder, header)
+    with aeidon.util.atomic_open(path, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<H", VERSION))
+        f.write(data)
@@ -0,0 +1,367 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2005 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Columnar storage of subtitle data."""
+
+import aeidon
+import array
+import collections.abc
+
+__all__ = ("ObservableSubtitleStore", "SubtitleStore", "SubtitleView")
+
+
+def _column_property(column):
+    """Return a property reading and writing the view's row in `column`."""
+    def get(self):
+        return getattr(self._store, column)[self._row]
+    def set(self, value):
+        getattr(self._store, column)[self._row] = value
+    return property(get, set)
+
+
+def _coded_property(column, items):
+    """Return a property reading and writing the view's row in `column`."""
+    def get(self):
+        code = getattr(self._store, column)[self._row]
+        return getattr(self._store, items)[code]
+    def set(self, value):
+        code = self._store._get_code(getattr(self._store, items), value)
+        getattr(self._store, column)[self._row] = code
+    return property(get, set)
+
+
+def _container_property(name):
+    """Return a property for a lazily instantiated container `name`."""
+    def get(self):
+        containers = self._store._containers.setdefault(self._row, {})
+        if not name in containers:
+            containers[name] = aeidon.containers.new(name)
+        return containers[name]
+    def set(self, value):
+        self._store._containers.setdefault(self._row, {})[name] = value
+    return property(get, set)
+
+
+class SubtitleView(aeidon.Subtitle):
+
+    """
+    Subtitle backed by a row of a :class:`SubtitleStore`.
+
+    :ivar _row: Row of the subtitle's data in the columns of `_store`
+    :ivar _store: :class:`SubtitleStore` instance holding the data
+
+    Views behave like regular subtitles, but hold no data of their own, all
+    attribute access and assignment goes to the columns of the store. A view
+    is valid only as long as its subtitle remains in the store.
+    """
+
+    __slots__ = ("_row", "_store")
+
+    _end = _column_property("_ends")
+    _framerate = _coded_property("_framerates", "_framerate_items")
+    _main_text = _column_property("_main_texts")
+    _mode = _coded_property("_modes", "_mode_items")
+    _record = _column_property("_records")
+    _start = _column_property("_starts")
+    _tran_text = _column_property("_tran_texts")
+
+    def __init__(self, store, row):
+        """Initialize a :class:`SubtitleView` instance."""
+        self._store = store
+        self._row = row
+
+    def has_container(self, name):
+        """Return ``True`` if container has been instantiated."""
+        return name in self._store._containers.get(self._row, ())
+
+
+for name in aeidon.subtitle._CONTAINERS:
+    setattr(SubtitleView, name, _container_property(name))
+del name
+
+
+class SubtitleStore(collections.abc.MutableSequence):
+
+    """
+    Columnar storage of subtitle data.
+
+    :ivar _containers: Dictionary mapping rows to dictionaries of containers
+    :ivar _ends: Array of end positions in internal units
+    :ivar _framerate_items: List of :attr:`aeidon.framerates` items by code
+    :ivar _framerates: Array of codes of framerates
+    :ivar _free: List of rows not in use, available for new subtitles
+    :ivar _main_texts: List of main texts
+    :ivar _mode_items: List of :attr:`aeidon.modes` items by code
+    :ivar _modes: Array of codes of modes
+    :ivar _order: Array of rows in order of subtitles
+    :ivar _records: List of unmodified records read from a file or ``None``
+    :ivar _starts: Array of start positions in internal units
+    :ivar _tran_texts: List of translation texts
+
+    :class:`SubtitleStore` can be used in place of a list of subtitles as
+    :attr:`aeidon.Project.subtitles` (see the `columnar` argument of
+    :class:`aeidon.Project`). Instead of keeping a full :class:`aeidon.Subtitle`
+    instance per subtitle, data is kept in parallel columns, of which positions
+    are kept as packed arrays of integers and framerates and modes as packed
+    arrays of small integer codes. Format-specific containers are kept only
+    for subtitles that have them instantiated.
+
+    Indexing returns lightweight :class:`aeidon.Subtitle` views that read and
+    write the columns directly. Inserting a subtitle copies its data into the
+    columns and removing a subtitle returns a detached copy of its data. Bulk
+    operations can use :meth:`get_positions` and :meth:`get_texts` to scan
+    the columns without creating any views.
+    """
+
+    def __init__(self, subtitles=()):
+        """Initialize a :class:`SubtitleStore` instance."""
+        self._containers = {}
+        self._ends = array.array("q")
+        self._framerate_items = []
+        self._framerates = array.array("B")
+        self._free = []
+        self._main_texts = []
+        self._mode_items = []
+        self._modes = array.array("B")
+        self._order = array.array("q")
+        self._records = []
+        self._starts = array.array("q")
+        self._tran_texts = []
+        SubtitleStore.extend(self, subtitles)
+
+    def __delitem__(self, index):
+        """Remove subtitle at `index`."""
+        if isinstance(index, slice):
+            for i in sorted(range(*index.indices(len(self))), reverse=True):
+                self._free_row(self._order.pop(i))
+            return
+        self._free_row(self._order.pop(index))
+
+    def __eq__(self, other):
+        """Compare subtitles of store and sequence `other` by value."""
+        if not isinstance(other, collections.abc.Sequence):
+            return NotImplemented
+        return (len(self) == len(other) and
+                all(x == y for x, y in zip(self, other)))
+
+    def __getitem__(self, index):
+        """Return subtitle view or list of views at `index`."""
+        if isinstance(index, slice):
+            return [SubtitleView(self, x) for x in self._order[index]]
+        return SubtitleView(self, self._order[index])
+
+    def __iter__(self):
+        """Iterate over subtitle views in order."""
+        for row in self._order:
+            yield SubtitleView(self, row)
+
+    def __len__(self):
+        """Return the amount of subtitles."""
+        return len(self._order)
+
+    def __setitem__(self, index, subtitle):
+        """
+        Replace data of subtitle at `index` with that of `subtitle`.
+
+        If `index` is a slice, `subtitle` should be a sequence of subtitles,
+        which can differ in length from the slice unless it is extended.
+        """
+        if not isinstance(index, slice):
+            return self._write_row(self._order[index], subtitle)
+        # Detach views of this store, whose rows can be
+        # freed and reused before they have been copied.
+        subtitles = [x.copy() if isinstance(x, SubtitleView) else x
+                     for x in subtitle]
+
+        start, stop, step = index.indices(len(self))
+        if step != 1:
+            rows = self._order[index]
+            if len(subtitles) != len(rows):
+                raise ValueError("Attempt to assign sequence of size {:d} "
+                                 "to extended slice of size {:d}"
+                                 .format(len(subtitles), len(rows)))
+
+            for row, subtitle in zip(rows, subtitles):
+                self._write_row(row, subtitle)
+            return
+        stop = max(start, stop)
+        for row in self._order[start:stop]:
+            self._free_row(row)
+        rows = array.array("q")
+        for subtitle in subtitles:
+            rows.append(self._new_row())
+            self._write_row(rows[-1], subtitle)
+        self._order[start:stop] = rows
+
+    def clear(self):
+        """Remove all subtitles."""
+        SubtitleStore.__init__(self)
+
+    def extend(self, subtitles):
+        """Append data of all of `subtitles`."""
+        if subtitles is self:
+            subtitles = list(subtitles)
+        for subtitle in subtitles:
+            row = self._new_row()
+            self._write_row(row, subtitle)
+            self._order.append(row)
+
+    def _free_row(self, row):
+        """Release `row` for reuse and drop references to its data."""
+        self._main_texts[row] = ""
+        self._tran_texts[row] = ""
+        self._records[row] = None
+        self._containers.pop(row, None)
+        self._free.append(row)
+
+    def _get_code(self, items, item):
+        """Return code of `item` in `items`, adding `item` if missing."""
+        try:
+            return items.index(item)
+        except ValueError:
+            items.append(item)
+            return len(items) - 1
+
+    def get_positions(self, indices=None):
+        """
+        Return lists of start and end positions in internal units.
+
+        Internal units are integer milliseconds for subtitles in time mode and
+        integer frames for subtitles in frame mode. `indices` can be ``None``
+        to return positions of all subtitles.
+        """
+        rows = (self._order if indices is None else
+                [self._order[i] for i in indices])
+        return (list(map(self._starts.__getitem__, rows)),
+                list(map(self._ends.__getitem__, rows)))
+
+    def get_texts(self, doc, indices=None):
+        """
+        Return list of texts corresponding to `doc`.
+
+        `indices` can be ``None`` to return texts of all subtitles.
+        """
+        if doc == aeidon.documents.MAIN:
+            texts = self._main_texts
+        elif doc == aeidon.documents.TRAN:
+            texts = self._tran_texts
+        else:
+            raise ValueError("Invalid document: {}"
+                             .format(repr(doc)))
+        rows = (self._order if indices is None else
+                [self._order[i] for i in indices])
+        return list(map(texts.__getitem__, rows))
+
+    def insert(self, index, subtitle):
+        """Insert data of `subtitle` at `index`."""
+        row = self._new_row()
+        self._write_row(row, subtitle)
+        self._order.insert(index, row)
+
+    def _new_row(self):
+        """Return a row available for a new subtitle."""
+        if self._free:
+            return self._free.pop()
+        self._starts.append(0)
+        self._ends.append(0)
+        self._main_texts.append("")
+        self._tran_texts.append("")
+        self._modes.append(0)
+        self._framerates.append(0)
+        self._records.append(None)
+        return len(self._starts) - 1
+
+    def pop(self, index=-1):
+        """Remove and return a detached copy of subtitle at `index`."""
+        row = self._order.pop(index)
+        subtitle = SubtitleView(self, row).copy()
+        self._free_row(row)
+        return subtitle
+
+    def reverse(self):
+        """Reverse the order of subtitles in place."""
+        self._order.reverse()
+
+    def _write_row(self, row, subtitle):
+        """Write data of `subtitle` to `row`."""
+        containers = {}
+        for name in aeidon.subtitle._CONTAINERS:
+            if subtitle.has_container(name):
+                containers[name] = getattr(subtitle, name)
+        values = (subtitle._start,
+                  subtitle._end,
+                  subtitle._main_text,
+                  subtitle._tran_text,
+                  self._get_code(self._mode_items, subtitle._mode),
+                  self._get_code(self._framerate_items, subtitle._framerate),
+                  subtitle._record)
+
+        (self._starts[row],
+         self._ends[row],
+         self._main_texts[row],
+         self._tran_texts[row],
+         self._modes[row],
+         self._framerates[row],
+         self._records[row]) = values
+        self._containers.pop(row, None)
+        if containers:
+            self._containers[row] = containers
+
+
+class ObservableSubtitleStore(SubtitleStore):
+
+    """
+    Observable version of :class:`SubtitleStore`.
+
+    :ivar master: Master instance with a ``notify`` method
+    :ivar name: Argument passed when calling :attr:`master`'s ``notify`` method
+    """
+
+    def __init__(self, *args):
+        """Initialize an :class:`ObservableSubtitleStore` instance."""
+        SubtitleStore.__init__(self, *args[:-2])
+        self.master = args[-2]
+        self.name = args[-1]
+
+    def __delitem__(self, index):
+        SubtitleStore.__delitem__(self, index)
+        self.master.notify(self.name)
+
+    def __setitem__(self, index, subtitle):
+        SubtitleStore.__setitem__(self, index, subtitle)
+        self.master.notify(self.name)
+
+    def clear(self):
+        SubtitleStore.clear(self)
+        self.master.notify(self.name)
+
+    def extend(self, subtitles):
+        SubtitleStore.extend(self, subtitles)
+        self.master.notify(self.name)
+
+    def insert(self, index, subtitle):
+        SubtitleStore.insert(self, index, subtitle)
+        self.master.notify(self.name)
+
+    def pop(self, index=-1):
+        subtitle = SubtitleStore.pop(self, index)
+        self.master.notify(self.name)
+        return subtitle
+
+    def reverse(self):
+        SubtitleStore.reverse(self)
+        self.master.notify(self.name)
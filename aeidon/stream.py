@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2005 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Streaming subtitle transformations without a project.
+
+Subtitles are read one at a time from a source file, passed through stages
+joined with the ``|`` operator and written one at a time to a target file::
+
+    stream = aeidon.stream.open("input.ssa")
+    stream = stream | aeidon.stream.shift(2.0)
+    stream = stream | aeidon.stream.convert_markup(aeidon.formats.SUBRIP)
+    stream | aeidon.stream.write("output.srt", aeidon.formats.SUBRIP)
+
+Since subtitles are generated lazily, only a few subtitles are held in memory
+at any time regardless of the size of the file. No undo, signals or other
+:class:`aeidon.Project` machinery is involved, stages operate only on main
+texts and positions of :class:`aeidon.Subtitle` instances.
+"""
+
+import aeidon
+import itertools
+
+
+class Stream:
+
+    """
+    Iterator of subtitles passing through a pipeline.
+
+    :ivar file: Source :class:`aeidon.SubtitleFile` instance or ``None``
+    :ivar subtitles: Iterator of :class:`aeidon.Subtitle` instances
+
+    Stages are callables that accept a stream and return a new stream (or in
+    the case of terminal stages, such as :func:`write`, some other result).
+    A stage is applied to a stream with ``stream | stage``.
+    """
+
+    def __init__(self, subtitles, file=None):
+        """Initialize a :class:`Stream` instance."""
+        self.file = file
+        self.subtitles = iter(subtitles)
+
+    def __iter__(self):
+        """Return iterator of subtitles."""
+        return self.subtitles
+
+    def __or__(self, stage):
+        """Return result of applying `stage` to stream."""
+        return stage(self)
+
+
+def apply(function):
+    """Return a stage calling `function` on each subtitle."""
+    def stage(stream):
+        def generate(subtitles):
+            for subtitle in subtitles:
+                function(subtitle)
+                yield subtitle
+        return Stream(generate(stream.subtitles), stream.file)
+    return stage
+
+def convert_framerate(framerate):
+    """Return a stage converting positions of subtitles to `framerate`."""
+    return apply(lambda x: x.convert_framerate(framerate))
+
+def convert_markup(format, from_format=None):
+    """
+    Return a stage converting markup of texts to `format`.
+
+    `from_format` can be ``None`` to use the format of the source file.
+
+    Raise :exc:`ValueError` if `from_format` is ``None`` and the stream has
+    no source file.
+    """
+    def stage(stream):
+        source = from_format
+        if source is None and stream.file is not None:
+            source = stream.file.format
+        if source is None:
+            raise ValueError("Markup format not given and no source file")
+        if source == format: return stream
+        converter = aeidon.MarkupConverter(source, format)
+        def convert(subtitle):
+            subtitle.main_text = converter.convert(subtitle.main_text)
+        return apply(convert)(stream)
+    return stage
+
+def open(path, encoding=None, framerate=None):
+    """
+    Return a new :class:`Stream` of subtitles read from file at `path`.
+
+    `encoding` can be ``None`` to use the system default encoding.
+    `framerate` can be ``None`` to use the default framerate of subtitles.
+    Subtitles are read and parsed one at a time when iterated over.
+
+    Raise :exc:`IOError` if reading fails.
+    Raise :exc:`UnicodeError` if decoding fails.
+    Raise :exc:`aeidon.FormatError` if unable to detect format.
+    """
+    encoding = encoding or aeidon.util.get_default_encoding()
+    encoding = aeidon.encodings.detect_bom(path) or encoding
+    # Avoid aeidon.files.load, which reads the whole file to memory.
+    # Format detection reads only as far as needed to detect it.
+    format = aeidon.util.detect_format(path, encoding)
+    file = aeidon.files.new(format, path, encoding)
+    stream = Stream(file.iter_subtitles(), file)
+    if framerate is None: return stream
+    return stream | set_framerate(framerate)
+
+def scale(value):
+    """Return a stage multiplying positions of subtitles by `value`."""
+    return apply(lambda x: x.scale_positions(value))
+
+def set_framerate(framerate):
+    """Return a stage setting framerate of subtitles without conversion."""
+    return apply(lambda x: setattr(x, "framerate", framerate))
+
+def shift(value):
+    """Return a stage adding `value` to positions of subtitles."""
+    return apply(lambda x: x.shift_positions(value))
+
+def write(path, format=None, encoding=None, newline=None):
+    """
+    Return a stage writing subtitles to file at `path`.
+
+    `format`, `encoding` and `newline` can be ``None`` to use those of the
+    source file. Without a source file, `encoding` defaults to the system
+    default encoding and `newline` to the system default newline. Subtitles
+    are written one at a time as they are generated. The stage returns the
+    written :class:`aeidon.SubtitleFile` instance.
+
+    Raise :exc:`IOError` if reading or writing fails.
+    Raise :exc:`UnicodeError` if decoding or encoding fails.
+    Raise :exc:`ValueError` if `format` is ``None`` and the stream has no
+    source file.
+    """
+    def stage(stream):
+        subtitles = iter(stream.subtitles)
+        # Generate the first subtitle before creating the file in order to
+        # have the source file header and other properties available.
+        first = list(itertools.islice(subtitles, 1))
+        source = stream.file
+        file_format = format or (
+            source.format if source is not None else None)
+        if file_format is None:
+            raise ValueError("Format not given and no source file")
+        file_encoding = encoding or (
+            source.encoding if source is not None else None)
+        file_newline = newline or (
+            source.newline if source is not None else None)
+        file = aeidon.files.new(
+            file_format,
+            path,
+            file_encoding or aeidon.util.get_default_encoding(),
+            file_newline)
+
+        if source is not None:
+            file.copy_from(source)
+        file.write(itertools.chain(first, subtitles), aeidon.documents.MAIN)
+        return file
+    return stage
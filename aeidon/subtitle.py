@@ -22,6 +22,10 @@ import copy
 
 __all__ = ("Subtitle",)
 
+# Names of all format-specific attribute containers, e.g. "ssa".
+_CONTAINERS = tuple(sorted(set(x.container for x in aeidon.formats
+                               if x.container is not None)))
+
 
 class Subtitle:
 
@@ -42,31 +46,53 @@ class Subtitle:
     :ivar duration_seconds: Duration in seconds as float
     :ivar main_text: Main text
     :ivar tran_text: Translation text
-    :ivar calc: :class:`aeidon.Calculator` instance used
+    :ivar calc: :class:`aeidon.Calculator` instance for framerate
     :ivar framerate: :attr:`aeidon.framerates` item
     :ivar mode: :attr:`aeidon.modes` item
+    :ivar _record: Tuple of data identifying the unmodified record in a file
 
     Positions can be set as times, frames or seconds.
     Use :func:`aeidon.as_time`, :func:`aeidon.as_frame` or
     :func:`aeidon.as_seconds` if necessary to ensure correct type.
 
+    Internally times are stored as integer milliseconds and frames as integer
+    frames, which allows fast arithmetic and comparisons. Times are converted
+    to strings only when accessed via the ``*_time`` properties.
+
     Additional format-specific attributes are kept under separate containers,
     e.g. ``ssa`` for Sub Station Alpha formats, accessed as ``subtitle.ssa.*``.
     These containers are lazily created upon first use in order to avoid slow
     instantiation and excessive memory use when handling simpler formats.
+
+    Since projects can consist of very large amounts of subtitles, instances
+    use ``__slots__`` instead of an instance dictionary and share a common
+    :class:`aeidon.Calculator` instance per framerate.
+
+    Subtitles read from a file can keep the raw text of the record they were
+    read from along with the values decoded from it, so that subtitles whose
+    positions and texts remain unchanged can be written back verbatim, see
+    :class:`aeidon.SubtitleFile`.
     """
 
+    __slots__ = (
+        "_end",
+        "_framerate",
+        "_main_text",
+        "_mode",
+        "_record",
+        "_start",
+        "_tran_text",
+    ) + _CONTAINERS
+
     def __init__(self, mode=None, framerate=None):
         """Initialize a :class:`Subtitle` instance."""
-        self._start = None
-        self._end = None
+        self._start = 0
+        self._end = 0
         self._main_text = ""
         self._tran_text = ""
         self._mode = mode or aeidon.modes.TIME
         self._framerate = framerate or aeidon.framerates.FPS_23_976
-        self.calc = aeidon.Calculator(self._framerate)
-        self.start = "00:00:00.000"
-        self.end = "00:00:00.000"
+        self._record = None
 
     def __eq__(self, other):
         """Compare subtitle equality by value."""
@@ -81,7 +107,7 @@ class Subtitle:
 
     def __getattr__(self, name):
         """Return lazily instantiated format-specific attribute container."""
-        if name in (x.container for x in aeidon.formats):
+        if name in _CONTAINERS:
             # Lazily instantiate a new container.
             container = aeidon.containers.new(name)
             object.__setattr__(self, name, container)
@@ -91,6 +117,8 @@ class Subtitle:
 
     def __ge__(self, other):
         """Compare start positions."""
+        if self._mode == other._mode == aeidon.modes.TIME:
+            return self._start >= other._start
         if self._mode == aeidon.modes.TIME:
             return self.start_seconds >= other.start_seconds
         if self._mode == aeidon.modes.FRAME:
@@ -100,6 +128,8 @@ class Subtitle:
 
     def __gt__(self, other):
         """Compare start positions."""
+        if self._mode == other._mode == aeidon.modes.TIME:
+            return self._start > other._start
         if self._mode == aeidon.modes.TIME:
             return self.start_seconds > other.start_seconds
         if self._mode == aeidon.modes.FRAME:
@@ -109,6 +139,8 @@ class Subtitle:
 
     def __le__(self, other):
         """Compare start positions."""
+        if self._mode == other._mode == aeidon.modes.TIME:
+            return self._start <= other._start
         if self._mode == aeidon.modes.TIME:
             return self.start_seconds <= other.start_seconds
         if self._mode == aeidon.modes.FRAME:
@@ -118,6 +150,8 @@ class Subtitle:
 
     def __lt__(self, other):
         """Compare start positions."""
+        if self._mode == other._mode == aeidon.modes.TIME:
+            return self._start < other._start
         if self._mode == aeidon.modes.TIME:
             return self.start_seconds < other.start_seconds
         if self._mode == aeidon.modes.FRAME:
@@ -129,32 +163,26 @@ class Subtitle:
         """Set framerate and convert positions to it."""
         coefficient = framerate.value / self._framerate.value
         if self._mode == aeidon.modes.TIME:
-            self.start_seconds = self.start_seconds / coefficient
-            self.end_seconds = self.end_seconds / coefficient
+            self._start = round(self._start / coefficient)
+            self._end = round(self._end / coefficient)
         if self._mode == aeidon.modes.FRAME:
             self.start_frame = round(coefficient * self.start_frame)
             self.end_frame = round(coefficient * self.end_frame)
         self.framerate = framerate
 
+    @property
+    def calc(self):
+        """Return :class:`aeidon.Calculator` instance for framerate."""
+        return aeidon.Calculator(self._framerate)
+
     def _convert_position(self, value):
-        """Return `value` of position in correct mode."""
-        if aeidon.is_time(value):
-            if self._mode == aeidon.modes.TIME:
-                return value
-            if self._mode == aeidon.modes.FRAME:
-                return self.calc.time_to_frame(value)
-        if aeidon.is_frame(value):
-            if self._mode == aeidon.modes.TIME:
-                return self.calc.frame_to_time(value)
-            if self._mode == aeidon.modes.FRAME:
-                return value
-        if aeidon.is_seconds(value):
-            if self._mode == aeidon.modes.TIME:
-                return self.calc.seconds_to_time(value)
-            if self._mode == aeidon.modes.FRAME:
-                return self.calc.seconds_to_frame(value)
-        raise ValueError("Invalid type for value: {}"
-                         .format(repr(type(value))))
+        """Return `value` of position in correct internal units."""
+        if self._mode == aeidon.modes.TIME:
+            return self.calc.to_milliseconds(value)
+        if self._mode == aeidon.modes.FRAME:
+            return self.calc.to_frame(value)
+        raise ValueError("Invalid mode: {}"
+                         .format(repr(self._mode)))
 
     def copy(self):
         """Return a new subtitle instance with the same values."""
@@ -163,10 +191,11 @@ class Subtitle:
         subtitle._end = self._end
         subtitle._main_text = self._main_text
         subtitle._tran_text = self._tran_text
+        subtitle._record = self._record
         # Copy all containers that have been instantiated.
-        containers = (x.container for x in aeidon.formats)
-        for name in set(dir(self)) & set(containers):
-            container = copy.deepcopy(getattr(self, name))
+        for name in _CONTAINERS:
+            if not self.has_container(name): continue
+            container = copy.copy(getattr(self, name))
             setattr(subtitle, name, container)
         return subtitle
 
@@ -183,8 +212,7 @@ class Subtitle:
     @duration.setter
     def duration(self, value):
         """Set duration from `value`."""
-        value = self._convert_position(value)
-        self._end = self.calc.add(self._start, value)
+        self._end = self._start + self._convert_position(value)
 
     @property
     def duration_frame(self):
@@ -209,6 +237,8 @@ class Subtitle:
     @property
     def duration_time(self):
         """Return duration as time."""
+        if self._mode == aeidon.modes.TIME:
+            return self.calc.milliseconds_to_time(self._end - self._start)
         return self.calc.seconds_to_time(self.duration_seconds)
 
     @duration_time.setter
@@ -219,6 +249,8 @@ class Subtitle:
     @property
     def end(self):
         """Return end position in correct mode."""
+        if self._mode == aeidon.modes.TIME:
+            return self.calc.milliseconds_to_time(self._end)
         return self._end
 
     @end.setter
@@ -230,7 +262,7 @@ class Subtitle:
     def end_frame(self):
         """Return end position as frames."""
         if self._mode == aeidon.modes.TIME:
-            return self.calc.time_to_frame(self._end)
+            return self.calc.seconds_to_frame(self._end / 1000)
         if self._mode == aeidon.modes.FRAME:
             return self._end
         raise ValueError("Invalid mode: {}"
@@ -244,7 +276,12 @@ class Subtitle:
     @property
     def end_seconds(self):
         """Return end position as seconds."""
-        return self.calc.time_to_seconds(self.end_time)
+        if self._mode == aeidon.modes.TIME:
+            return self._end / 1000
+        if self._mode == aeidon.modes.FRAME:
+            return self.calc.to_milliseconds(self._end) / 1000
+        raise ValueError("Invalid mode: {}"
+                         .format(repr(self._mode)))
 
     @end_seconds.setter
     def end_seconds(self, value):
@@ -255,7 +292,7 @@ class Subtitle:
     def end_time(self):
         """Return end position as time."""
         if self._mode == aeidon.modes.TIME:
-            return self._end
+            return self.calc.milliseconds_to_time(self._end)
         if self._mode == aeidon.modes.FRAME:
             return self.calc.frame_to_time(self._end)
         raise ValueError("Invalid mode: {}"
@@ -275,7 +312,6 @@ class Subtitle:
     def framerate(self, value):
         """Set framerate from `value`."""
         self._framerate = value
-        self.calc = aeidon.Calculator(value)
 
     def get_duration(self, mode):
         """Return duration in `mode`."""
@@ -315,7 +351,12 @@ class Subtitle:
 
     def has_container(self, name):
         """Return ``True`` if container has been instantiated."""
-        return name in dir(self)
+        try:
+            # Bypass __getattr__ to avoid instantiating the container.
+            object.__getattribute__(self, name)
+            return True
+        except AttributeError:
+            return False
 
     @property
     def main_text(self):
@@ -335,9 +376,10 @@ class Subtitle:
     @mode.setter
     def mode(self, mode):
         """Set current position mode."""
+        if mode == self._mode: return
         if mode == aeidon.modes.TIME:
-            self._start = self.start_time
-            self._end = self.end_time
+            self._start = self.calc.to_milliseconds(self._start)
+            self._end = self.calc.to_milliseconds(self._end)
         if mode == aeidon.modes.FRAME:
             self._start = self.start_frame
             self._end = self.end_frame
@@ -346,8 +388,8 @@ class Subtitle:
     def scale_positions(self, value):
         """Multiply start and end positions by `value`."""
         if self._mode == aeidon.modes.TIME:
-            self.start_seconds = self.start_seconds * value
-            self.end_seconds = self.end_seconds * value
+            self._start = round(self._start * value)
+            self._end = round(self._end * value)
         if self._mode == aeidon.modes.FRAME:
             self.start_frame = round(self._start * value)
             self.end_frame = round(self._end * value)
@@ -361,12 +403,15 @@ class Subtitle:
 
     def shift_positions(self, value):
         """Add `value` to start and end positions."""
-        self._start = self.calc.add(self._start, value)
-        self._end = self.calc.add(self._end, value)
+        value = self._convert_position(value)
+        self._start += value
+        self._end += value
 
     @property
     def start(self):
         """Return start position in correct mode."""
+        if self._mode == aeidon.modes.TIME:
+            return self.calc.milliseconds_to_time(self._start)
         return self._start
 
     @start.setter
@@ -378,7 +423,7 @@ class Subtitle:
     def start_frame(self):
         """Return start position as frames."""
         if self._mode == aeidon.modes.TIME:
-            return self.calc.time_to_frame(self._start)
+            return self.calc.seconds_to_frame(self._start / 1000)
         if self._mode == aeidon.modes.FRAME:
             return self._start
         raise ValueError("Invalid mode: {}"
@@ -392,7 +437,12 @@ class Subtitle:
     @property
     def start_seconds(self):
         """Return start position as seconds."""
-        return self.calc.time_to_seconds(self.start_time)
+        if self._mode == aeidon.modes.TIME:
+            return self._start / 1000
+        if self._mode == aeidon.modes.FRAME:
+            return self.calc.to_milliseconds(self._start) / 1000
+        raise ValueError("Invalid mode: {}"
+                         .format(repr(self._mode)))
 
     @start_seconds.setter
     def start_seconds(self, value):
@@ -403,7 +453,7 @@ class Subtitle:
     def start_time(self):
         """Return start position as time."""
         if self._mode == aeidon.modes.TIME:
-            return self._start
+            return self.calc.milliseconds_to_time(self._start)
         if self._mode == aeidon.modes.FRAME:
             return self.calc.frame_to_time(self._start)
         raise ValueError("Invalid mode: {}"
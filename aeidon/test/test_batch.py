@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2006 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+import random
+
+MAIN = aeidon.documents.MAIN
+
+
+class TestBatch(aeidon.TestCase):
+
+    def setup_method(self, method):
+        self.batch = aeidon.Batch()
+
+    def test_add__changed(self):
+        self.batch.add("main-texts-changed", [3, 1])
+        self.batch.add("main-texts-changed", [2])
+        self.batch.add("positions-changed", [0])
+        assert self.batch.get_signals() == [
+            ("main-texts-changed", [1, 2, 3]),
+            ("positions-changed", [0])]
+
+    def test_add__inserted(self):
+        self.batch.add("main-texts-changed", [1, 2, 5])
+        self.batch.add("subtitles-inserted", [2, 3])
+        self.batch.add("subtitles-inserted", [0])
+        assert self.batch.get_signals() == [
+            ("subtitles-inserted", [0, 3, 4]),
+            ("main-texts-changed", [2, 5, 8])]
+
+    def test_add__other(self):
+        assert not self.batch.add("main-file-saved", None)
+        assert self.batch.get_signals() == []
+
+    def test_add__random(self):
+        for i in range(100):
+            subtitles = list(range(10))
+            current = subtitles[:]
+            batch = aeidon.Batch()
+            for j in range(10):
+                if current and random.random() < 0.5:
+                    count = random.randint(1, len(current))
+                    indices = random.sample(range(len(current)), count)
+                    for index in sorted(indices, reverse=True):
+                        current.pop(index)
+                    batch.add("subtitles-removed", indices)
+                else:
+                    count = random.randint(1, 3)
+                    indices = random.sample(range(len(current) + count),
+                                            count)
+                    for index in sorted(indices):
+                        current.insert(index, "new")
+                    batch.add("subtitles-inserted", indices)
+            for signal, indices in batch.get_signals():
+                if signal == "subtitles-removed":
+                    for index in reversed(indices):
+                        subtitles.pop(index)
+                if signal == "subtitles-inserted":
+                    for index in indices:
+                        subtitles.insert(index, "new")
+            assert subtitles == current
+
+    def test_add__removed(self):
+        self.batch.add("main-texts-changed", [1, 2, 5])
+        self.batch.add("subtitles-removed", [2, 3])
+        self.batch.add("subtitles-removed", [0])
+        assert self.batch.get_signals() == [
+            ("subtitles-removed", [0, 2, 3]),
+            ("main-texts-changed", [0, 2])]
+
+    def test_add__removed_inserted(self):
+        self.batch.add("subtitles-inserted", [1])
+        self.batch.add("subtitles-removed", [1, 2])
+        assert self.batch.get_signals() == [
+            ("subtitles-removed", [1])]
+
+
+class TestProject(aeidon.TestCase):
+
+    def on_signal(self, project, *args):
+        self.emitted.append(args)
+
+    def setup_method(self, method):
+        self.project = self.new_project()
+        self.emitted = []
+        for signal in ("action-done",
+                       "main-texts-changed",
+                       "subtitles-removed"):
+            self.project.connect(signal, self.on_signal, signal)
+
+    def test_batch(self):
+        texts = [x.main_text for x in self.project.subtitles]
+        with self.project.batch("test"):
+            self.project.set_text(0, MAIN, "a")
+            self.project.set_text(2, MAIN, "b")
+            self.project.remove_subtitles((1,))
+            assert not self.emitted
+        assert self.emitted == [
+            ([1], "subtitles-removed"),
+            ([0, 1], "main-texts-changed"),
+            (self.project.undoables[0], "action-done")]
+        assert len(self.project.undoables) == 1
+        assert self.project.undoables[0].description == "test"
+        self.project.undo()
+        assert [x.main_text for x in self.project.subtitles] == texts
+
+    def test_batch__coalesce(self):
+        self.project.undo_coalesce_time = 60
+        self.project.set_text(0, MAIN, "a")
+        with self.project.batch():
+            self.project.set_text(0, MAIN, "ab")
+            self.project.set_text(1, MAIN, "c")
+            self.project.set_text(1, MAIN, "cd")
+        self.project.set_text(1, MAIN, "cde")
+        assert len(self.project.undoables) == 3
+        self.project.undo(2)
+        assert self.project.subtitles[0].main_text == "a"
+
+    def test_batch__exception(self):
+        try:
+            with self.project.batch():
+                self.project.set_text(0, MAIN, "a")
+                self.project.set_text(1, MAIN, "b")
+                raise ValueError
+        except ValueError:
+            pass
+        assert len(self.project.undoables) == 1
+        assert self.emitted[0] == ([0, 1], "main-texts-changed")
+
+    def test_batch__nested(self):
+        with self.project.batch():
+            self.project.set_text(0, MAIN, "a")
+            with self.project.batch():
+                self.project.set_text(1, MAIN, "b")
+            assert not self.emitted
+            self.project.set_text(2, MAIN, "c")
+        assert len(self.project.undoables) == 1
+        assert self.emitted[0] == ([0, 1, 2], "main-texts-changed")
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2005 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+import os
+
+
+class TestFileCache(aeidon.TestCase):
+
+    def put(self, format, encoding="ascii"):
+        path = self.new_temp_file(format)
+        file = aeidon.files.load(path, encoding)
+        subtitles = file.read()
+        self.cache.put(path, encoding, file, subtitles)
+        return path, file, subtitles
+
+    def setup_method(self, method):
+        directory = aeidon.temp.create_directory()
+        self.cache = aeidon.FileCache(directory)
+
+    def test_clear(self):
+        path, file, subtitles = self.put(aeidon.formats.SUBRIP)
+        self.cache.clear()
+        assert self.cache.get(path, "ascii") is None
+
+    def test_get(self):
+        for format in aeidon.formats:
+            path, file, subtitles = self.put(format)
+            cached_file, cached_subtitles = self.cache.get(path, "ascii")
+            assert cached_file.format == file.format
+            assert cached_file.encoding == file.encoding
+            assert cached_file.header == file.header
+            assert cached_file.newline == file.newline
+            assert cached_subtitles == subtitles
+            for subtitle, cached in zip(subtitles, cached_subtitles):
+                assert cached.main_text == subtitle.main_text
+
+    def test_get__containers(self):
+        format = aeidon.formats.ASS
+        path, file, subtitles = self.put(format)
+        cached_file, cached_subtitles = self.cache.get(path, "ascii")
+        assert cached_file.event_fields == file.event_fields
+        for subtitle, cached in zip(subtitles, cached_subtitles):
+            assert cached.ssa.layer == subtitle.ssa.layer
+            assert cached.ssa.style == subtitle.ssa.style
+            assert cached.ssa.margin_l == subtitle.ssa.margin_l
+
+    def test_get__corrupt(self):
+        path, file, subtitles = self.put(aeidon.formats.SUBRIP)
+        for entry in self.cache._list_entries():
+            open(entry, "wb").write(b"corrupt")
+        assert self.cache.get(path, "ascii") is None
+        assert not self.cache._list_entries()
+
+    def test_get__encoding(self):
+        path, file, subtitles = self.put(aeidon.formats.SUBRIP)
+        assert self.cache.get(path, "utf_8") is None
+
+    def test_get__lazy(self):
+        aeidon.files.SubStationAlpha.lazy = True
+        try:
+            path, file, subtitles = self.put(aeidon.formats.ASS)
+        finally:
+            aeidon.files.SubStationAlpha.lazy = False
+        assert self.cache.get(path, "ascii") is None
+
+    def test_get__modified(self):
+        path, file, subtitles = self.put(aeidon.formats.SUBRIP)
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert self.cache.get(path, "ascii") is None
+
+    def test_get__records(self):
+        for format in aeidon.formats:
+            path, file, subtitles = self.put(format)
+            cached_file, cached_subtitles = self.cache.get(path, "ascii")
+            doc = aeidon.documents.MAIN
+            for subtitle, cached in zip(subtitles, cached_subtitles):
+                assert (cached_file._get_record(cached, doc) ==
+                        file._get_record(subtitle, doc))
+
+    def test_put__evict(self):
+        path1, file, subtitles = self.put(aeidon.formats.SUBRIP)
+        size = os.path.getsize(self.cache._list_entries()[0])
+        self.cache.max_size = size + 1
+        os.utime(self.cache._list_entries()[0], ns=(0, 0))
+        path2, file, subtitles = self.put(aeidon.formats.MICRODVD)
+        assert self.cache.get(path1, "ascii") is None
+        assert self.cache.get(path2, "ascii") is not None
+
+    def test_put__size(self):
+        path, file, subtitles = self.put(aeidon.formats.SUBRIP)
+        path, file, subtitles = self.put(aeidon.formats.MICRODVD)
+        entries = self.cache._list_entries()
+        assert self.cache._size == sum(map(os.path.getsize, entries))
@@ -51,6 +51,14 @@ class TestCalculator(aeidon.TestCase):
     def test_frame_to_time(self):
         assert self.calc.frame_to_time(2658) == "00:01:50.861"
 
+    def test_frames_to_seconds(self):
+        calc = aeidon.Calculator(aeidon.framerates.FPS_25_000)
+        assert calc.frames_to_seconds([127, 25]) == [5.08, 1.0]
+
+    def test_frames_to_times(self):
+        times = self.calc.frames_to_times([2658, 0])
+        assert times == ["00:01:50.861", "00:00:00.000"]
+
     def test_get_middle__frame(self):
         assert self.calc.get_middle(300, 400) == 350
 
@@ -99,6 +107,17 @@ class TestCalculator(aeidon.TestCase):
         assert self.calc.is_valid_time("12:34:56.789")
         assert self.calc.is_valid_time("-12:34:56.789")
 
+    def test_milliseconds_to_time(self):
+        assert self.calc.milliseconds_to_time(13522117) == "03:45:22.117"
+        assert self.calc.milliseconds_to_time(-1500) == "-00:00:01.500"
+
+    def test_milliseconds_to_time__overflow(self):
+        assert self.calc.milliseconds_to_time(10**10) == "99:59:59.999"
+
+    def test_milliseconds_to_times(self):
+        times = self.calc.milliseconds_to_times([13522117, -1500])
+        assert times == ["03:45:22.117", "-00:00:01.500"]
+
     def test_normalize_time(self):
         assert self.calc.normalize_time("1:2:3.4") == "01:02:03.400"
         assert self.calc.normalize_time("-1:2:3,4") == "-01:02:03.400"
@@ -118,26 +137,65 @@ class TestCalculator(aeidon.TestCase):
     def test_seconds_to_time(self):
         assert self.calc.seconds_to_time(68951.15388) == "19:09:11.154"
 
+    def test_seconds_to_times(self):
+        times = self.calc.seconds_to_times((68951.15388, 0.0))
+        assert times == ["19:09:11.154", "00:00:00.000"]
+
     def test_time_to_frame(self):
         assert self.calc.time_to_frame("01:22:36.144") == 118829
 
+    def test_time_to_milliseconds(self):
+        assert self.calc.time_to_milliseconds("03:45:22.117") == 13522117
+        assert self.calc.time_to_milliseconds("-00:00:01.500") == -1500
+
     def test_time_to_seconds(self):
         assert self.calc.time_to_seconds("03:45:22.117") == 13522.117
 
+    def test_times_to_seconds(self):
+        seconds = self.calc.times_to_seconds(("03:45:22.117", "-00:00:01.500"))
+        assert seconds == [13522.117, -1.5]
+
     def test_to_frame(self):
         self.calc = aeidon.Calculator(aeidon.framerates.FPS_25_000)
         assert self.calc.to_frame("00:00:01.000") == 25
         assert self.calc.to_frame(25) == 25
         assert self.calc.to_frame(1.0) == 25
 
+    def test_to_frames_many(self):
+        self.calc = aeidon.Calculator(aeidon.framerates.FPS_25_000)
+        assert self.calc.to_frames_many(["00:00:01.000"]) == [25]
+        assert self.calc.to_frames_many([25]) == [25]
+        assert self.calc.to_frames_many([1.0]) == [25]
+        assert self.calc.to_frames_many([25, 1.0]) == [25, 25]
+
+    def test_to_milliseconds(self):
+        self.calc = aeidon.Calculator(aeidon.framerates.FPS_25_000)
+        assert self.calc.to_milliseconds("00:00:01.000") == 1000
+        assert self.calc.to_milliseconds(25) == 1000
+        assert self.calc.to_milliseconds(1.0) == 1000
+
     def test_to_seconds(self):
         self.calc = aeidon.Calculator(aeidon.framerates.FPS_25_000)
         assert self.calc.to_seconds("00:00:01.000") == 1.0
         assert self.calc.to_seconds(25) == 1.0
         assert self.calc.to_seconds(1.0) == 1.0
 
+    def test_to_seconds_many(self):
+        self.calc = aeidon.Calculator(aeidon.framerates.FPS_25_000)
+        assert self.calc.to_seconds_many(["00:00:01.000"]) == [1.0]
+        assert self.calc.to_seconds_many([25]) == [1.0]
+        assert self.calc.to_seconds_many([1.0]) == [1.0]
+        assert self.calc.to_seconds_many([25, "00:00:01.000"]) == [1.0, 1.0]
+
     def test_to_time(self):
         self.calc = aeidon.Calculator(aeidon.framerates.FPS_25_000)
         assert self.calc.to_time("00:00:01.000") == "00:00:01.000"
         assert self.calc.to_time(25) == "00:00:01.000"
         assert self.calc.to_time(1.0) == "00:00:01.000"
+
+    def test_to_times_many(self):
+        self.calc = aeidon.Calculator(aeidon.framerates.FPS_25_000)
+        assert self.calc.to_times_many(["00:00:01.000"]) == ["00:00:01.000"]
+        assert self.calc.to_times_many([25]) == ["00:00:01.000"]
+        assert self.calc.to_times_many([1.0]) == ["00:00:01.000"]
+        assert self.calc.to_times_many([]) == []
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2005 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+import aeidon.cli
+import argparse
+import json
+import os
+import shutil
+
+import pytest
+
+
+class TestModule(aeidon.TestCase):
+
+    def main(self, *args):
+        with pytest.raises(SystemExit) as info:
+            aeidon.cli.main(list(args))
+        return info.value.code
+
+    def setup_method(self, method):
+        self.input_dir = aeidon.temp.create_directory()
+        self.output_dir = aeidon.temp.create_directory()
+        for i in range(3):
+            shutil.copy(self.new_subrip_file(),
+                        os.path.join(self.input_dir, "{:d}.srt".format(i)))
+
+    def read_output(self, name):
+        path = os.path.join(self.output_dir, name)
+        return aeidon.files.load(path, "ascii").read()
+
+    def test_main(self):
+        code = self.main("-e", "ascii",
+                         "-o", self.output_dir,
+                         "-f", "microdvd",
+                         "--framerate", "25",
+                         "-j", "1",
+                         self.input_dir)
+
+        assert code == 0
+        for i in range(3):
+            name = "{:d}.sub".format(i)
+            path = os.path.join(self.output_dir, name)
+            assert aeidon.util.detect_format(path, "ascii") == (
+                aeidon.formats.MICRODVD)
+
+    def test_main__corrections(self):
+        code = self.main("-e", "ascii",
+                         "-o", self.output_dir,
+                         "--correct-common-errors",
+                         "--remove-hearing-impaired",
+                         "--language", "Latn-en",
+                         "-j", "1",
+                         self.input_dir)
+
+        assert code == 0
+        assert self.read_output("0.srt")
+
+    def test_main__failure(self):
+        path = os.path.join(self.input_dir, "3.srt")
+        with open(path, "w", encoding="ascii") as f:
+            f.write("not a subtitle file\n")
+        summary = aeidon.temp.create(".json")
+        code = self.main("-e", "ascii",
+                         "-o", self.output_dir,
+                         "--summary", summary,
+                         "-j", "1",
+                         self.input_dir)
+
+        assert code == 1
+        with open(summary, "r", encoding="utf_8") as f:
+            summary = json.load(f)
+        assert summary["total"] == 4
+        assert summary["converted"] == 3
+        assert summary["failed"] == 1
+        assert summary["failures"][0]["path"] == path
+
+    def test_main__in_place(self):
+        code = self.main("-e", "ascii", "--in-place", "-j", "1",
+                         self.input_dir)
+        assert code == 0
+
+    def test_main__in_place_missing(self):
+        code = self.main("-e", "ascii", "-j", "1", self.input_dir)
+        assert code != 0
+
+    def test_main__parallel(self):
+        code = self.main("-e", "ascii",
+                         "-o", self.output_dir,
+                         "--shift", "1.5",
+                         "--newline", "windows",
+                         "-j", "2",
+                         self.input_dir)
+
+        assert code == 0
+        orig = aeidon.files.load(
+            os.path.join(self.input_dir, "0.srt"), "ascii").read()
+        subtitles = self.read_output("0.srt")
+        for subtitle, orig in zip(subtitles, orig):
+            shift = subtitle.start_seconds - orig.start_seconds
+            assert abs(shift - 1.5) < 0.001
+        path = os.path.join(self.output_dir, "0.srt")
+        with open(path, "rb") as f:
+            assert b"\r\n" in f.read()
+
+    def test__parse_framerate(self):
+        framerate = aeidon.cli._parse_framerate("23.976")
+        assert framerate == aeidon.framerates.FPS_23_976
+
+    def test__parse_framerate__invalid(self):
+        for value in ("abc", "31"):
+            try:
+                aeidon.cli._parse_framerate(value)
+            except argparse.ArgumentTypeError as error:
+                assert str(error).endswith(repr(value))
+            else:
+                raise AssertionError("Invalid framerate accepted")
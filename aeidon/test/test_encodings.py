@@ -17,6 +17,7 @@
 
 import aeidon
 import codecs
+import os
 
 from aeidon.i18n   import _
 from unittest.mock import patch
@@ -41,10 +42,45 @@ class TestModule(aeidon.TestCase):
         assert code_to_name("cp949") == "IBM949"
         assert code_to_name("mac_roman") == "MacRoman"
 
+    def test_decode(self):
+        data = "t\u00e4st".encode("latin_1")
+        text, encoding = aeidon.encodings.decode(data, ("utf_8", "latin_1"))
+        assert text == "t\u00e4st"
+        assert encoding == "latin_1"
+
+    def test_decode__auto(self):
+        data = "t\u00e4st".encode("utf_8")
+        text, encoding = aeidon.encodings.decode(data, ("ascii", "auto"))
+        assert text == "t\u00e4st"
+        assert encoding == "utf_8"
+
+    def test_decode__chunks(self):
+        data = "t\u00e4st".encode("utf_8") * 10
+        text, encoding = aeidon.encodings.decode(data, ("utf_8",), 3)
+        assert text == "t\u00e4st" * 10
+
+    def test_decode__unicode_error(self):
+        data = "t\u00e4st".encode("latin_1")
+        self.assert_raises(UnicodeError,
+                           aeidon.encodings.decode,
+                           data, ("ascii", "utf_8"))
+
     def test_detect(self):
         name = aeidon.encodings.detect(self.new_subrip_file())
         assert aeidon.encodings.is_valid_code(name)
 
+    def test_detect__cache(self):
+        path = self.new_subrip_file()
+        with patch("aeidon.encodings.detect_from_bytes",
+                   return_value="ascii") as detect:
+            aeidon.encodings.detect(path)
+            aeidon.encodings.detect(path)
+            assert detect.call_count == 1
+            open(path, "a").write("\ntest\n")
+            os.utime(path, ns=(0, 0))
+            aeidon.encodings.detect(path)
+            assert detect.call_count == 2
+
     def test_detect_bom__none(self):
         path = self.new_subrip_file()
         encoding = aeidon.encodings.detect_bom(path)
@@ -90,6 +126,27 @@ class TestModule(aeidon.TestCase):
         encoding = aeidon.encodings.detect_bom(path)
         assert encoding == "utf_8_sig"
 
+    @patch("aeidon.encodings.is_valid_code", lambda x: True)
+    def test_detect_bom_from_bytes(self):
+        detect = aeidon.encodings.detect_bom_from_bytes
+        assert detect(codecs.BOM_UTF8 + b"test") == "utf_8_sig"
+        assert detect(codecs.BOM_UTF16_LE + b"test") == "utf_16_le"
+        assert detect(b"test") is None
+
+    def test_detect_from_bytes(self):
+        detect = aeidon.encodings.detect_from_bytes
+        assert detect(b"test") == "ascii"
+        assert detect("t\u00e4st".encode("utf_8")) == "utf_8"
+        assert detect(codecs.BOM_UTF8 + b"test") == "utf_8_sig"
+
+    def test_detect_many(self):
+        paths = [self.new_subrip_file() for i in range(3)]
+        path = aeidon.temp.create()
+        open(path, "w", encoding="utf_8").write("t\u00e4st\n")
+        paths.append(path)
+        codes = aeidon.encodings.detect_many(paths)
+        assert codes == ["ascii", "ascii", "ascii", "utf_8"]
+
     def test_get_locale_code(self):
         code = aeidon.encodings.get_locale_code()
         assert aeidon.encodings.is_valid_code(code)
@@ -17,6 +17,9 @@
 
 import aeidon
 import codecs
+import io
+
+from unittest.mock import patch
 
 
 class PuppetSubtitleFile(aeidon.SubtitleFile):
@@ -32,6 +35,22 @@ class TestSubtitleFile(aeidon.TestCase):
         newline = aeidon.newlines.UNIX
         self.file = PuppetSubtitleFile(path, "ascii", newline)
 
+    def test_get_properties(self):
+        properties = self.file.get_properties()
+        assert properties["header"] == self.file.header
+        assert not "encoding" in properties
+        assert not "path" in properties
+
+    def test_read__newline(self):
+        path = self.new_subrip_file()
+        with open(path, "r") as f:
+            text = f.read()
+        with open(path, "w", newline="\r\n") as f:
+            f.write(text)
+        file = aeidon.files.new(aeidon.formats.SUBRIP, path, "ascii")
+        file.read()
+        assert file.newline == aeidon.newlines.WINDOWS
+
     def test_read__utf_16(self):
         path = self.new_subrip_file()
         with open(path, "r") as f:
@@ -69,3 +88,141 @@ class TestSubtitleFile(aeidon.TestCase):
             f.write(text)
         file = aeidon.files.new(aeidon.formats.SUBRIP, path, "utf_8")
         file.read()
+        assert file.encoding == "utf_8_sig"
+
+
+    def test_set_properties(self):
+        path = self.new_temp_file(aeidon.formats.ASS)
+        file = aeidon.files.load(path, "ascii")
+        file.read()
+        properties = file.get_properties()
+        properties["event_fields"] = list(properties["event_fields"])
+        new = aeidon.files.new(aeidon.formats.ASS, path, "ascii")
+        new.set_properties(properties)
+        assert new.event_fields == file.event_fields
+        assert new.header == file.header
+
+    def test_write__chunks(self):
+        path = self.new_subrip_file()
+        subtitles = aeidon.files.new(aeidon.formats.SUBRIP,
+                                     path,
+                                     "ascii").read()
+
+        with open(path, "rb") as f:
+            orig = f.read()
+        file = aeidon.files.new(aeidon.formats.SUBRIP,
+                                path,
+                                "utf_16",
+                                aeidon.newlines.UNIX)
+
+        with patch("aeidon.file._EncodingBuffer.chunk_size", 10):
+            file.write(subtitles, aeidon.documents.MAIN)
+        with open(path, "rb") as f:
+            text = f.read()
+        assert text.startswith(codecs.BOM_UTF16)
+        assert text.count(codecs.BOM_UTF16) == 1
+        assert str(text, "utf_16").strip() == str(orig, "ascii").strip()
+
+    def test_write__newline(self):
+        path = self.new_subrip_file()
+        file = aeidon.files.new(aeidon.formats.SUBRIP, path, "ascii")
+        subtitles = file.read()
+        file.newline = aeidon.newlines.WINDOWS
+        file.write(subtitles, aeidon.documents.MAIN)
+        with open(path, "rb") as f:
+            text = f.read()
+        assert text.count(b"\r\n") == text.count(b"\n")
+
+    def test_write_to_stream(self):
+        path = self.new_subrip_file()
+        file = aeidon.files.new(aeidon.formats.SUBRIP, path, "ascii")
+        subtitles = file.read()
+        file.encoding = "utf_16_le"
+        file.has_utf_16_bom = True
+        f = io.BytesIO()
+        file.write_to_stream(subtitles, aeidon.documents.MAIN, f)
+        file.write(subtitles, aeidon.documents.MAIN)
+        with open(path, "rb") as g:
+            assert f.getvalue() == g.read()
+        assert f.getvalue().startswith(codecs.BOM_UTF16_LE)
+
+    def test_write_to_stream__text(self):
+        path = self.new_subrip_file()
+        file = aeidon.files.new(aeidon.formats.SUBRIP, path, "ascii")
+        subtitles = file.read()
+        file.newline = aeidon.newlines.WINDOWS
+        f = io.StringIO(newline="")
+        file.write_to_stream(subtitles, aeidon.documents.MAIN, f)
+        text = f.getvalue()
+        assert text.count("\r\n") == text.count("\n")
+        assert text.replace("\r\n", "\n").strip() == (
+            self.get_sample_text(aeidon.formats.SUBRIP))
+
+
+class TestModule(aeidon.TestCase):
+
+    def test_load(self):
+        for format in aeidon.formats:
+            path = self.new_temp_file(format)
+            file = aeidon.files.load(path, "ascii")
+            assert file.format == format
+            assert file.read()
+
+    def test_load__bom(self):
+        path = self.new_subrip_file()
+        with open(path, "r") as f:
+            text = f.read()
+        with open(path, "w", encoding="utf_8_sig") as f:
+            f.write(text)
+        file = aeidon.files.load(path, "ascii")
+        assert file.encoding == "utf_8_sig"
+        assert file.read()
+
+    def test_load__encodings(self):
+        path = self.new_subrip_file()
+        with open(path, "a", encoding="latin_1") as f:
+            f.write("\u00e4\n")
+        file = aeidon.files.load(path, ("ascii", "utf_8", "latin_1"))
+        assert file.encoding == "latin_1"
+        assert file.read()
+
+    def test_load__format_error(self):
+        path = aeidon.temp.create()
+        with open(path, "w") as f:
+            f.write("test\n")
+        self.assert_raises(aeidon.FormatError,
+                           aeidon.files.load,
+                           path, "ascii")
+
+    def test_load_from_bytes(self):
+        path = self.new_subrip_file()
+        with open(path, "rb") as f:
+            data = f.read().replace(b"\n", b"\r\n")
+        file = aeidon.files.load_from_bytes(codecs.BOM_UTF8 + data, "ascii")
+        assert file.path is None
+        assert file.format == aeidon.formats.SUBRIP
+        assert file.read()
+        assert file.encoding == "utf_8_sig"
+        assert file.newline == aeidon.newlines.WINDOWS
+
+    def test_load_from_stream(self):
+        path = self.new_subrip_file()
+        with open(path, "rb") as f:
+            file = aeidon.files.load_from_stream(f, "ascii")
+        assert file.format == aeidon.formats.SUBRIP
+        assert file.read()
+
+    def test_load_from_stream__text(self):
+        text = self.get_sample_text(aeidon.formats.MICRODVD)
+        f = io.StringIO(text.replace("\n", "\r"))
+        file = aeidon.files.load_from_stream(f, "utf_8")
+        assert file.format == aeidon.formats.MICRODVD
+        assert file.read()
+        assert file.encoding == "utf_8"
+        assert file.newline == aeidon.newlines.MAC
+
+    def test_load_from_text(self):
+        text = self.get_sample_text(aeidon.formats.SUBRIP)
+        file = aeidon.files.load_from_text(text, "utf_8")
+        assert file.format == aeidon.formats.SUBRIP
+        assert file.read()
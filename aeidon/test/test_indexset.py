@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2006 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+
+
+class TestIndexSet(aeidon.TestCase):
+
+    def setup_method(self, method):
+        self.indices = aeidon.IndexSet([7, 1, 2, 3, 5, 7, 8])
+
+    def test___contains__(self):
+        for index in range(-1, 10):
+            assert (index in self.indices) == (index in (1, 2, 3, 5, 7, 8))
+
+    def test___eq__(self):
+        assert self.indices == [1, 2, 3, 5, 7, 8]
+        assert self.indices == aeidon.IndexSet((8, 7, 5, 3, 2, 1))
+        assert self.indices != aeidon.IndexSet([1, 2, 3])
+        assert aeidon.IndexSet(range(3)) == range(3)
+
+    def test___getitem__(self):
+        assert self.indices[0] == 1
+        assert self.indices[3] == 5
+        assert self.indices[-1] == 8
+        assert self.indices[1:4] == [2, 3, 5]
+        self.assert_raises(IndexError, lambda: self.indices[6])
+
+    def test___init____range(self):
+        indices = aeidon.IndexSet(range(10**9))
+        assert len(indices) == 10**9
+        assert indices.get_ranges() == [range(10**9)]
+
+    def test___iter__(self):
+        assert list(self.indices) == [1, 2, 3, 5, 7, 8]
+
+    def test___len__(self):
+        assert len(self.indices) == 6
+        assert len(aeidon.IndexSet()) == 0
+
+    def test___reversed__(self):
+        assert list(reversed(self.indices)) == [8, 7, 5, 3, 2, 1]
+
+    def test_from_ranges(self):
+        indices = aeidon.IndexSet.from_ranges(
+            [range(5, 6), range(1, 3), range(2, 4), range(7, 9)])
+        assert indices == self.indices
+        assert indices.get_ranges() == self.indices.get_ranges()
+
+    def test_get_ranges(self):
+        assert self.indices.get_ranges() == [
+            range(1, 4), range(5, 6), range(7, 9)]
+
+    def test_index(self):
+        assert self.indices.index(1) == 0
+        assert self.indices.index(7) == 4
+        self.assert_raises(ValueError, self.indices.index, 4)
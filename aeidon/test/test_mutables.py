@@ -58,6 +58,61 @@ class _TestObservable(aeidon.TestCase):
         assert obs_copy.master is self.obs.master
 
 
+class TestObservableDeque(_TestObservable):
+
+    def edit_obs(self):
+        self.obs.pop()
+
+    def setup_method(self, method):
+        _TestObservable.setup_method(self, method)
+        self.obs = aeidon.ObservableDeque((1, 2, 3), self.master, "")
+
+    def test___delitem__(self):
+        del self.obs[0]
+
+    def test___iadd__(self):
+        self.obs += (4, 5)
+
+    def test___imul__(self):
+        self.obs *= 2
+
+    def test___setitem__(self):
+        self.obs[0] = 2
+
+    def test_append(self):
+        self.obs.append(4)
+
+    def test_appendleft(self):
+        self.obs.appendleft(0)
+
+    def test_clear(self):
+        self.obs.clear()
+
+    def test_extend(self):
+        self.obs.extend((4, 5))
+
+    def test_extendleft(self):
+        self.obs.extendleft((-1, 0))
+
+    def test_insert(self):
+        self.obs.insert(0, 0)
+
+    def test_pop(self):
+        self.obs.pop()
+
+    def test_popleft(self):
+        self.obs.popleft()
+
+    def test_remove(self):
+        self.obs.remove(1)
+
+    def test_reverse(self):
+        self.obs.reverse()
+
+    def test_rotate(self):
+        self.obs.rotate(1)
+
+
 class TestObservableDict(_TestObservable):
 
     def edit_obs(self):
@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2005 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+
+MAIN = aeidon.documents.MAIN
+TRAN = aeidon.documents.TRAN
+
+
+class TestSubtitleStore(aeidon.TestCase):
+
+    def setup_method(self, method):
+        self.subtitles = []
+        for i in range(3):
+            subtitle = aeidon.Subtitle()
+            subtitle.start = float(i)
+            subtitle.end = i + 0.5
+            subtitle.main_text = "main {:d}".format(i)
+            subtitle.tran_text = "tran {:d}".format(i)
+            self.subtitles.append(subtitle)
+        self.store = aeidon.SubtitleStore(self.subtitles)
+
+    def test___delitem__(self):
+        del self.store[1]
+        assert self.store == [self.subtitles[0], self.subtitles[2]]
+
+    def test___delitem____slice(self):
+        del self.store[:2]
+        assert self.store == [self.subtitles[2]]
+
+    def test___eq__(self):
+        assert self.store == self.subtitles
+        assert self.store != self.subtitles[:2]
+
+    def test___getitem__(self):
+        subtitle = self.store[1]
+        assert isinstance(subtitle, aeidon.Subtitle)
+        assert subtitle == self.subtitles[1]
+        assert self.store[-1] == self.subtitles[-1]
+
+    def test___getitem____set(self):
+        self.store[1].main_text = "test"
+        self.store[1].shift_positions(1.0)
+        assert self.store[1].main_text == "test"
+        assert self.store[1].start == "00:00:02.000"
+        assert self.subtitles[1].main_text == "main 1"
+
+    def test___getitem____slice(self):
+        assert self.store[1:] == self.subtitles[1:]
+
+    def test___iter__(self):
+        assert list(self.store) == self.subtitles
+
+    def test___len__(self):
+        assert len(self.store) == 3
+
+    def test___setitem__(self):
+        self.store[0] = self.subtitles[2]
+        assert self.store[0] == self.subtitles[2]
+
+    def test___setitem____extended_slice(self):
+        self.store[::2] = self.subtitles[:2]
+        assert self.store[0] == self.subtitles[0]
+        assert self.store[2] == self.subtitles[1]
+        self.assert_raises(ValueError,
+                           self.store.__setitem__,
+                           slice(None, None, 2),
+                           self.subtitles)
+
+    def test___setitem____slice(self):
+        self.store[1:] = self.store[:1] + self.subtitles
+        assert self.store == self.subtitles[:1] * 2 + self.subtitles
+        self.store[:3] = []
+        assert self.store == self.subtitles[1:]
+
+    def test_clear(self):
+        self.store.clear()
+        assert len(self.store) == 0
+
+    def test_container(self):
+        assert not self.store[0].has_container("ssa")
+        self.store[0].ssa.style = "test"
+        assert self.store[0].has_container("ssa")
+        assert self.store[0].ssa.style == "test"
+        assert self.store.pop(0).ssa.style == "test"
+
+    def test_extend(self):
+        self.store.extend(self.store)
+        assert self.store == self.subtitles + self.subtitles
+
+    def test_get_positions(self):
+        starts, ends = self.store.get_positions()
+        assert starts == [0, 1000, 2000]
+        assert ends == [500, 1500, 2500]
+        starts, ends = self.store.get_positions((2,))
+        assert starts == [2000]
+        assert ends == [2500]
+
+    def test_get_texts(self):
+        assert self.store.get_texts(MAIN) == ["main 0", "main 1", "main 2"]
+        assert self.store.get_texts(TRAN, (0,)) == ["tran 0"]
+
+    def test_insert(self):
+        subtitle = aeidon.Subtitle(aeidon.modes.FRAME)
+        subtitle.start = 10
+        self.store.insert(1, subtitle)
+        assert len(self.store) == 4
+        assert self.store[1] == subtitle
+        assert self.store[1].mode == aeidon.modes.FRAME
+        assert self.store[2] == self.subtitles[1]
+
+    def test_insert__reuse_row(self):
+        self.store.pop(0)
+        self.store.insert(0, self.subtitles[0])
+        assert self.store == self.subtitles
+        assert len(self.store._starts) == 3
+
+    def test_pop(self):
+        subtitle = self.store.pop(1)
+        assert not isinstance(subtitle, aeidon.SubtitleView)
+        assert subtitle == self.subtitles[1]
+        assert self.store == [self.subtitles[0], self.subtitles[2]]
+
+    def test_record(self):
+        record = (aeidon.formats.SUBRIP, "0:0:1,0 --> 0:0:1,5", 0, 0, "")
+        self.subtitles[1]._record = record
+        self.store[1] = self.subtitles[1]
+        assert self.store[1]._record == record
+        assert self.store.pop(1)._record == record
+        assert self.store._records[1] is None
+
+    def test_reverse(self):
+        self.store.reverse()
+        assert self.store == self.subtitles[::-1]
+
+
+class TestProject(aeidon.TestCase):
+
+    def setup_method(self, method):
+        self.project = self.new_project(columnar=True)
+
+    def test_subtitles(self):
+        assert isinstance(self.project.subtitles, aeidon.SubtitleStore)
+        self.project.subtitles = [aeidon.Subtitle()]
+        assert isinstance(self.project.subtitles, aeidon.SubtitleStore)
+        assert len(self.project.subtitles) == 1
+
+    def test_subtitles__notify(self):
+        for columnar in (False, True):
+            project = self.new_project(columnar=columnar)
+            subtitles = [x.copy() for x in project.subtitles]
+            notified = []
+            project.connect("notify::subtitles",
+                            lambda *args: notified.append(args))
+
+            project.subtitles.append(aeidon.Subtitle())
+            project.subtitles[1:3] = subtitles[:1]
+            del project.subtitles[0]
+            project.subtitles.pop()
+            project.subtitles.reverse()
+            assert len(notified) == 5
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2005 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+
+
+class TestModule(aeidon.TestCase):
+
+    def setup_method(self, method):
+        self.path = self.new_subrip_file()
+        self.subtitles = aeidon.files.load(self.path, "ascii").read()
+
+    def test_apply(self):
+        stream = aeidon.stream.open(self.path, "ascii")
+        stream = stream | aeidon.stream.apply(
+            lambda x: setattr(x, "main_text", "test"))
+        assert all(x.main_text == "test" for x in stream)
+
+    def test_convert_framerate(self):
+        stream = aeidon.stream.open(self.path, "ascii")
+        stream = stream | aeidon.stream.convert_framerate(
+            aeidon.framerates.FPS_25_000)
+        for subtitle, orig in zip(stream, self.subtitles):
+            orig.convert_framerate(aeidon.framerates.FPS_25_000)
+            assert subtitle == orig
+
+    def test_convert_markup(self):
+        path = self.new_temp_file(aeidon.formats.SSA)
+        stream = aeidon.stream.open(path, "ascii")
+        stream = stream | aeidon.stream.convert_markup(aeidon.formats.SUBRIP)
+        texts = [x.main_text for x in stream]
+        assert any("<i>" in x for x in texts)
+        assert not any("{\\i1}" in x for x in texts)
+
+    def test_convert_markup__no_file(self):
+        stream = aeidon.stream.Stream(self.subtitles)
+        self.assert_raises(ValueError,
+                           stream.__or__,
+                           aeidon.stream.convert_markup(
+                               aeidon.formats.SUBRIP))
+
+        stream = aeidon.stream.Stream(self.subtitles)
+        stream = stream | aeidon.stream.convert_markup(
+            aeidon.formats.SUBRIP, aeidon.formats.SSA)
+        assert len(list(stream)) == len(self.subtitles)
+
+    def test_open(self):
+        stream = aeidon.stream.open(self.path, "ascii")
+        assert stream.file.format == aeidon.formats.SUBRIP
+        assert list(stream) == self.subtitles
+
+    def test_open__framerate(self):
+        framerate = aeidon.framerates.FPS_25_000
+        stream = aeidon.stream.open(self.path, "ascii", framerate)
+        assert all(x.framerate == framerate for x in stream)
+
+    def test_scale(self):
+        stream = aeidon.stream.open(self.path, "ascii")
+        stream = stream | aeidon.stream.scale(2.0)
+        for subtitle, orig in zip(stream, self.subtitles):
+            assert subtitle.start_seconds == 2 * orig.start_seconds
+
+    def test_shift(self):
+        stream = aeidon.stream.open(self.path, "ascii")
+        stream = stream | aeidon.stream.shift(1.0)
+        for subtitle, orig in zip(stream, self.subtitles):
+            orig.shift_positions(1.0)
+            assert subtitle.start == orig.start
+            assert subtitle.end == orig.end
+
+    def test_write(self):
+        path = aeidon.temp.create(".sub")
+        stream = aeidon.stream.open(self.path, "ascii")
+        stream = stream | aeidon.stream.shift(1.0)
+        file = stream | aeidon.stream.write(path, aeidon.formats.MICRODVD)
+        assert file.format == aeidon.formats.MICRODVD
+        subtitles = aeidon.files.load(path, "ascii").read()
+        assert len(subtitles) == len(self.subtitles)
+
+    def test_write__same_format(self):
+        path = aeidon.temp.create(".srt")
+        stream = aeidon.stream.open(self.path, "ascii")
+        stream | aeidon.stream.write(path)
+        text = open(path).read().strip()
+        assert text == open(self.path).read().strip()
+
+    def test_write__no_file(self):
+        path = aeidon.temp.create(".srt")
+        stream = aeidon.stream.Stream(self.subtitles)
+        file = stream | aeidon.stream.write(
+            path, aeidon.formats.SUBRIP, "utf_8")
+        assert file.encoding == "utf_8"
+        subtitles = aeidon.files.load(path, "utf_8").read()
+        assert subtitles == self.subtitles
+
+    def test_write__no_file_format(self):
+        path = aeidon.temp.create(".srt")
+        stream = aeidon.stream.Stream(self.subtitles)
+        self.assert_raises(ValueError,
+                           stream.__or__,
+                           aeidon.stream.write(path))
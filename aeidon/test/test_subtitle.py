@@ -42,6 +42,22 @@ class TestSubtitle(aeidon.TestCase):
         self.fsub.main_text = "main"
         self.fsub.tran_text = "translation"
 
+    def test___getattr__(self):
+        assert not self.tsub.has_container("ssa")
+        assert self.tsub.ssa.style == "Default"
+        assert self.tsub.has_container("ssa")
+
+    def test___getattr____invalid(self):
+        self.assert_raises(AttributeError, getattr, self.tsub, "foo")
+
+    def test___slots__(self):
+        assert not hasattr(self.tsub, "__dict__")
+
+    def test_calc(self):
+        assert self.tsub.calc is self.fsub.calc
+        self.tsub.framerate = aeidon.framerates.FPS_23_976
+        assert self.tsub.calc is not self.fsub.calc
+
     def test_convert_framerate__frame(self):
         self.fsub.start = 100
         self.fsub.end = 200
@@ -60,6 +76,14 @@ class TestSubtitle(aeidon.TestCase):
         assert self.tsub.start == "00:00:01.043"
         assert self.tsub.end == "00:00:02.085"
 
+    def test_copy(self):
+        self.tsub.ssa.style = "Custom"
+        subtitle = self.tsub.copy()
+        assert subtitle == self.tsub
+        assert subtitle.ssa.style == "Custom"
+        assert subtitle.ssa is not self.tsub.ssa
+        assert not subtitle.has_container("subrip")
+
     def test_duration__get(self):
         assert self.tsub.duration == "00:00:02.000"
         assert self.fsub.duration == 200
@@ -178,6 +202,11 @@ class TestSubtitle(aeidon.TestCase):
         assert self.tsub.get_text(MAIN) == "main"
         assert self.tsub.get_text(TRAN) == "translation"
 
+    def test_has_container(self):
+        assert not self.tsub.has_container("subrip")
+        self.tsub.subrip.x1 = 1
+        assert self.tsub.has_container("subrip")
+
     def test_main_text__get(self):
         assert self.tsub.main_text == "main"
         assert self.fsub.main_text == "main"
@@ -193,8 +222,13 @@ class TestSubtitle(aeidon.TestCase):
     def test_mode__set_frame(self):
         self.fsub.mode = FRAME
         self.fsub.mode = TIME
-        assert self.fsub._start == "00:00:04.000"
-        assert self.fsub._end == "00:00:12.000"
+        assert self.fsub.start == "00:00:04.000"
+        assert self.fsub.end == "00:00:12.000"
+
+    def test_mode__set_frame__milliseconds(self):
+        self.fsub.mode = TIME
+        assert self.fsub._start == 4000
+        assert self.fsub._end == 12000
 
     def test_mode__set_time(self):
         self.tsub.mode = TIME
@@ -225,13 +259,13 @@ class TestSubtitle(aeidon.TestCase):
 
     def test_shift_positions__seconds(self):
         self.tsub.shift_positions(1.0)
-        assert self.tsub._start == "00:00:02.000"
-        assert self.tsub._end == "00:00:04.000"
+        assert self.tsub.start == "00:00:02.000"
+        assert self.tsub.end == "00:00:04.000"
 
     def test_shift_positions__time(self):
         self.tsub.shift_positions("00:00:01.000")
-        assert self.tsub._start == "00:00:02.000"
-        assert self.tsub._end == "00:00:04.000"
+        assert self.tsub.start == "00:00:02.000"
+        assert self.tsub.end == "00:00:04.000"
 
     def test_start__get(self):
         assert self.tsub.start == "00:00:01.000"
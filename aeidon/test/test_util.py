@@ -16,6 +16,9 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 import aeidon
+import array
+
+from unittest.mock import patch
 
 
 class TestModule(aeidon.TestCase):
@@ -46,6 +49,36 @@ class TestModule(aeidon.TestCase):
             path = self.new_temp_file(format)
             assert aeidon.util.detect_format(path, "ascii") == format
 
+    def test_detect_format__size(self):
+        path = self.new_subrip_file()
+        text = open(path, "r").read()
+        open(path, "w").write("\n" * 100 + text)
+        assert aeidon.util.detect_format(path, "ascii", 200)
+        self.assert_raises(aeidon.FormatError,
+                           aeidon.util.detect_format,
+                           path, "ascii", 50)
+
+    def test_detect_format_from_lines(self):
+        for format in aeidon.formats:
+            path = self.new_temp_file(format)
+            lines = open(path, "r").readlines()
+            assert aeidon.util.detect_format_from_lines(lines) == format
+        assert aeidon.util.detect_format_from_lines(["test"]) is None
+
+    def test_detect_format_from_lines__breaks(self):
+        with patch.object(aeidon.util, "detect_format_from_text") as detect:
+            aeidon.util.detect_format_from_lines(["1\n", "2\n"])
+            detect.assert_called_once_with("1\n2\n")
+
+    def test_detect_format_from_text(self):
+        for format in aeidon.formats:
+            path = self.new_temp_file(format)
+            text = open(path, "r", newline="").read()
+            assert aeidon.util.detect_format_from_text(text) == format
+            text = text.replace("\n", "\r")
+            assert aeidon.util.detect_format_from_text(text) == format
+        assert aeidon.util.detect_format_from_text("test") is None
+
     def test_detect_newlines__mac(self):
         path = aeidon.temp.create()
         open(path, "w", newline="").write("a\rb\rc\r")
@@ -64,6 +97,14 @@ class TestModule(aeidon.TestCase):
         newlines = aeidon.util.detect_newlines(path)
         assert newlines == aeidon.newlines.WINDOWS
 
+    def test_detect_newlines_from_text(self):
+        detect = aeidon.util.detect_newlines_from_text
+        assert detect("a\rb\rc\r") == aeidon.newlines.MAC
+        assert detect("a\nb\nc\n") == aeidon.newlines.UNIX
+        assert detect("a\r\nb\r\nc\r\n") == aeidon.newlines.WINDOWS
+        assert detect("a\r\nb\nc\n") == aeidon.newlines.WINDOWS
+        assert detect("a") is None
+
     def test_flatten(self):
         lst = [1, 2, [3, 4, [5, 6, [7]], 8], 9]
         lst = aeidon.util.flatten(lst)
@@ -82,7 +123,7 @@ class TestModule(aeidon.TestCase):
     def test_get_ranges(self):
         lst = [0, 0, 4, 5, 3, 7, 8, 2, 7]
         lst = aeidon.util.get_ranges(lst)
-        assert lst == [[0], [2, 3, 4, 5], [7, 8]]
+        assert lst == [range(0, 1), range(2, 6), range(7, 9)]
 
     def test_get_unique__first(self):
         lst = [4, 1, 5, 5, 1, 1, 3, 6, 4, 4]
@@ -94,6 +135,23 @@ class TestModule(aeidon.TestCase):
         lst = aeidon.util.get_unique(lst, keep_last=True)
         assert lst == [5, 1, 3, 6, 4]
 
+    def test_pack_indices(self):
+        assert aeidon.util.pack_indices([3, 4, 5]) == range(3, 6)
+        assert aeidon.util.pack_indices([]) == range(0)
+        indices = aeidon.util.pack_indices([1, 3, 2])
+        assert isinstance(indices, array.array)
+        assert list(indices) == [1, 3, 2]
+
+    def test_rank_formats(self):
+        text = "\n".join(("{1}{2}a", "{3}{4}b", "00:00:01.00,00:00:02.00"))
+        ranks = aeidon.util.rank_formats(text)
+        assert ranks[0][0] == aeidon.formats.MICRODVD
+        assert ranks[1][0] == aeidon.formats.SUBVIEWER2
+        assert abs(ranks[0][1] - 2/3) < 0.001
+
+    def test_rank_formats__none(self):
+        assert aeidon.util.rank_formats("test") == []
+
     def test_read__basic(self):
         path = self.new_subrip_file()
         text = open(path, "r", encoding="ascii").read().strip()
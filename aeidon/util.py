@@ -18,6 +18,7 @@
 """Miscellaneous functions."""
 
 import aeidon
+import array
 import collections
 import contextlib
 import inspect
@@ -136,24 +137,46 @@ def connect(observer, observable, signal, *args):
         observable = getattr(observer, observable)
     return observable.connect(signal, method, *args)
 
-def detect_format(path, encoding):
+def detect_format(path, encoding, size=65536):
     """
     Detect and return format of subtitle file at `path`.
 
+    Only the first `size` characters of the file are read.
     Raise :exc:`IOError` if reading fails.
     Raise :exc:`UnicodeError` if decoding fails.
     Raise :exc:`aeidon.FormatError` if unable to detect format.
     Return an :attr:`aeidon.formats` enumeration item.
     """
-    re_ids = [(x, re.compile(x.identifier)) for x in aeidon.formats]
     with open(path, "r", encoding=encoding) as f:
-        for line in f:
-            for format, re_id in re_ids:
-                if re_id.search(line) is not None:
-                    return format
+        text = f.read(size)
+    format = detect_format_from_text(text, size)
+    if format is not None: return format
     raise aeidon.FormatError("Failed to detect format of file {}"
                              .format(repr(path)))
 
+def detect_format_from_lines(lines, size=65536):
+    """
+    Detect and return format of `lines` or ``None``.
+
+    `lines` should keep their line breaks, e.g. as returned by
+    ``readlines``. Only about the first `size` characters are examined.
+    """
+    sample = []
+    for line in lines:
+        sample.append(line)
+        size -= len(line)
+        if size <= 0: break
+    return detect_format_from_text("".join(sample))
+
+def detect_format_from_text(text, size=65536):
+    """
+    Detect and return format of `text` or ``None``.
+
+    Only the first `size` characters of `text` are examined.
+    """
+    ranks = rank_formats(text[:size])
+    return ranks[0][0] if ranks else None
+
 def detect_newlines(path):
     """Detect and return the newline type of file at `path` or ``None``."""
     try:
@@ -177,6 +200,20 @@ def detect_newlines(path):
         return aeidon.newlines.WINDOWS
     return None
 
+def detect_newlines_from_text(text):
+    """Detect and return the newline type of `text` or ``None``."""
+    windows = text.count("\r\n")
+    mac = text.count("\r") - windows
+    unix = text.count("\n") - windows
+    if not (windows or mac or unix):
+        return None
+    if mac and not (windows or unix):
+        return aeidon.newlines.MAC
+    if unix and not (windows or mac):
+        return aeidon.newlines.UNIX
+    # Treat mixtures as Windows newlines, like detect_newlines.
+    return aeidon.newlines.WINDOWS
+
 @aeidon.deco.once
 def enchant_available():
     """Return ``True`` if :mod:`enchant` module is available."""
@@ -248,22 +285,28 @@ def get_encoding_alias(encoding):
         return aliases[encoding]
     return encoding
 
+@aeidon.deco.once
+def _get_format_identifier():
+    """Return a regular expression matching identifiers of all formats."""
+    # Join all identifiers into a single alternation of named groups to
+    # find matches of all formats in a single pass over the text. All
+    # identifiers match at line start, which as a common prefix allows
+    # quickly skipping all other positions.
+    return re.compile("^(?:{})".format("|".join(
+        "(?P<{}>{})".format(x.name, x.identifier)
+        for x in aeidon.formats)), re.MULTILINE)
+
 def get_ranges(lst):
     """
     Return a list of ranges in list of integers.
 
+    `lst` can also be an :class:`aeidon.IndexSet`, whose ranges are returned
+    without iterating over its items.
+
     >>> aeidon.util.get_ranges([1, 2, 3, 5, 6, 7, 9, 11, 12])
-    [[1, 2, 3], [5, 6, 7], [9], [11, 12]]
+    [range(1, 4), range(5, 8), range(9, 10), range(11, 13)]
     """
-    if not lst: return []
-    lst = sorted(get_unique(lst))
-    ranges = [[lst.pop(0)]]
-    for item in lst:
-        if item == ranges[-1][-1] + 1:
-            ranges[-1].append(item)
-        else:
-            ranges.append([item])
-    return ranges
+    return aeidon.IndexSet(lst).get_ranges()
 
 def get_template_header(format):
     """
@@ -320,11 +363,41 @@ def makedirs(directory):
               file=sys.stderr)
         raise # OSError
 
+@aeidon.deco.once
+def numpy_available():
+    """Return ``True`` if :mod:`numpy` module is available."""
+    try:
+        import numpy
+        return True
+    except Exception:
+        return False
+
 def normalize_newlines(text):
     """Convert all newlines in `text` to "\\n"."""
     re_newline_char = re.compile(r"\r\n?")
     return re_newline_char.sub("\n", text)
 
+def pack_indices(indices):
+    """
+    Return `indices` as a compact sequence.
+
+    Consecutive ascending indices are returned as a :class:`range` and others
+    as a packed :class:`array.array` of integers.
+
+    >>> aeidon.util.pack_indices([3, 4, 5])
+    range(3, 6)
+    """
+    if isinstance(indices, range): return indices
+    if isinstance(indices, aeidon.IndexSet):
+        ranges = indices.get_ranges()
+        if len(ranges) < 2:
+            return ranges[0] if ranges else range(0)
+    indices = list(indices)
+    first = indices[0] if indices else 0
+    rindices = range(first, first + len(indices))
+    if indices == list(rindices): return rindices
+    return array.array("q", indices)
+
 def path_to_uri(path):
     """Convert local filepath to URI."""
     if sys.platform == "win32":
@@ -357,6 +430,26 @@ def print_write_unicode(exc_info, path, encoding):
           .format(path, encoding),
           file=sys.stderr)
 
+def rank_formats(text, limit=32):
+    """
+    Return a list of tuples of formats matching `text` and confidences.
+
+    Confidence is the fraction of lines identifying as the format out of all
+    lines identifying as any format, a value between zero and one. Scanning
+    `text` stops once `limit` lines have identified as the same format.
+    The list is sorted by confidence, highest first, and is empty if no
+    format matches. Ties are resolved in the order of :attr:`aeidon.formats`.
+    """
+    counts = collections.Counter()
+    text = normalize_newlines(text)
+    for match in _get_format_identifier().finditer(text):
+        counts[match.lastgroup] += 1
+        if counts[match.lastgroup] >= limit: break
+    total = sum(counts.values())
+    ranks = [(x, counts[x.name] / total)
+             for x in aeidon.formats if counts[x.name] > 0]
+    return sorted(ranks, key=lambda x: -x[1])
+
 def read(path, encoding=None, fallback="utf_8", quiet=False):
     """
     Read file at `path` and return text.
@@ -245,14 +245,15 @@ class OpenAgent(aeidon.Delegate):
         basename = os.path.basename(path)
         page = (gaupol.Page() if doc == aeidon.documents.MAIN
                 else self.get_current_page())
-        for encoding in encodings:
-            with aeidon.util.silent(UnicodeError):
-                n = self._try_open_file(page, doc, path, encoding)
-                self._check_sort_count(path, n)
-                return page
-        # Report if all codecs failed to decode file.
-        self._show_encoding_error_dialog(basename)
-        raise gaupol.Default
+        try:
+            # The file is read once and all encodings are tried in memory.
+            n = self._try_open_file(page, doc, path, encodings)
+        except UnicodeError:
+            # Report if all codecs failed to decode file.
+            self._show_encoding_error_dialog(basename)
+            raise gaupol.Default
+        self._check_sort_count(path, n)
+        return page
 
     @aeidon.deco.export
     @aeidon.deco.silent(gaupol.Default)
@@ -338,7 +339,9 @@ class OpenAgent(aeidon.Delegate):
     def _show_parse_error_dialog(self, basename, format):
         """Show an error dialog after failing to parse file."""
         title = _('Failed to parse file "{}"').format(basename)
-        message = _("Please check that the file you are trying to open is a valid {} file.").format(format.label)
+        message = _("Please check that the file you are trying to open is a valid subtitle file.")
+        if format is not None:
+            message = _("Please check that the file you are trying to open is a valid {} file.").format(format.label)
         dialog = gaupol.ErrorDialog(self.window, title, message)
         dialog.add_button(_("_OK"), Gtk.ResponseType.OK)
         dialog.set_default_response(Gtk.ResponseType.OK)
@@ -381,23 +384,17 @@ class OpenAgent(aeidon.Delegate):
             return self.save_translation(page)
         gaupol.util.raise_default(response != Gtk.ResponseType.NO)
 
-    def _try_open_file(self, page, doc, path, encoding, **kwargs):
+    def _try_open_file(self, page, doc, path, encodings, **kwargs):
         """Try to open file at `path` and return subtitle sort count."""
-        if encoding == "auto":
-            encoding = aeidon.encodings.detect(path)
-            if encoding is None: raise UnicodeError
         kwargs["align_method"] = gaupol.conf.file.align_method
         basename = os.path.basename(path)
         try:
-            return page.project.open(doc, path, encoding, **kwargs)
+            return page.project.open(doc, path, encodings, **kwargs)
         except aeidon.FormatError:
             self._show_format_error_dialog(basename)
         except IOError as error:
             self._show_io_error_dialog(basename, str(error))
-        except aeidon.ParseError:
-            bom_encoding = aeidon.encodings.detect_bom(path)
-            encoding = bom_encoding or encoding
-            with aeidon.util.silent(Exception):
-                format = aeidon.util.detect_format(path, encoding)
-            self._show_parse_error_dialog(basename, format)
+        except aeidon.ParseError as error:
+            # Format was detected already before parsing failed.
+            self._show_parse_error_dialog(basename, error.format)
         raise gaupol.Default
@@ -1070,19 +1070,17 @@ class TextAssistant(Gtk.Assistant):
         field = self._introduction_page.get_field()
         doc = gaupol.util.text_field_to_document(field)
         description = _("Correcting texts")
-        register = aeidon.registers.DO
         for page in changed_pages:
             indices = [x[1] for x in changes if x[0] is page]
             texts = [x[3] for x in changes if x[0] is page]
-            if indices and texts:
-                page.project.replace_texts(indices, doc, texts)
-                page.project.set_action_description(register, description)
-                edits += len(indices)
-            indices = [x for i, x in enumerate(indices) if not texts[i]]
-            if indices and gaupol.conf.text_assistant.remove_blank:
-                page.project.remove_subtitles(indices)
-                page.project.group_actions(register, 2, description)
-                removals += len(indices)
+            with page.project.batch(description):
+                if indices and texts:
+                    page.project.replace_texts(indices, doc, texts)
+                    edits += len(indices)
+                indices = [x for i, x in enumerate(indices) if not texts[i]]
+                if indices and gaupol.conf.text_assistant.remove_blank:
+                    page.project.remove_subtitles(indices)
+                    removals += len(indices)
             page.view.columns_autosize()
         edits = edits - removals
         message = _("Edited {edits:d} and removed {removals:d} subtitles")
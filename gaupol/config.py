@@ -106,6 +106,7 @@ CONFIG_DEFAULTS = {
         "encoding": "utf_8",
         "format": aeidon.formats.SUBRIP,
         "newline": aeidon.util.get_default_newline(),
+        "use_cache": False,
     },
     "framerate_convert": {
         "target": gaupol.targets.CURRENT,
@@ -148,6 +148,8 @@ class Page(aeidon.Observable):
         """Initialize :class:`aeidon.Project` with proper properties."""
         framerate = gaupol.conf.editor.framerate
         self.project = aeidon.Project(framerate)
+        if gaupol.conf.file.use_cache:
+            self.project.cache = aeidon.FileCache()
 
     def _init_signal_handlers(self):
         """Initialize signal handlers."""
@@ -238,7 +240,7 @@ class Page(aeidon.Observable):
         if not rows: return
         mode = self.edit_mode
         store = self.view.get_model()
-        for row in sorted(rows):
+        for row in aeidon.IndexSet(rows):
             subtitle = self.project.subtitles[row]
             store.insert(row)
             store[row][0] = row + 1
@@ -263,7 +265,7 @@ class Page(aeidon.Observable):
             # of rows, because a large batch of separate live updates
             # directly made to the view are slow.
             self.view.set_model(None)
-        for row in reversed(sorted(rows)):
+        for row in reversed(aeidon.IndexSet(rows)):
             path = gaupol.util.tree_row_to_path(row)
             store.remove(store.get_iter(path))
         if len(rows) > 50:
@@ -319,17 +321,25 @@ class Page(aeidon.Observable):
         self.view.set_model(None)
         store.clear()
         mode = self.edit_mode
-        for i, subtitle in enumerate(self.project.subtitles):
-            store.insert(i)
-            store[i][0] = i + 1
-            store[i][1] = subtitle.get_start(mode)
-            store[i][2] = subtitle.get_end(mode)
-            if mode == aeidon.modes.TIME:
-                store[i][3] = subtitle.duration_seconds
-            if mode == aeidon.modes.FRAME:
-                store[i][3] = subtitle.duration_frame
-            store[i][4] = subtitle.main_text
-            store[i][5] = subtitle.tran_text
+        calc = self.project.calc
+        subtitles = self.project.subtitles
+        # Convert entire columns at once and append complete rows
+        # to avoid a separate store call for each cell.
+        if mode == aeidon.modes.TIME:
+            starts = [x.start_seconds for x in subtitles]
+            ends = [x.end_seconds for x in subtitles]
+            durations = [y - x for x, y in zip(starts, ends)]
+            starts = calc.seconds_to_times(starts)
+            ends = calc.seconds_to_times(ends)
+        if mode == aeidon.modes.FRAME:
+            starts = [x.start_frame for x in subtitles]
+            ends = [x.end_frame for x in subtitles]
+            durations = [y - x for x, y in zip(starts, ends)]
+        main_texts = [x.main_text for x in subtitles]
+        tran_texts = [x.tran_text for x in subtitles]
+        rows = zip(starts, ends, durations, main_texts, tran_texts)
+        for i, row in enumerate(rows):
+            store.append((i + 1,) + row)
         self.view.set_model(store)
 
     def text_column_to_document(self, col):
@@ -168,6 +168,8 @@ class Distribution(distribution):
 
     def __find_scripts(self, name):
         """Find scripts to install for name."""
+        if name == "aeidon":
+            self.scripts.append("bin/aeidon")
         if name == "gaupol":
             self.scripts.append("bin/gaupol")
 
@@ -180,6 +182,7 @@ class Distribution(distribution):
         if self.with_aeidon:
             self.__find_data_files("aeidon")
             self.__find_packages("aeidon")
+            self.__find_scripts("aeidon")
         if self.with_aeidon and self.with_iso_codes:
             self.__find_data_files("iso-codes")
         if self.with_gaupol: